@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample script for measuring how the scripts scale with the size of
+the fleet. Every entry point is run against 10, 100 and 1000 simulated
+devices (netops.standin, or netops.netconf_server with --transport ssh)
+with a configurable RPC latency, each case in a process of its own so that
+the peak memory use of one case does not hide another's. The results are appended to a JSON file and compared with the
+previous run, so regressions show up between versions.
+
+Usage:
+    python fleet_benchmark.py
+    python fleet_benchmark.py --devices 10 100 --latency 0.05 --cases view_interface_ipv6
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import argparse
+import importlib.util
+import ipaddress
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_FILE = "benchmark_results.json"
+CREDENTIALS = ("developer", "C1sco12345")
+
+# The netops package and the dayn helper modules are imported from dayn
+sys.path.insert(0, str(ROOT / "dayn"))
+
+
+def load_script(name:str, path:Path):
+    '''
+    Import a script by path. The day folders have scripts with the same file
+    name, so each one gets a unique module name.
+    '''
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class CpuTimer:
+    '''
+    Adds up the CPU time spent inside the wrapped parse and render
+    functions, across all worker threads.
+    '''
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.seconds = 0.0
+
+    def wrap(self, function):
+        def timed(*args, **kwargs):
+            started = time.thread_time()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - started
+                with self.lock:
+                    self.seconds += elapsed
+        return timed
+
+
+def sot_interfaces(index:int, interfaces:int)->list:
+    '''
+    SoT interface entries for simulated device number index, in the same
+    format as dayn/sot.yaml.
+    '''
+    entries = []
+    for number in range(2, interfaces + 1):
+        prefix = ipaddress.IPv6Network((0x20010DB8 << 96 | index << 80 | number << 64, 64))
+        entries.append({
+            "type": "GigabitEthernet",
+            "number": str(number),
+            "description": f"Link {number} of device {index}",
+            "ospfv3": {"process_id": "1", "process_area": "0"},
+            "ipv6_address": [f"{prefix.network_address + 1}/64"],
+            "nd_prefix": str(prefix),
+        })
+    return entries
+
+
+def _fleet_case(args, timer, function, *function_args, **function_kwargs):
+    from netops.fleet import run_on_fleet
+    from netops.sessions import POOL
+    from netops.standin import StandInFleet
+
+    fleet = StandInFleet(args.run_devices, latency=args.latency, jitter=args.jitter,
+                         interfaces=args.interfaces, oper_padding=args.oper_padding)
+    POOL.max_sessions = max(POOL.max_sessions, args.workers)
+    simulator = None
+    if args.transport == "ssh":
+        # Real NETCONF-over-SSH sessions through ncclient, served in this process
+        from netops.netconf_server import NetconfSimulator, raise_file_limit
+        raise_file_limit()
+        simulator = NetconfSimulator(fleet, base_port=args.base_port).start()
+        POOL.connect = simulator.connect
+    else:
+        POOL.connect = fleet.connect
+
+    try:
+        started = time.perf_counter()
+        results = run_on_fleet(function, fleet.hosts, *function_args, max_workers=args.workers,
+                               verbose=False, **function_kwargs)
+        wall = time.perf_counter() - started
+    finally:
+        POOL.close()
+        if simulator is not None:
+            simulator.stop()
+    failed = sum(1 for result in results if not result.ok or result.result == 1)
+    return wall, failed
+
+
+def case_enable_ipv6(args, timer):
+    script = load_script("day0_enable_ipv6", ROOT / "day0" / "enable_ipv6.py")
+    return _fleet_case(args, timer, script.enable_ipv6, *CREDENTIALS)
+
+
+def case_view_ipv6(args, timer):
+    import xmltodict
+    xmltodict.parse = timer.wrap(xmltodict.parse)
+    script = load_script("day0_view_ipv6", ROOT / "day0" / "view_ipv6.py")
+    return _fleet_case(args, timer, script.view_ipv6, *CREDENTIALS)
+
+
+def _view_interface_ipv6(args, timer, pipelined:bool):
+    import xmltodict
+    xmltodict.parse = timer.wrap(xmltodict.parse)
+    script = load_script("dayn_view_interfaces", ROOT / "dayn" / "view_interfaces.py")
+    script.parse_interfaces_oper = timer.wrap(script.parse_interfaces_oper)
+    return _fleet_case(args, timer, script.view_interface_ipv6, *CREDENTIALS, pipelined=pipelined)
+
+
+def case_view_interface_ipv6(args, timer):
+    return _view_interface_ipv6(args, timer, pipelined=True)
+
+
+def case_view_interface_ipv6_sequential(args, timer):
+    # The same view with the config and oper gets sent one after the other,
+    # as the baseline for the pipelining saving
+    return _view_interface_ipv6(args, timer, pipelined=False)
+
+
+def case_configure_ipv6_on_intf(args, timer):
+    import netops.delta
+    netops.delta.config_delta = timer.wrap(netops.delta.config_delta)
+    script = load_script("dayn_configure_intf", ROOT / "dayn" / "configure_intf.py")
+    script.TEMPLATES.cache_dir = args.cache_dir
+    script.TEMPLATES.render = timer.wrap(script.TEMPLATES.render)
+
+    hosts = {str(ipaddress.IPv4Address("10.0.0.1") + index): index
+             for index in range(args.run_devices)}
+
+    def configure(host):
+        payload = script.render_template(sot_interfaces(hosts[host], args.interfaces),
+                                         "interface_template.j2")
+        script.configure_ipv6_on_intf(host, *CREDENTIALS, payload, diff=True)
+
+    return _fleet_case(args, timer, configure)
+
+
+def case_render_template(args, timer):
+    script = load_script("dayn_configure_intf", ROOT / "dayn" / "configure_intf.py")
+    script.TEMPLATES.cache_dir = args.cache_dir
+    script.TEMPLATES.render = timer.wrap(script.TEMPLATES.render)
+    devices = [sot_interfaces(index, args.interfaces) for index in range(args.run_devices)]
+
+    started = time.perf_counter()
+    for interfaces in devices:
+        script.render_template(interfaces, "interface_template.j2")
+    return time.perf_counter() - started, 0
+
+
+def _sot(args)->dict:
+    return {f"R{index}": {"interfaces": sot_interfaces(index, args.interfaces)}
+            for index in range(args.run_devices)}
+
+
+def case_validate_per_address(args, timer):
+    # The same checks the per-interface testcase of test_address.py runs
+    try:
+        import test_address
+    except ImportError:
+        return None, 0
+    config = _sot(args)
+    started = time.perf_counter()
+    failed = 0
+    for values in config.values():
+        for interface in values["interfaces"]:
+            for address in interface["ipv6_address"]:
+                if test_address.address_error(address) or \
+                        test_address.subnet_error(address, interface["nd_prefix"]):
+                    failed += 1
+    return time.perf_counter() - started, failed
+
+
+def case_validate_bulk(args, timer):
+    import ipv6_bulk
+    if not ipv6_bulk.available():
+        return None, 0
+    config = _sot(args)
+    started = time.perf_counter()
+    result = ipv6_bulk.validate_sot(config)
+    return time.perf_counter() - started, sum(1 for _ in result.failures())
+
+
+CASES = {
+    "enable_ipv6": case_enable_ipv6,
+    "view_ipv6": case_view_ipv6,
+    "view_interface_ipv6": case_view_interface_ipv6,
+    "view_interface_ipv6_sequential": case_view_interface_ipv6_sequential,
+    "configure_ipv6_on_intf": case_configure_ipv6_on_intf,
+    "render_template": case_render_template,
+    "validate_per_address": case_validate_per_address,
+    "validate_bulk": case_validate_bulk,
+}
+
+
+def run_case(args):
+    '''
+    Run one case in this process and print its numbers as JSON.
+    '''
+    # Template bytecode goes to a directory of its own that is removed after
+    # the case, so that the benchmark leaves nothing behind in dayn
+    with tempfile.TemporaryDirectory() as cache_dir:
+        args.cache_dir = cache_dir
+        timer = CpuTimer()
+        cpu_started = time.process_time()
+        wall, failed = CASES[args.run_case](args, timer)
+        cpu = time.process_time() - cpu_started
+    print(json.dumps({
+        "case": args.run_case,
+        "devices": args.run_devices,
+        "skipped": wall is None,
+        "wall_s": wall,
+        "per_device_ms": None if wall is None else wall / args.run_devices * 1000,
+        "failed": failed,
+        "cpu_s": cpu,
+        "parse_render_cpu_s": timer.seconds,
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                       / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    }))
+
+
+def git_version()->str:
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def previous_results(history:list, settings:dict)->dict:
+    '''
+    Results of the latest earlier run with the same settings, keyed by
+    (case, devices).
+    '''
+    for run in reversed(history):
+        if run.get("settings") == settings:
+            return {(result["case"], result["devices"]): result for result in run["results"]}
+    return {}
+
+
+def pipelining_savings(results:list):
+    '''
+    Print the wall time pipelining saved for every fleet size that was run
+    both pipelined and sequentially.
+    '''
+    wall = {(result["case"], result["devices"]): result["wall_s"] for result in results
+            if not result["skipped"]}
+    for (case, devices), pipelined in sorted(wall.items(), key=lambda item: item[0][1]):
+        sequential = wall.get(("view_interface_ipv6_sequential", devices))
+        if case != "view_interface_ipv6" or not sequential:
+            continue
+        saved = sequential - pipelined
+        print(f"Pipelining saved {saved:.3f}s ({saved / sequential * 100:.0f}%) of "
+              f"view_interface_ipv6 at {devices} devices")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("------------")[0],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--latency", type=float, default=0.02, help="RPC latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency in seconds")
+    parser.add_argument("--interfaces", type=int, default=8, help="interfaces per device")
+    parser.add_argument("--oper-padding", type=int, default=0,
+                        help="extra bytes of oper data per interface")
+    parser.add_argument("--workers", type=int, default=10, help="devices handled at the same time")
+    parser.add_argument("--transport", choices=("standin", "ssh"), default="standin",
+                        help="in-process stand-in sessions or NETCONF over SSH to netops.netconf_server")
+    parser.add_argument("--base-port", type=int, default=20830, help="first port for --transport ssh")
+    parser.add_argument("--output", default=str(Path(__file__).resolve().parent / RESULTS_FILE))
+    parser.add_argument("--label", default=None, help="name of this run, default git describe")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--run-devices", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        run_case(args)
+        return
+
+    settings = {"latency": args.latency, "jitter": args.jitter, "interfaces": args.interfaces,
+                "oper_padding": args.oper_padding, "workers": args.workers,
+                "transport": args.transport}
+    try:
+        with open(args.output, encoding="utf-8") as results_file:
+            history = json.load(results_file)
+    except (OSError, ValueError):
+        history = []
+    previous = previous_results(history, settings)
+
+    print(f"Settings: {settings}")
+    print(f"{'case':30} {'devices':>7} {'wall s':>9} {'ms/dev':>9} {'cpu s':>8} "
+          f"{'parse/render':>12} {'peak MB':>8} {'failed':>6}  change")
+    results = []
+    for case in args.cases:
+        for devices in args.devices:
+            command = [sys.executable, __file__, "--run-case", case, "--run-devices", str(devices),
+                       "--latency", str(args.latency), "--jitter", str(args.jitter),
+                       "--interfaces", str(args.interfaces), "--oper-padding",
+                       str(args.oper_padding), "--workers", str(args.workers),
+                       "--transport", args.transport, "--base-port", str(args.base_port)]
+            completed = subprocess.run(command, capture_output=True, text=True, check=False)
+            if completed.returncode != 0:
+                print(f"{case:30} {devices:>7} failed!\n{completed.stderr}")
+                continue
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            results.append(result)
+            if result["skipped"]:
+                print(f"{case:30} {devices:>7} skipped (missing optional dependency)")
+                continue
+
+            change = ""
+            before = previous.get((case, devices))
+            if before and before.get("wall_s"):
+                change = f"{(result['wall_s'] / before['wall_s'] - 1) * 100:+.0f}%"
+            print(f"{case:30} {devices:>7} {result['wall_s']:>9.3f} {result['per_device_ms']:>9.2f} "
+                  f"{result['cpu_s']:>8.2f} {result['parse_render_cpu_s']:>12.3f} "
+                  f"{result['peak_rss_mb']:>8.1f} {result['failed']:>6}  {change}")
+
+    pipelining_savings(results)
+
+    history.append({"label": args.label or git_version(), "timestamp": int(time.time()),
+                    "python": sys.version.split()[0], "settings": settings, "results": results})
+    with open(args.output, "w", encoding="utf-8") as results_file:
+        json.dump(history, results_file, indent=1)
+    print(f"\nResults saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -20,13 +20,20 @@ IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
 
-from ncclient import manager
+import sys
+from pathlib import Path
 
 __author__ = "Juulia Santala"
 __email__ = "jusantal@cisco.com"
 __copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
 __license__ = "Cisco Sample Code License, Version 1.1"
 
+# Shared fleet helpers live in the netops package in dayn
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dayn"))
+from netops.fleet import run_on_fleet # pylint: disable=wrong-import-position
+from netops.sessions import netconf_session # pylint: disable=wrong-import-position
+from netops.snapshots import SNAPSHOTS # pylint: disable=wrong-import-position
+
 def enable_ipv6(device_ip, username, password, port=830, verify=False):
 
     print(f"\nConnecting to device {device_ip}...", end=" ")
@@ -54,7 +61,7 @@ def enable_ipv6(device_ip, username, password, port=830, verify=False):
         </config>
     """
 
-    with manager.connect(**device, device_params={"name":"iosxe"},timeout=10) as connection:
+    with netconf_session(**device) as connection, SNAPSHOTS.writing(device_ip):
         print("success!")
         response = connection.edit_config(target="running", config=payload)
         print(response)
@@ -71,5 +78,8 @@ if __name__ == "__main__":
         "username": "developer"
     }
 
-    for device in devices:
-        enable_ipv6(device, credentials["username"], credentials["password"])
+    # Number of devices handled at the same time
+    max_workers = 10
+
+    run_on_fleet(enable_ipv6, devices, credentials["username"], credentials["password"],
+                 max_workers=max_workers)
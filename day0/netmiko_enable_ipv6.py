@@ -3,6 +3,13 @@
 """
 Python sample script for enabling IPv6 with Netmiko on one device.
 
+With fleet=True the commands are built from the SoT and pushed to every
+device in parallel in bulk mode: the whole command block is sent at once
+and the output is checked for errors afterwards. If it has any, the
+commands from the first one the device did not acknowledge are sent again
+line by line. compare=True also times the line-by-line path on every
+device.
+
 ------------
 
 Copyright (c) 2025 Cisco and/or its affiliates.
@@ -20,6 +27,8 @@ IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
 
+import sys
+from pathlib import Path
 from netmiko import ConnectHandler
 
 __author__ = "Juulia Santala"
@@ -27,21 +36,51 @@ __email__ = "jusantal@cisco.com"
 __copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
 __license__ = "Cisco Sample Code License, Version 1.1"
 
-R2 = {
-    'device_type': 'cisco_xe',
-    'host': '198.18.7.2',
-    'username': 'developer',
-    'password': 'C1sco12345'
-}
+# Shared Netmiko helpers in the netops package and the SoT both live in dayn
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dayn"))
+from sot_loader import load_sot # pylint: disable=wrong-import-position
+from netops.netmiko_bulk import BULK, push_fleet, report # pylint: disable=wrong-import-position
+
+SOT_FILE = Path(__file__).resolve().parents[1] / "dayn" / "sot.yaml"
+
+def enable_ipv6_single():
+    R2 = {
+        'device_type': 'cisco_xe',
+        'host': '198.18.7.2',
+        'username': 'developer',
+        'password': 'C1sco12345'
+    }
+
+    net_connect = ConnectHandler(**R2)
+
+    config_commands = [
+        'ipv6 unicast-routing',
+        'ipv6 router ospf 1'
+    ]
+
+    output = net_connect.send_config_set(config_commands)
+    print(output)
+
+    net_connect.disconnect()
+
+if __name__ == "__main__":
 
-net_connect = ConnectHandler(**R2)
+    credentials = {
+        "password": "C1sco12345",
+        "username": "developer"
+    }
 
-config_commands = [
-    'ipv6 unicast-routing',
-    'ipv6 router ospf 1'
-]
+    # Set to True to enable IPv6 on every device of the SoT in parallel
+    fleet = False
 
-output = net_connect.send_config_set(config_commands)
-print(output)
+    # Also pushes line by line first and times it against the bulk push. Set
+    # to False to push in bulk only
+    compare = True
 
-net_connect.disconnect()
\ No newline at end of file
+    if fleet:
+        results = push_fleet(load_sot(str(SOT_FILE)), credentials["username"],
+                             credentials["password"], interfaces=False, max_workers=10,
+                             mode=BULK, fallback=True, compare=compare)
+        print(report(results))
+    else:
+        enable_ipv6_single()
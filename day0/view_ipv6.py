@@ -20,7 +20,8 @@ IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
 
-from ncclient import manager
+import sys
+from pathlib import Path
 import xmltodict
 
 __author__ = "Juulia Santala"
@@ -28,6 +29,12 @@ __email__ = "jusantal@cisco.com"
 __copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
 __license__ = "Cisco Sample Code License, Version 1.1"
 
+# Shared fleet helpers live in the netops package in dayn
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dayn"))
+from netops.fleet import run_on_fleet # pylint: disable=wrong-import-position
+from netops.sessions import netconf_session # pylint: disable=wrong-import-position
+from netops.timing import PARSE, timed # pylint: disable=wrong-import-position
+
 
 def view_ipv6(device_ip:str, username:str, password:str, port:int=830, verify:bool=False)->None:
     '''
@@ -44,7 +51,7 @@ def view_ipv6(device_ip:str, username:str, password:str, port:int=830, verify:bo
     }
 
     try:
-        with manager.connect(**device, device_params={"name":"iosxe"},timeout=10) as connection:
+        with netconf_session(**device) as connection:
             print("success!")
 
             # xpath defines that we are only interested in retrieving configuration data from native
@@ -57,7 +64,8 @@ def view_ipv6(device_ip:str, username:str, password:str, port:int=830, verify:bo
         return 1
     
     # Parsing XML formatter response into Python dictionary
-    config = xmltodict.parse(response)
+    with timed(PARSE, device_ip, "config"):
+        config = xmltodict.parse(response)
 
     # Checking if IPv6 configuration related keys exist in the returned payload,
     # and printing out correct message based on this
@@ -84,5 +92,8 @@ if __name__ == "__main__":
         "username": "developer"
     }
 
-    for device in devices:
-        view_ipv6(device, credentials["username"], credentials["password"])
+    # Number of devices handled at the same time
+    max_workers = 10
+
+    run_on_fleet(view_ipv6, devices, credentials["username"], credentials["password"],
+                 max_workers=max_workers)
@@ -21,7 +21,14 @@ IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
 
-from ncclient import manager
+import sys
+from pathlib import Path
+
+# Shared NETCONF helpers live in the netops package in dayn
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dayn"))
+from netops.delta import minimal_edit_config # pylint: disable=wrong-import-position
+from netops.sessions import netconf_session # pylint: disable=wrong-import-position
+from netops.snapshots import SNAPSHOTS # pylint: disable=wrong-import-position
 
 def configure_ipv6_on_intf(device_ip,
                            username,
@@ -29,7 +36,13 @@ def configure_ipv6_on_intf(device_ip,
                            ipv6_address,
                            nd_prefix,
                            port=830,
-                           verify=False):
+                           verify=False,
+                           diff=False):
+    '''
+    Configure IPv6 on the device's GigabitEthernet interfaces. With diff=True
+    the running configuration is read first and only the changed leaves are
+    sent, or nothing at all when the device already matches.
+    '''
 
     print(f"\nConnecting to device {device_ip}...", end=" ")
 
@@ -86,9 +99,16 @@ def configure_ipv6_on_intf(device_ip,
     </config>
     """
 
-    with manager.connect(**device, device_params={"name":"iosxe"},timeout=10) as connection:
+    with netconf_session(**device) as connection, SNAPSHOTS.writing(device_ip):
         print("success!")
-        response = connection.edit_config(target="running", config=payload)
+        if diff:
+            response, delta = minimal_edit_config(connection, payload)
+            if response is None:
+                print("Running configuration already matches, no edit-config sent")
+                return
+            print(f"Sending {len(delta)} of {len(payload)} payload bytes")
+        else:
+            response = connection.edit_config(target="running", config=payload)
         print(response)
 
 if __name__ == "__main__":
@@ -102,5 +122,9 @@ if __name__ == "__main__":
 
     R3_configuration = {"address": "2001:420:4021:1a45::1/64", "nd": "2001:420:4021:1a45::/64"}
 
+    # Set to True to read the running configuration first and send only the
+    # leaves that differ
+    diff = False
+
     configure_ipv6_on_intf(R3, credentials["username"], credentials["password"],
-                           R3_configuration["address"], R3_configuration["nd"])
+                           R3_configuration["address"], R3_configuration["nd"], diff=diff)
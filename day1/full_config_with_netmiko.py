@@ -3,6 +3,11 @@
 """
 Python sample script for configuring full IPv6 configuration with Netmiko.
 
+With fleet=True the commands are built from the SoT and pushed to every
+device in parallel in bulk mode. When the output has errors, the commands
+from the first one the device did not acknowledge are sent again line by
+line. compare=True also times the line-by-line path on every device.
+
 ------------
 
 Copyright (c) 2025 Cisco and/or its affiliates.
@@ -20,32 +25,63 @@ IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
 
+import sys
+from pathlib import Path
 from netmiko import ConnectHandler
 
-R3 = {
-    'device_type': 'cisco_xe',
-    'host': '198.18.11.2',
-    'username': 'developer',
-    'password': 'C1sco12345'
-}
-
-net_connect = ConnectHandler(**R3)
-
-config_commands = [
-    'ipv6 unicast-routing',
-    'ipv6 router ospf 1',
-    'int gig 4',
-    'ipv6 enable',
-    'ipv6 ospf 1 area 0',
-    'int gig 5',
-    'ipv6 enable',
-    'ipv6 ospf 1 area 0',
-    'ipv6 address 2001:420:4021:1BD5::1/64',
-    'ipv6 nd prefix 2001:420:4021:1BD5::/64'
-]
-
-output = net_connect.send_config_set(config_commands)
-print(output)
-
-net_connect.disconnect()
+# Shared Netmiko helpers in the netops package and the SoT both live in dayn
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dayn"))
+from sot_loader import load_sot # pylint: disable=wrong-import-position
+from netops.netmiko_bulk import BULK, push_fleet, report # pylint: disable=wrong-import-position
+
+SOT_FILE = Path(__file__).resolve().parents[1] / "dayn" / "sot.yaml"
+
+def full_config_single():
+    R3 = {
+        'device_type': 'cisco_xe',
+        'host': '198.18.11.2',
+        'username': 'developer',
+        'password': 'C1sco12345'
+    }
+
+    net_connect = ConnectHandler(**R3)
+
+    config_commands = [
+        'ipv6 unicast-routing',
+        'ipv6 router ospf 1',
+        'int gig 4',
+        'ipv6 enable',
+        'ipv6 ospf 1 area 0',
+        'int gig 5',
+        'ipv6 enable',
+        'ipv6 ospf 1 area 0',
+        'ipv6 address 2001:420:4021:1BD5::1/64',
+        'ipv6 nd prefix 2001:420:4021:1BD5::/64'
+    ]
+
+    output = net_connect.send_config_set(config_commands)
+    print(output)
+
+    net_connect.disconnect()
+
+if __name__ == "__main__":
+
+    credentials = {
+        "password": "C1sco12345",
+        "username": "developer"
+    }
+
+    # Set to True to configure every device of the SoT in parallel
+    fleet = False
+
+    # Also pushes line by line first and times it against the bulk push. Set
+    # to False to push in bulk only
+    compare = True
 
+    if fleet:
+        results = push_fleet(load_sot(str(SOT_FILE)), credentials["username"],
+                             credentials["password"], interfaces=True, max_workers=10,
+                             mode=BULK, fallback=True, compare=compare)
+        print(report(results))
+    else:
+        full_config_single()
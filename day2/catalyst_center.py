@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helpers for talking to the Catalyst Center API over pooled
+keep-alive connections with a cached authentication token, and for
+retrieving client data page by page. Note that the clients API is
+supported since the version 2.3.7
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+# Shared streaming, rate limiting and timing helpers live in the netops package
+# in dayn
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dayn"))
+from netops.json_stream import iter_json_items # pylint: disable=wrong-import-position
+from netops.rate_limit import RateLimitScheduler # pylint: disable=wrong-import-position
+from netops.timing import API, timed # pylint: disable=wrong-import-position
+
+TOKEN_PATH = "/dna/system/api/v1/auth/token"
+CLIENTS_PATH = "/dna/data/api/v1/clients"
+
+# The clients API returns at most 1000 clients per page
+MAX_PAGE_SIZE = 1000
+
+# Response bodies are read and decoded in chunks of this many bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Catalyst Center tokens are valid for 60 minutes, refresh a bit earlier
+TOKEN_LIFETIME = 55 * 60
+TOKEN_CACHE_FILE = Path.home() / ".catalyst_center_tokens.json"
+
+
+class CatalystCenter:
+    '''
+    Catalyst Center API client.
+
+    All requests go through one requests.Session, so TLS connections are
+    kept alive and reused (up to pool_size at a time). The token is cached in
+    memory and in token_cache_file until it expires; set token_cache_file to
+    None to keep it in memory only. A request answered with 401 triggers one
+    re-authentication and retry. Requests are paced per endpoint by the
+    RateLimitScheduler, which also retries the ones answered with 429.
+    '''
+
+    def __init__(self, host:str, username:str, password:str, verify:bool=False,
+                 pool_size:int=10, token_cache_file=TOKEN_CACHE_FILE,
+                 token_lifetime:float=TOKEN_LIFETIME, scheduler:RateLimitScheduler=None):
+        self.host = host.rstrip("/")
+        self.username = username
+        self.password = password
+        self.verify = verify
+        self.token_cache_file = Path(token_cache_file) if token_cache_file else None
+        self.token_lifetime = token_lifetime
+        self.scheduler = scheduler if scheduler is not None else RateLimitScheduler()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._token = None
+        self._token_expires = 0.0
+        self._token_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    @property
+    def _cache_key(self)->str:
+        return f"{self.username}@{self.host}"
+
+    def _read_token_cache(self):
+        if not self.token_cache_file:
+            return None, 0.0
+        try:
+            entry = json.loads(self.token_cache_file.read_text(encoding="utf-8"))[self._cache_key]
+            return entry["token"], float(entry["expires"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, 0.0
+
+    def _write_token_cache(self):
+        if not self.token_cache_file:
+            return
+        try:
+            cache = json.loads(self.token_cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cache = {}
+        cache[self._cache_key] = {"token": self._token, "expires": self._token_expires}
+        try:
+            # The token file holds credentials, keep it readable by the owner only
+            descriptor = os.open(self.token_cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, "w", encoding="utf-8") as cache_file:
+                json.dump(cache, cache_file)
+        except OSError:
+            pass
+
+    def authenticate(self)->str:
+        '''
+        Request a new token from Catalyst Center and cache it.
+        '''
+        url = f"{self.host}{TOKEN_PATH}"
+        response = self.scheduler.send(TOKEN_PATH, lambda: self._send(
+            "POST", TOKEN_PATH, url, auth=(self.username, self.password), verify=self.verify))
+        response.raise_for_status()
+
+        self._token = response.json()["Token"]
+        self._token_expires = time.time() + self.token_lifetime
+        self._write_token_cache()
+        return self._token
+
+    @property
+    def token(self)->str:
+        '''
+        Valid token, from memory, from the token cache file or from a new
+        authentication, in that order.
+        '''
+        with self._token_lock:
+            if self._token and time.time() < self._token_expires:
+                return self._token
+            token, expires = self._read_token_cache()
+            if token and time.time() < expires:
+                self._token, self._token_expires = token, expires
+                return self._token
+            return self.authenticate()
+
+    def _refresh_token(self, rejected_token:str)->str:
+        with self._token_lock:
+            # Another thread may already have replaced the rejected token
+            if self._token and self._token != rejected_token:
+                return self._token
+            return self.authenticate()
+
+    def _send(self, method:str, path:str, url:str, **kwargs)->requests.Response:
+        # Timed per attempt, without the rate limiter's waits. Streamed
+        # responses are timed until the headers have arrived.
+        with timed(API, self.host, f"{method} {path}"):
+            return self.session.request(method, url, **kwargs)
+
+    def request(self, method:str, path:str, headers:dict=None, **kwargs)->requests.Response:
+        '''
+        Send an authenticated request to path (for example CLIENTS_PATH).
+        '''
+        url = f"{self.host}{path}"
+
+        def send(token):
+            return self.scheduler.send(path, lambda: self._send(
+                method, path, url, headers={"x-auth-token":token, **(headers or {})},
+                verify=self.verify, **kwargs))
+
+        token = self.token
+        response = send(token)
+        if response.status_code == 401:
+            response.close()
+            response = send(self._refresh_token(token))
+        return response
+
+    def get(self, path:str, **kwargs)->requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def open_clients_page(self, offset:int, limit:int=MAX_PAGE_SIZE, headers:dict=None,
+                          params:dict=None)->requests.Response:
+        '''
+        Request one page of clients without reading the response body yet.
+        Offsets start from 1.
+        '''
+        request_params = {**(params or {}), "offset": offset, "limit": limit}
+
+        response = self.get(CLIENTS_PATH, headers=headers, params=request_params, stream=True)
+        response.raise_for_status()
+        return response
+
+    def iter_clients_page(self, offset:int, limit:int=MAX_PAGE_SIZE, headers:dict=None,
+                          params:dict=None):
+        '''
+        Yield the clients of one page one at a time, decoding them while the
+        response body is being received.
+        '''
+        with self.open_clients_page(offset, limit, headers, params) as response:
+            yield from iter_json_items(response.iter_content(STREAM_CHUNK_SIZE))
+
+    def get_clients_page(self, offset:int, limit:int=MAX_PAGE_SIZE, headers:dict=None,
+                         params:dict=None)->list:
+        '''
+        Retrieve one page of clients. Offsets start from 1.
+        '''
+        return list(self.iter_clients_page(offset, limit, headers, params))
+
+    def iter_clients(self, page_size:int=MAX_PAGE_SIZE, prefetch:int=4, headers:dict=None,
+                     params:dict=None):
+        '''
+        Yield every client known to Catalyst Center, one client at a time.
+
+        Up to prefetch pages are requested at the same time. Pages are read in
+        order and their clients are decoded from the response body as it
+        arrives, so only the client being decoded is held in memory and the
+        first clients are available before the last page has been downloaded.
+        Paging stops at the first page that is shorter than page_size.
+        '''
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        in_flight = deque()
+        next_offset = 1
+        last_page_seen = False
+
+        with ThreadPoolExecutor(max_workers=max(1, prefetch)) as executor:
+            try:
+                while True:
+                    while not last_page_seen and len(in_flight) < max(1, prefetch):
+                        in_flight.append(executor.submit(self.open_clients_page, next_offset,
+                                                         page_size, headers, params))
+                        next_offset += page_size
+                    if not in_flight:
+                        return
+
+                    received = 0
+                    with in_flight.popleft().result() as response:
+                        for client in iter_json_items(response.iter_content(STREAM_CHUNK_SIZE)):
+                            received += 1
+                            yield client
+
+                    if received < page_size:
+                        # Pages requested after the last one are empty; drop them
+                        last_page_seen = True
+                        _drop_pages(in_flight)
+            finally:
+                _drop_pages(in_flight)
+
+
+def _close_page(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _drop_pages(in_flight:deque):
+    '''
+    Cancel prefetched page requests, closing the responses of the ones that
+    already started so that their connections go back to the pool.
+    '''
+    while in_flight:
+        future = in_flight.popleft()
+        if not future.cancel():
+            future.add_done_callback(_close_page)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for keeping a local SQLite copy of the Catalyst
+Center clients and refreshing it with only the clients that changed since
+the previous sync.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import json
+import sqlite3
+import time
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    id TEXT PRIMARY KEY NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    host TEXT PRIMARY KEY,
+    last_sync INTEGER NOT NULL,
+    last_full_sync INTEGER NOT NULL
+);
+"""
+
+# Stores written with an older schema are dropped and filled again by a full sync
+SCHEMA_VERSION = 2
+
+# Clients are written to SQLite in batches of this size while pages stream in
+BATCH_SIZE = 1000
+
+# Re-read this much before the previous sync to cover clock skew and late updates
+OVERLAP_MS = 5 * 60 * 1000
+
+# Delta syncs only see clients that changed, never clients that were removed,
+# so the whole client list is downloaded again at least this often
+FULL_SYNC_INTERVAL_MS = 24 * 60 * 60 * 1000
+
+
+def client_id(client:dict):
+    ''' Key of a client in the store, or None when the API gave it no id. '''
+    return client.get("id") or client.get("macAddress") or None
+
+
+class SyncResult:
+    '''
+    Summary of one ClientStore.sync() run.
+    '''
+    __slots__ = ("full", "fetched", "total", "elapsed", "skipped")
+
+    def __init__(self, full:bool, fetched:int, total:int, elapsed:float, skipped:int=0):
+        self.full = full
+        self.fetched = fetched
+        self.total = total
+        self.elapsed = elapsed
+        self.skipped = skipped
+
+    def __str__(self):
+        mode = "Full" if self.full else "Delta"
+        text = (f"{mode} sync fetched {self.fetched} clients in {self.elapsed:.2f}s, "
+                f"{self.total} clients in the local store")
+        if self.skipped:
+            text += f" ({self.skipped} clients without an id skipped)"
+        return text
+
+
+class ClientStore:
+    '''
+    SQLite store of Catalyst Center clients, keyed by client id.
+
+    The first sync downloads every client. Later syncs pass startTime and
+    endTime to the clients API so that only clients updated since the last
+    sync (minus OVERLAP_MS) are downloaded and upserted. Because a delta
+    sync cannot tell that a client was removed, a full sync that replaces
+    the whole store is done again once the last one is older than
+    full_sync_interval milliseconds.
+    '''
+
+    def __init__(self, path:str="clients.db", full_sync_interval:int=FULL_SYNC_INTERVAL_MS):
+        self.path = path
+        self.full_sync_interval = full_sync_interval
+        self.connection = sqlite3.connect(path)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.connection.executescript("DROP TABLE IF EXISTS clients; "
+                                          "DROP TABLE IF EXISTS sync_state;")
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM clients").fetchone()[0]
+
+    def last_sync(self, host:str):
+        row = self.connection.execute("SELECT last_sync FROM sync_state WHERE host = ?",
+                                      (host,)).fetchone()
+        return row[0] if row else None
+
+    def last_full_sync(self, host:str):
+        row = self.connection.execute("SELECT last_full_sync FROM sync_state WHERE host = ?",
+                                      (host,)).fetchone()
+        return row[0] if row else None
+
+    def _upsert(self, clients:list)->int:
+        '''
+        Write a batch of clients and return how many were skipped for having
+        no id.
+        '''
+        rows = [(client_id(client), json.dumps(client)) for client in clients]
+        rows = [row for row in rows if row[0] is not None]
+        self.connection.executemany(
+            "INSERT INTO clients (id, data) VALUES (?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET data = excluded.data", rows)
+        return len(clients) - len(rows)
+
+    def sync(self, center, full:bool=False, page_size:int=1000, prefetch:int=4,
+             headers:dict=None)->SyncResult:
+        '''
+        Bring the store up to date from a CatalystCenter client. A full sync
+        is done when full is True, when the host has never been synced, or
+        when its last full sync is older than full_sync_interval.
+        '''
+        started = time.perf_counter()
+        now = int(time.time() * 1000)
+        last_sync = None if full else self.last_sync(center.host)
+        last_full_sync = self.last_full_sync(center.host)
+        if last_full_sync is None or now - last_full_sync > self.full_sync_interval:
+            last_sync = None
+
+        params = {"endTime": now}
+        if last_sync is not None:
+            params["startTime"] = last_sync - OVERLAP_MS
+
+        fetched = 0
+        skipped = 0
+        batch = []
+        with self.connection:
+            if last_sync is None:
+                # Clients missing from the full listing no longer exist
+                self.connection.execute("DELETE FROM clients")
+                last_full_sync = now
+            for client in center.iter_clients(page_size=page_size, prefetch=prefetch,
+                                              headers=headers, params=params):
+                batch.append(client)
+                if len(batch) >= BATCH_SIZE:
+                    skipped += self._upsert(batch)
+                    fetched += len(batch)
+                    batch = []
+            skipped += self._upsert(batch)
+            fetched += len(batch)
+            self.connection.execute(
+                "INSERT INTO sync_state (host, last_sync, last_full_sync) VALUES (?, ?, ?) "
+                "ON CONFLICT(host) DO UPDATE SET last_sync = excluded.last_sync, "
+                "last_full_sync = excluded.last_full_sync",
+                (center.host, now, last_full_sync))
+
+        return SyncResult(last_sync is None, fetched, len(self), time.perf_counter() - started,
+                          skipped)
+
+    def iter_clients(self):
+        '''
+        Yield the stored clients one at a time, as returned by the API.
+        '''
+        for (data,) in self.connection.execute("SELECT data FROM clients ORDER BY id"):
+            yield json.loads(data)
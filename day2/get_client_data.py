@@ -23,6 +23,8 @@ or implied.
 """
 
 import requests
+from catalyst_center import CatalystCenter
+from client_store import ClientStore
 
 requests.urllib3.disable_warnings()
 
@@ -30,18 +32,24 @@ HOST = "https://<YOUR CAT CENTER>"
 PASSWORD = "<YOUR PASSWORD>"
 USERNAME = "<YOUR USERNAME>"
 
-# Get authentication token
-
-url = f"{HOST}/dna/system/api/v1/auth/token"
-response = requests.post(url, auth=(USERNAME, PASSWORD), verify=False)
-token = response.json()["Token"]
-
-# Retrieve client data
-url = f"{HOST}/dna/data/api/v1/clients"
-headers = {"x-auth-token":token}
-response = requests.get(url, headers=headers, verify=False)
-
-data = response.json()
-
-for client in data["response"]:
-    print(f"Client {client['name']}: IPv6 addresses: {client['ipv6Addresses']}")
+# Local SQLite copy of the clients, off by default so that the client data
+# is not written to disk. Set to a file name, for example "clients.db", to
+# keep the copy: after the first run only the clients updated since the
+# previous run are downloaded. The file holds client names and addresses,
+# so keep it private and out of version control (*.db is ignored by git).
+CLIENT_STORE = None
+
+# The client keeps its connections open and caches the authentication token,
+# so the token is only requested again once the cached one has expired
+with CatalystCenter(HOST, USERNAME, PASSWORD) as center:
+
+    if CLIENT_STORE:
+        with ClientStore(CLIENT_STORE) as store:
+            print(store.sync(center, prefetch=4))
+
+            for client in store.iter_clients():
+                print(f"Client {client['name']}: IPv6 addresses: {client['ipv6Addresses']}")
+    else:
+        # Retrieve client data page by page, printing clients as the pages arrive
+        for client in center.iter_clients(prefetch=4):
+            print(f"Client {client['name']}: IPv6 addresses: {client['ipv6Addresses']}")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helpers for classifying client IPv6 addresses (link-local,
+ULA, GUA, EUI-64) and validating a whole client list in one pass.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import ipaddress
+from collections import Counter
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+LINK_LOCAL = "link-local"   # fe80::/10
+ULA = "ULA"                 # fc00::/7
+GUA = "GUA"                 # 2000::/3
+EUI_64 = "EUI-64"           # interface identifier built from a MAC address (ff:fe in the middle)
+INVALID = "invalid"
+
+
+def classify_address(address:str)->tuple:
+    '''
+    Return the labels of one IPv6 address. An address gets one scope label
+    (link-local, ULA or GUA, or none for other ranges) and EUI-64 on top of
+    it when its interface identifier is derived from a MAC address.
+    Unparseable addresses are labelled invalid.
+    '''
+    try:
+        value = int(ipaddress.IPv6Address(address.split("/")[0].split("%")[0]))
+    except ValueError:
+        return (INVALID,)
+
+    labels = []
+    if value >> 118 == 0x3fa:
+        labels.append(LINK_LOCAL)
+    elif value >> 121 == 0x7e:
+        labels.append(ULA)
+    elif value >> 125 == 0x1:
+        labels.append(GUA)
+    if (value >> 24) & 0xffff == 0xfffe:
+        labels.append(EUI_64)
+    return tuple(labels)
+
+
+class ClientFailure:
+    '''
+    A client that did not pass the batch validation, with the reasons.
+    '''
+    __slots__ = ("username", "type", "addresses", "reasons")
+
+    def __init__(self, username, client_type, addresses, reasons):
+        self.username = username
+        self.type = client_type
+        self.addresses = addresses
+        self.reasons = reasons
+
+    def __str__(self):
+        return f"{self.username}({self.type}): {', '.join(self.reasons)} - addresses: {self.addresses}"
+
+
+class BatchResult:
+    '''
+    Outcome of validate_clients(): how many clients and addresses were seen,
+    how many addresses got each label, and the failing clients.
+    '''
+
+    def __init__(self):
+        self.clients = 0
+        self.addresses = 0
+        self.labels = Counter()
+        self.failures = []
+
+    @property
+    def passed(self)->bool:
+        return not self.failures
+
+    def summary(self)->str:
+        labels = ", ".join(f"{label}: {count}" for label, count in sorted(self.labels.items()))
+        return (f"{self.clients} clients, {self.addresses} IPv6 addresses ({labels or 'none'}), "
+                f"{len(self.failures)} failing clients")
+
+
+def validate_clients(clients, min_addresses:int=2)->BatchResult:
+    '''
+    Classify the IPv6 addresses of every client in one pass. A client fails
+    when it has no link-local address or fewer than min_addresses addresses.
+    clients can be any iterable, such as CatalystCenter.iter_clients().
+    '''
+    result = BatchResult()
+
+    for client in clients:
+        addresses = client.get("ipv6Addresses") or []
+        result.clients += 1
+        result.addresses += len(addresses)
+
+        has_link_local = False
+        for address in addresses:
+            labels = classify_address(address)
+            result.labels.update(labels)
+            has_link_local = has_link_local or LINK_LOCAL in labels
+
+        reasons = []
+        if not has_link_local:
+            reasons.append("no link local address")
+        if len(addresses) < min_addresses:
+            reasons.append(f"{len(addresses)} addresses, expected at least {min_addresses}")
+        if reasons:
+            result.failures.append(ClientFailure(client.get("username"), client.get("type"),
+                                                 addresses, reasons))
+    return result
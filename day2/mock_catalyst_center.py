@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample local stand-in for the Catalyst Center token and clients
+APIs, including the startTime/endTime window of the clients API. It
+enforces a per-endpoint rate limit and answers with HTTP 429 and a
+Retry-After header when the limit is exceeded, so that the day2 scripts
+can be tried out without a real Catalyst Center.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import json
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+TOKEN_PATH = "/dna/system/api/v1/auth/token"
+CLIENTS_PATH = "/dna/data/api/v1/clients"
+
+
+def make_clients(count:int)->list:
+    '''
+    Generate count clients that look like the clients API output, last
+    updated an hour ago.
+    '''
+    updated = int(time.time() * 1000) - 3600 * 1000
+    clients = []
+    for index in range(count):
+        clients.append({
+            "id": f"00:00:5e:{index >> 16 & 0xff:02x}:{index >> 8 & 0xff:02x}:{index & 0xff:02x}",
+            "name": f"client-{index}",
+            "username": f"user{index}",
+            "type": "Wireless" if index % 2 else "Wired",
+            "ipv6Addresses": [f"fe80::{index:x}", f"2001:db8:{index >> 16:x}:{index & 0xffff:x}::1"],
+            "lastUpdatedTime": updated,
+        })
+    return clients
+
+
+class _RateLimit:
+    ''' Fixed-rate token bucket used by the mock to decide when to answer 429. '''
+
+    def __init__(self, rate:float):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def allow(self):
+        ''' Return (allowed, seconds until the next request would be allowed). '''
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(1.0, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True, 0.0
+            return False, (1 - self.tokens) / self.rate
+
+
+class _Server(ThreadingHTTPServer):
+    '''
+    HTTP server that does not print a traceback when a client closes a
+    connection early, which the client does with prefetched pages it no
+    longer needs.
+    '''
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockCatalystCenter:
+    '''
+    Local HTTP server that serves the token API and the paginated clients
+    API, with at most rate_limit requests per second per endpoint.
+
+    Counters for served and throttled requests are kept in self.stats.
+    '''
+
+    def __init__(self, clients:list=None, rate_limit:float=10, host:str="127.0.0.1", port:int=0,
+                 username:str="developer", password:str="C1sco12345"):
+        self.clients = clients if clients is not None else make_clients(2500)
+        self.username = username
+        self.password = password
+        self.tokens = set()
+        self.stats = {"served": 0, "throttled": 0, "unauthorized": 0}
+        self._limits = {TOKEN_PATH: _RateLimit(rate_limit), CLIENTS_PATH: _RateLimit(rate_limit)}
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler_class())
+        self._thread = None
+
+    @property
+    def url(self)->str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def touch(self, indexes):
+        '''
+        Mark the clients at the given indexes as updated now, so that they
+        fall inside the next delta sync window.
+        '''
+        now = int(time.time() * 1000)
+        for index in indexes:
+            self.clients[index]["lastUpdatedTime"] = now
+
+    def _count(self, key:str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status:int, body, headers:dict=None):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _throttled(self, path:str)->bool:
+                allowed, retry_after = mock._limits[path].allow()
+                if allowed:
+                    return False
+                mock._count("throttled")
+                # The exact wait, not rounded up to whole seconds, so that a
+                # client that honours Retry-After can run right at the limit
+                self._send_json(429, {"error": "Too Many Requests"},
+                                {"Retry-After": f"{retry_after:.3f}"})
+                return True
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                if path != TOKEN_PATH:
+                    self._send_json(404, {"error": "Not Found"})
+                    return
+                if self._throttled(path):
+                    return
+                token = uuid.uuid4().hex
+                with mock._lock:
+                    mock.tokens.add(token)
+                mock._count("served")
+                self._send_json(200, {"Token": token})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != CLIENTS_PATH:
+                    self._send_json(404, {"error": "Not Found"})
+                    return
+                if self.headers.get("x-auth-token") not in mock.tokens:
+                    mock._count("unauthorized")
+                    self._send_json(401, {"error": "Unauthorized"})
+                    return
+                if self._throttled(url.path):
+                    return
+
+                query = parse_qs(url.query)
+                offset = int(query.get("offset", ["1"])[0])
+                limit = int(query.get("limit", ["25"])[0])
+                clients = mock.clients
+                if "startTime" in query or "endTime" in query:
+                    start = int(query.get("startTime", ["0"])[0])
+                    end = int(query.get("endTime", [str(2**63)])[0])
+                    clients = [client for client in clients
+                               if start <= client["lastUpdatedTime"] <= end]
+                page = clients[offset - 1:offset - 1 + limit]
+                mock._count("served")
+                self._send_json(200, {
+                    "response": page,
+                    "page": {"limit": limit, "offset": offset, "count": len(page)}
+                })
+
+        return Handler
+
+
+if __name__ == "__main__":
+    # Run the day2 Catalyst Center client against a mock that allows only
+    # 5 requests per second, and show how the scheduler adapts its rate
+    from catalyst_center import CatalystCenter, CLIENTS_PATH as CLIENTS
+
+    with MockCatalystCenter(clients=make_clients(20000), rate_limit=5) as mock_center:
+        center = CatalystCenter(mock_center.url, mock_center.username, mock_center.password,
+                                token_cache_file=None)
+        started = time.perf_counter()
+        received = sum(1 for _ in center.iter_clients(page_size=500, prefetch=8))
+        elapsed = time.perf_counter() - started
+
+        print(f"Received {received} clients in {elapsed:.2f}s")
+        print(f"Mock server stats: {mock_center.stats}")
+        print(f"Scheduler retried {center.scheduler.throttled} throttled requests")
+        print(f"Learned rate for {CLIENTS}: {center.scheduler.rates()[CLIENTS]:.2f} requests/s")
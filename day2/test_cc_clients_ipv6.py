@@ -23,6 +23,9 @@ or implied.
 
 from pyats import aetest
 import requests
+from catalyst_center import CatalystCenter
+from client_store import ClientStore
+from ipv6_classify import LINK_LOCAL, classify_address, validate_clients
 
 class CommonSetup(aetest.CommonSetup):
     '''
@@ -32,53 +35,76 @@ class CommonSetup(aetest.CommonSetup):
 
     @aetest.subsection
     def cc_authenticate(self, cc_creds):
-        auth = (cc_creds["username"], cc_creds["password"])
-        url = f"{cc_creds['url']}/dna/system/api/v1/auth/token"
+        # The token is reused from the token cache file while it is still valid
+        self.center = CatalystCenter(cc_creds["url"], cc_creds["username"], cc_creds["password"])
 
-        response = requests.post(url, auth=auth, verify=False)
-
-        if response.ok:
-            self.token = response.json()["Token"]
-            self.passed()
+        try:
+            self.center.token
+        except requests.HTTPError as err:
+            self.failed(f"Issue while getting token: {err.response.text}")
         else:
-            self.failed(f"Issue while getting token: {response.text}")
+            self.passed()
 
 
     @aetest.subsection
-    def get_data(self, cc_creds):
-        url = f"{cc_creds['url']}/dna/data/api/v1/clients"
-        headers = {
-            "x-auth-token":self.token,
-            "X-CALLER-ID":"pyATS"
-        }
+    def get_data(self, client_store=None, batch_validation=False):
+        headers = {"X-CALLER-ID":"pyATS"}
 
         try:
-            response = requests.get(url, headers=headers, verify=False)
-
-            if response.ok:
-                self.data = response.json()
-                print(self.data)
-                self.passed()
+            if client_store:
+                # Only the clients updated since the previous run are downloaded
+                with ClientStore(client_store) as store:
+                    print(store.sync(self.center, headers=headers))
+
+            if batch_validation:
+                # Batch validation reads the clients one at a time, so they
+                # are never all held in memory
+                self.data = _stored_clients(client_store) if client_store \
+                    else self.center.iter_clients(headers=headers)
+                print("Clients are streamed to the batch validation")
             else:
-                self.failed(f"Issue while getting clients: {response.text}")
+                # Per-client looping needs the whole list up front
+                if client_store:
+                    self.data = list(_stored_clients(client_store))
+                else:
+                    self.data = list(self.center.iter_clients(headers=headers))
+                print(f"Retrieved {len(self.data)} clients")
+            self.passed()
+        except requests.HTTPError as err:
+            self.failed(f"Issue while getting clients: {err.response.text}")
         except Exception as err:
             self.failed(f"Issue while executing API call: {err}")
 
     @aetest.subsection
-    def mark_tests_for_looping(self):
+    def mark_tests_for_looping(self, batch_validation=False):
         """
         device_list includes details (name and uuid) for each of the devices
         whose interface configuration is to be tested.
         This method loops through all the devices in the device_list and calls
         the test InterfaceConfigTestcase on all of them one by one.
+        In batch validation mode all clients are instead handed over to
+        Ipv6ClientBatchTestcase, which checks them in one go.
         """
-        aetest.loop.mark(Ipv6ClientTestcase, client=self.data)
+        if batch_validation:
+            self.parent.parameters["clients"] = self.data
+        else:
+            aetest.loop.mark(Ipv6ClientTestcase, client=self.data)
+
+def _stored_clients(client_store):
+    ''' Clients of the local store, one at a time. '''
+    with ClientStore(client_store) as store:
+        yield from store.iter_clients()
 
 class Ipv6ClientTestcase(aetest.Testcase):
     '''
     Simple Testcase for checking port status using Cisco Catalyst Center.
     '''
 
+    @aetest.setup
+    def check_mode(self, batch_validation=False):
+        if batch_validation:
+            self.skipped("Batch validation mode, clients are checked by Ipv6ClientBatchTestcase")
+
     @aetest.test
     def validate_client_ipv6_addresses(self, steps, client):
         '''
@@ -92,12 +118,10 @@ class Ipv6ClientTestcase(aetest.Testcase):
             f"Checking for link local on {client_username}({client_type})",
             continue_=False
         ) as step:
-            if ipv6_addresses:
-                for address in ipv6_addresses:
-                    if "fe80" in address:
-                        step.passed(f"✅ Link local address present: {address} ✅")
-            else:
-                step.failed("❌ Link local address NOT present ❌")
+            for address in ipv6_addresses or []:
+                if LINK_LOCAL in classify_address(address):
+                    step.passed(f"✅ Link local address present: {address} ✅")
+            step.failed("❌ Link local address NOT present ❌")
 
         with  steps.start(
             f"Checking for other addresses on {client_username}({client_type})",
@@ -109,6 +133,32 @@ class Ipv6ClientTestcase(aetest.Testcase):
             else:
                 step.failed("❌ One or less addresses present ❌")
 
+class Ipv6ClientBatchTestcase(aetest.Testcase):
+    '''
+    Testcase for checking the IPv6 addresses of all clients at once. Every
+    address is classified as link-local, ULA, GUA and/or EUI-64 in one pass,
+    and the failing clients are listed in a single summary.
+    '''
+
+    @aetest.setup
+    def check_mode(self, batch_validation=False):
+        if not batch_validation:
+            self.skipped("Per-client validation mode, clients are checked by Ipv6ClientTestcase")
+
+    @aetest.test
+    def validate_all_clients(self, clients):
+        try:
+            result = validate_clients(clients)
+        except requests.HTTPError as err:
+            self.failed(f"Issue while getting clients: {err.response.text}")
+        print(result.summary())
+
+        if result.passed:
+            self.passed(f"✅ All {result.clients} clients have a link local and other addresses ✅")
+        else:
+            failing = "\n".join(str(failure) for failure in result.failures)
+            self.failed(f"❌ {len(result.failures)} clients failed:\n{failing}")
+
 class CommonCleanup(aetest.CommonCleanup):
     '''
     Common cleanup tasks - this class is instantiated only once per testscript.
@@ -126,4 +176,6 @@ if __name__ == "__main__":
         "password": "<YOUR PASSWORD>"
     }
 
-    aetest.main(cc_creds=cat_creds)
+    # Set client_store=None to check the clients straight from the API, and
+    # batch_validation=True to check all clients in one testcase on large sites
+    aetest.main(cc_creds=cat_creds, client_store="clients.db", batch_validation=False)
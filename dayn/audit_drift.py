@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample script for checking that the running interface configuration
+of every device still matches the SoT, with a compact drift report per
+device.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import sys
+from pathlib import Path
+from sot_loader import open_sot
+from netops.drift import RunningHashCache, audit_device
+from netops.fleet import run_on_fleet
+from netops.sessions import netconf_session
+from netops.templates import TemplateRegistry
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+TEMPLATES = TemplateRegistry(search_path=Path(__file__).resolve().parent)
+
+def audit_drift(device_name, sot, username:str, password:str, cache:RunningHashCache,
+                template_name:str="interface_template.j2", port:int=830, verify:bool=False):
+    '''
+    Render the device's SoT entry and compare it with the device's running
+    configuration. Returns the DriftReport.
+    '''
+    values = sot[device_name]
+    payload = TEMPLATES.render(template_name, interfaces=values["interfaces"])
+
+    device = {
+        "host": values["mgmt"],
+        "port": port,
+        "username": username,
+        "password": password,
+        "hostkey_verify": verify
+    }
+
+    with netconf_session(**device) as connection:
+        report = audit_device(connection, device_name, payload, cache)
+    print(report.summary())
+    return report
+
+if __name__ == "__main__":
+
+    credentials = {
+        "password": "C1sco12345",
+        "username": "developer"
+    }
+
+    config_values = open_sot("sot.yaml")
+
+    # Hash trees of the running configurations are kept between audits, so
+    # devices whose configuration has not changed are not parsed again
+    cache = RunningHashCache("drift_cache.json")
+
+    results = run_on_fleet(audit_drift, list(config_values), config_values,
+                           credentials["username"], credentials["password"], cache,
+                           max_workers=10)
+
+    cache.prune(config_values)
+    cache.save()
+
+    drifted = [result.device for result in results if not result.ok or not result.result.in_sync]
+    if drifted:
+        print(f"\nDrift or errors on: {', '.join(drifted)}")
+        sys.exit(1)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample benchmark comparing the time per render of compiling the
+Jinja2 template for every device with rendering from the TemplateRegistry.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+import jinja2
+import yaml
+from netops.templates import TemplateRegistry
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+HERE = Path(__file__).resolve().parent
+
+
+def render_uncached(interfaces, template_name):
+    ''' The previous render_template: read and compile the template on every call. '''
+    with open(HERE / template_name, encoding="utf-8") as my_template:
+        template = jinja2.Template(my_template.read())
+    return template.render(interfaces=interfaces)
+
+
+def time_renders(render, devices, template_name):
+    started = time.perf_counter()
+    outputs = [render(interfaces, template_name) for interfaces in devices]
+    return time.perf_counter() - started, outputs
+
+
+if __name__ == "__main__":
+
+    device_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    template = "interface_template.j2"
+
+    with open(HERE / "sot.yaml", encoding="utf-8") as sot:
+        sot_devices = [values["interfaces"] for values in yaml.safe_load(sot.read()).values()]
+    devices = [sot_devices[index % len(sot_devices)] for index in range(device_count)]
+
+    before, expected = time_renders(render_uncached, devices, template)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # First registry compiles and writes the bytecode cache, like a first pipeline run
+        registry = TemplateRegistry(search_path=HERE, cache_dir=cache_dir)
+        cold, outputs_cold = time_renders(lambda interfaces, name: registry.render(name, interfaces=interfaces),
+                                          devices, template)
+
+        # A new registry loads the bytecode from disk, like a later pipeline run
+        registry = TemplateRegistry(search_path=HERE, cache_dir=cache_dir)
+        warm, outputs_warm = time_renders(lambda interfaces, name: registry.render(name, interfaces=interfaces),
+                                          devices, template)
+
+    assert outputs_cold == expected and outputs_warm == expected, "Rendered configuration differs"
+
+    print(f"Rendered {device_count} devices with {template}")
+    for label, elapsed in (("compile every render", before),
+                           ("registry, empty bytecode cache", cold),
+                           ("registry, warm bytecode cache", warm)):
+        print(f"  {label:32} {elapsed:8.3f}s total {elapsed / device_count * 1e6:10.1f} µs/render")
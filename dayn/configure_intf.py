@@ -21,9 +21,16 @@ IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
 
-from ncclient import manager
-import yaml
-import jinja2
+import os
+import sys
+from pathlib import Path
+from deploy_pipeline import FAILED, PUSHED, run_pipeline
+from push_manifest import PushManifest
+from sot_loader import load_sot, open_sot
+from netops.delta import minimal_edit_config
+from netops.sessions import netconf_session
+from netops.snapshots import SNAPSHOTS
+from netops.templates import TemplateRegistry
 
 __author__ = "Juulia Santala"
 __email__ = "jusantal@cisco.com"
@@ -32,15 +39,16 @@ __license__ = "Cisco Sample Code License, Version 1.1"
 
 
 def read_configuration_template(config_file):
-    with open(config_file, encoding="utf-8") as my_values:
-        config = yaml.safe_load(my_values.read())
+    # Parsed SoT is cached next to the YAML file until the YAML changes
+    config = load_sot(config_file)
     return config
 
-def render_template(interfaces, template_name):
-    with open(template_name, encoding="utf-8") as my_template:
-        template = jinja2.Template(my_template.read())
+# Templates are compiled once and their bytecode is cached between runs in
+# .jinja_cache next to this script, created on the first render
+TEMPLATES = TemplateRegistry(search_path=Path(__file__).resolve().parent)
 
-    configuration = template.render(interfaces=interfaces)
+def render_template(interfaces, template_name):
+    configuration = TEMPLATES.render(template_name, interfaces=interfaces)
     return configuration
 
 def configure_ipv6_on_intf(device_ip,
@@ -48,7 +56,13 @@ def configure_ipv6_on_intf(device_ip,
                            password,
                            configuration,
                            port=830,
-                           verify=False):
+                           verify=False,
+                           diff=False):
+    '''
+    Configure IPv6 on the device's GigabitEthernet interfaces. With diff=True
+    the running configuration is read first and only the changed leaves are
+    sent, or nothing at all when the device already matches.
+    '''
 
     print(f"\nConnecting to device {device_ip}...", end=" ")
 
@@ -62,9 +76,16 @@ def configure_ipv6_on_intf(device_ip,
 
     payload = configuration
 
-    with manager.connect(**device, device_params={"name":"iosxe"},timeout=10) as connection:
+    with netconf_session(**device) as connection, SNAPSHOTS.writing(device_ip):
         print("success!")
-        response = connection.edit_config(target="running", config=payload)
+        if diff:
+            response, delta = minimal_edit_config(connection, payload)
+            if response is None:
+                print("Running configuration already matches, no edit-config sent")
+                return
+            print(f"Sending {len(delta)} of {len(payload)} payload bytes")
+        else:
+            response = connection.edit_config(target="running", config=payload)
         print(response)
 
 if __name__ == "__main__":
@@ -74,9 +95,49 @@ if __name__ == "__main__":
         "username": "developer"
     }
 
-    config_values = read_configuration_template("sot.yaml")
-
-    for values in config_values.values():
-        config = render_template(values["interfaces"], "interface_template.j2")
-        configure_ipv6_on_intf(values["mgmt"], credentials["username"], credentials["password"],
-                               config)
+    # Devices are read from the SoT cache one at a time
+    config_values = open_sot("sot.yaml")
+
+    # Only devices whose SoT entry or rendered configuration changed since the
+    # last successful push are configured. Set FULL_PUSH=1 to push to all.
+    manifest = PushManifest("push_manifest.json")
+    full_push = os.environ.get("FULL_PUSH") == "1"
+    failed = []
+
+    def unchanged(device):
+        return not full_push and not manifest.needs_push(device.name, device.sot_hash,
+                                                         device.payload_hash)
+
+    # Set to True to read the running configuration first and send only the
+    # leaves that differ
+    diff = False
+
+    def push(device):
+        configure_ipv6_on_intf(device.values["mgmt"], credentials["username"],
+                               credentials["password"], device.payload, diff=diff)
+
+    # Payloads are rendered on one thread while up to push_workers devices
+    # are configured at the same time; results are printed as devices finish
+    try:
+        for result in run_pipeline(config_values.iter_items(), push, "interface_template.j2",
+                                   skip=unchanged, registry=TEMPLATES, push_workers=8):
+            print(result.output, end="")
+            if result.status == PUSHED:
+                print(f"\n{result.name}: pushed in {result.elapsed:.2f}s")
+                manifest.record(result.name, result.device.sot_hash, result.device.payload_hash,
+                                succeeded=True)
+            elif result.status == FAILED:
+                print(f"\n{result.name}: failed! {result.error}")
+                failed.append(result.name)
+                manifest.record(result.name, result.device.sot_hash, result.device.payload_hash,
+                                succeeded=False)
+            else:
+                print(f"\n{result.name}: no changes since the last push, skipping")
+
+        manifest.prune(config_values)
+    finally:
+        manifest.save()
+
+    if failed:
+        print(f"\nPush failed on: {', '.join(failed)}")
+        sys.exit(1)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for overlapping template rendering and NETCONF pushes:
+payloads are rendered on one thread while a pool of worker threads pushes
+the already rendered ones, with a bounded queue in between.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from push_manifest import hash_payload, hash_sot_entry
+from netops.fleet import ThreadOutput
+from netops.templates import TemplateRegistry
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+PUSHED = "pushed"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+_DONE = object()
+
+# How often a blocked stage checks whether the pipeline was stopped
+_POLL_INTERVAL = 0.1
+
+
+class RenderedDevice:
+    '''
+    One device's SoT values with the payload rendered from them.
+    '''
+    __slots__ = ("name", "values", "payload", "sot_hash", "payload_hash")
+
+    def __init__(self, name, values, payload, sot_hash, payload_hash):
+        self.name = name
+        self.values = values
+        self.payload = payload
+        self.sot_hash = sot_hash
+        self.payload_hash = payload_hash
+
+
+class PushResult:
+    '''
+    Outcome of one device in the pipeline: pushed, skipped or failed, with
+    the printed output of the push and how long it took.
+    '''
+    __slots__ = ("device", "status", "error", "output", "elapsed")
+
+    def __init__(self, device:RenderedDevice, status:str, error=None, output:str="",
+                 elapsed:float=0.0):
+        self.device = device
+        self.status = status
+        self.error = error
+        self.output = output
+        self.elapsed = elapsed
+
+    @property
+    def name(self)->str:
+        return self.device.name
+
+
+def render_device(name, values, template_name:str, registry:TemplateRegistry)->RenderedDevice:
+    '''
+    Render one device's payload.
+    '''
+    payload = registry.render(template_name, interfaces=values["interfaces"])
+    return RenderedDevice(name, values, payload, hash_sot_entry(values), hash_payload(payload))
+
+
+def _put(rendered, item, stop)->bool:
+    '''
+    Put item on the bounded queue, waiting while it is full. Gives up and
+    returns False when the pipeline is stopped in the meantime.
+    '''
+    while not stop.is_set():
+        try:
+            rendered.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _render_stage(devices, template_name, registry, rendered, results, push_workers, stop):
+    '''
+    Render the devices one after the other and put each on the bounded
+    queue. A render takes microseconds, so one thread keeps up with the push
+    workers; while the queue is full rendering pauses until they catch up.
+    '''
+    try:
+        for name, values in devices:
+            try:
+                device = render_device(name, values, template_name, registry)
+            except Exception as err:
+                results.put(PushResult(RenderedDevice(name, values, None, None, None),
+                                       FAILED, error=err))
+                continue
+            if not _put(rendered, device, stop):
+                return
+    finally:
+        for _ in range(push_workers):
+            _put(rendered, _DONE, stop)
+
+
+def _push_stage(push, skip, output, rendered, results, stop):
+    '''
+    Push rendered devices until the render stage is done or the pipeline is
+    stopped. A device whose skip check or push raises is reported as
+    failed, and _DONE is always sent at the end so that run_pipeline() never
+    waits for a dead worker.
+    '''
+    try:
+        while not stop.is_set():
+            try:
+                device = rendered.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if device is _DONE:
+                return
+            started = time.perf_counter()
+            try:
+                if skip is not None and skip(device):
+                    results.put(PushResult(device, SKIPPED))
+                    continue
+                _, error, captured = output.capture(push, device)
+            except Exception as err:
+                error, captured = err, ""
+            results.put(PushResult(device, PUSHED if error is None else FAILED, error=error,
+                                   output=captured, elapsed=time.perf_counter() - started))
+    finally:
+        results.put(_DONE)
+
+
+def run_pipeline(devices, push, template_name:str, skip=None, registry:TemplateRegistry=None,
+                 push_workers:int=8, queue_size:int=32):
+    '''
+    Render and push every (name, values) pair in devices, yielding a
+    PushResult per device as soon as that device is done.
+
+    push(rendered_device) is called from one of push_workers threads; its
+    prints are captured into the result. When skip(rendered_device) returns
+    True the device is not pushed. At most queue_size rendered payloads wait
+    for a push worker at any time. Templates are rendered with registry, or
+    with a registry over this script's directory when it is None.
+
+    When the caller stops iterating, no more devices are rendered or pushed;
+    pushes already running finish in the background.
+    '''
+    registry = registry or TemplateRegistry(search_path=Path(__file__).resolve().parent)
+    rendered = queue.Queue(maxsize=queue_size)
+    results = queue.Queue()
+    stop = threading.Event()
+    output = ThreadOutput(sys.stdout)
+    original_stdout = sys.stdout
+    sys.stdout = output
+
+    threads = [threading.Thread(target=_render_stage, daemon=True,
+                                args=(devices, template_name, registry, rendered, results,
+                                      push_workers, stop))]
+    threads += [threading.Thread(target=_push_stage, daemon=True,
+                                 args=(push, skip, output, rendered, results, stop))
+                for _ in range(push_workers)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        running = push_workers
+        while running:
+            result = results.get()
+            if result is _DONE:
+                running -= 1
+            else:
+                yield result
+    finally:
+        # Wakes up the stages when the caller stopped early, and drops the
+        # devices that were rendered but not pushed
+        stop.set()
+        while True:
+            try:
+                rendered.get_nowait()
+            except queue.Empty:
+                break
+        sys.stdout = original_stdout
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for validating all IPv6 addresses of the SoT at once:
+addresses and neighbor discovery prefixes are packed into NumPy arrays of
+two 64-bit halves, and validity and prefix membership are checked with
+vectorized masks instead of one ipaddress object per address.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import ipaddress
+import socket
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+# Stand-in for addresses that do not parse, so that every row has 16 bytes
+_INVALID = bytes(16)
+_ALL_ONES = 0xFFFFFFFFFFFFFFFF
+
+
+def available()->bool:
+    '''
+    True when NumPy is installed and bulk validation can be used.
+    '''
+    return np is not None
+
+
+def _pack(address:str):
+    '''
+    Return (16 address bytes, prefix length or None, True if valid).
+    '''
+    host, _, length = address.partition("/")
+    try:
+        packed = socket.inet_pton(socket.AF_INET6, host)
+    except (OSError, ValueError):
+        return _INVALID, 0, False
+    if not length:
+        return packed, 128, True
+    if not length.isdigit() or int(length) > 128:
+        return _INVALID, 0, False
+    return packed, int(length), True
+
+
+def _to_halves(packed:list):
+    ''' (n, 2) uint64 array of the high and low half of each address. '''
+    return np.frombuffer(b"".join(packed), dtype=">u8").reshape(-1, 2).astype(np.uint64)
+
+
+def _masks(lengths):
+    '''
+    (n, 2) uint64 array of network masks for the given prefix lengths.
+    Shifting a 64-bit integer by 64 is undefined, so whole halves are
+    selected with where() instead.
+    '''
+    lengths = lengths.astype(np.int64)
+    masks = np.zeros((len(lengths), 2), dtype=np.uint64)
+    ones = np.uint64(_ALL_ONES)
+    for column, bits in enumerate((np.clip(lengths, 0, 64), np.clip(lengths - 64, 0, 64))):
+        shift = (64 - bits).astype(np.uint64)
+        partial = ones << np.minimum(shift, 63).astype(np.uint64)
+        masks[:, column] = np.where(bits == 0, np.uint64(0),
+                                    np.where(bits == 64, ones, partial))
+    return masks
+
+
+def _prefix_error(subnet:str)->str:
+    ''' What ipaddress says is wrong with an invalid prefix. '''
+    try:
+        ipaddress.IPv6Network(subnet)
+    except ValueError as err:
+        return str(err)
+    return "invalid prefix"
+
+
+class BulkResult:
+    '''
+    Outcome of validate_sot(). rows holds one (device, interface number,
+    address, nd_prefix) tuple per address; valid_address, valid_prefix and
+    in_prefix are boolean arrays in the same order.
+    '''
+    __slots__ = ("rows", "valid_address", "valid_prefix", "in_prefix")
+
+    def __init__(self, rows, valid_address, valid_prefix, in_prefix):
+        self.rows = rows
+        self.valid_address = valid_address
+        self.valid_prefix = valid_prefix
+        self.in_prefix = in_prefix
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def ok(self)->bool:
+        return bool(np.all(self.valid_address & self.valid_prefix & self.in_prefix))
+
+    def failures(self):
+        '''
+        Yield (device, interface, address, nd_prefix, reason) for every
+        address that failed a check.
+        '''
+        failed = ~(self.valid_address & self.valid_prefix & self.in_prefix)
+        for index in np.flatnonzero(failed):
+            device, interface, address, subnet = self.rows[index]
+            if not self.valid_address[index]:
+                reason = f"{address} is not a valid ip address"
+            elif not self.valid_prefix[index]:
+                reason = f"{subnet} is not a valid IPv6 prefix: {_prefix_error(subnet)}"
+            else:
+                reason = f"{address} NOT in {subnet}"
+            yield device, interface, address, subnet, reason
+
+
+def validate_addresses(rows)->BulkResult:
+    '''
+    Validate (device, interface, address, nd_prefix) rows: each address must
+    be a valid IPv6 address and lie inside its nd_prefix, and the nd_prefix
+    must be a valid prefix without host bits set.
+    '''
+    if np is None:
+        raise RuntimeError("Bulk validation needs NumPy, install it with 'pip install numpy'")
+
+    rows = list(rows)
+    packed_addresses, packed_prefixes, lengths = [], [], []
+    valid_address = np.empty(len(rows), dtype=bool)
+    valid_prefix = np.empty(len(rows), dtype=bool)
+
+    # Parsing is the only per-address Python work; the same nd_prefix is
+    # usually shared by all addresses of an interface, so it is parsed once
+    parsed_prefixes = {}
+    for index, (_, _, address, subnet) in enumerate(rows):
+        packed, _, valid_address[index] = _pack(address)
+        packed_addresses.append(packed)
+        if subnet not in parsed_prefixes:
+            parsed_prefixes[subnet] = _pack(subnet)
+        packed, length, valid_prefix[index] = parsed_prefixes[subnet]
+        packed_prefixes.append(packed)
+        lengths.append(length)
+
+    if not rows:
+        empty = np.zeros(0, dtype=bool)
+        return BulkResult(rows, empty, empty, empty)
+
+    addresses = _to_halves(packed_addresses)
+    prefixes = _to_halves(packed_prefixes)
+    masks = _masks(np.asarray(lengths))
+    # Like ipaddress.IPv6Network(), a prefix with host bits set is not valid
+    valid_prefix &= np.all((prefixes & ~masks) == 0, axis=1)
+    in_prefix = np.all((addresses & masks) == (prefixes & masks), axis=1)
+    return BulkResult(rows, valid_address, valid_prefix, in_prefix)
+
+
+def sot_rows(config:dict):
+    '''
+    Yield a (device, interface, address, nd_prefix) row for every IPv6
+    address in the SoT. Interfaces without addresses or nd_prefix are
+    skipped, like in the per-interface test.
+    '''
+    for device, values in config.items():
+        for interface in values.get("interfaces") or []:
+            addresses = interface.get("ipv6_address")
+            subnet = interface.get("nd_prefix")
+            if not addresses or not subnet:
+                continue
+            for address in addresses:
+                yield device, interface.get("number"), str(address), str(subnet)
+
+
+def validate_sot(config:dict)->BulkResult:
+    return validate_addresses(sot_rows(config))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper with stand-in devices for trying out the concurrent
+ping mode without a lab: each mock device answers ping() after a delay with
+IOS XE style output, and can lose packets or fail for chosen destinations.
+MockTestbed can be passed to test_ping.py as its testbed parameter.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import random
+import threading
+import time
+from ping_runner import run_pings
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+
+class MockPingDevice:
+    '''
+    Device with a ping() like the pyATS one. Each ping takes duration
+    seconds; loss maps a destination to the fraction of packets lost and
+    unreachable destinations raise an exception, like a failed ping does.
+    '''
+
+    def __init__(self, hostname:str, duration:float=0.5, rtt:int=2, loss:dict=None,
+                 unreachable=(), count:int=5):
+        self.hostname = hostname
+        self.duration = duration
+        self.rtt = rtt
+        self.loss = loss or {}
+        self.unreachable = set(unreachable)
+        self.count = count
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def ping(self, destination:str)->str:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.duration)
+            if destination in self.unreachable:
+                raise RuntimeError(f"Ping {destination} failed\nSuccess rate is 0 percent "
+                                   f"(0/{self.count})")
+            received = round(self.count * (1 - self.loss.get(destination, 0.0)))
+            output = (f"Type escape sequence to abort.\nSending {self.count}, 100-byte ICMP Echos "
+                      f"to {destination}, timeout is 2 seconds:\n"
+                      f"{'!' * received}{'.' * (self.count - received)}\n"
+                      f"Success rate is {100 * received // self.count} percent "
+                      f"({received}/{self.count})")
+            if received:
+                low, high = max(1, self.rtt - 1), self.rtt + random.randint(1, 3)
+                output += f", round-trip min/avg/max = {low}/{self.rtt}/{high} ms"
+            return output
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class MockTestbed:
+    '''
+    Just enough of a pyATS testbed for test_ping.py: iterating over it gives
+    the devices, and connect() and disconnect() do nothing.
+    '''
+
+    def __init__(self, devices):
+        self.devices = {device.hostname: device for device in devices}
+
+    def __iter__(self):
+        return iter(self.devices.values())
+
+    def connect(self, **kwargs):
+        pass
+
+    def disconnect(self):
+        pass
+
+if __name__ == "__main__":
+
+    destinations = ["8.8.8.8", "2001:4860:4860::8888", "198.18.133.101", "198.18.11.2"]
+    devices = [MockPingDevice(f"R{number}", duration=0.2,
+                              loss={"8.8.8.8": 0.2} if number == 2 else None,
+                              unreachable={"198.18.11.2"} if number == 3 else ())
+               for number in range(1, 6)]
+
+    started = time.perf_counter()
+    results = sorted(run_pings(devices, destinations, per_device_limit=2),
+                     key=lambda result: (result.device, result.destination))
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        status = "ok" if result.ok else "FAILED"
+        print(f"{result.device} -> {result.destination}: {status}, {result.statistics()}")
+
+    sequential = sum(result.elapsed for result in results)
+    print(f"\n{len(results)} pings in {elapsed:.2f}s, one after another they would take "
+          f"{sequential:.2f}s")
+    print(f"Most pings in parallel on one device: {max(device.max_active for device in devices)}")
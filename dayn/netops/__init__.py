@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Shared helpers for running the NETCONF sample scripts against many devices.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import importlib
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+__all__ = [
+    "DeviceResult",
+    "DeviceSubscription",
+    "DriftReport",
+    "FleetView",
+    "InterfaceOper",
+    "POOL",
+    "PipelineResult",
+    "RateLimitScheduler",
+    "RpcPipeline",
+    "RunningHashCache",
+    "SNAPSHOTS",
+    "SessionPool",
+    "SnapshotCache",
+    "ThreadOutput",
+    "audit_device",
+    "compare_trees",
+    "config_delta",
+    "interface_trees",
+    "iter_interfaces_oper",
+    "iter_json_items",
+    "minimal_edit_config",
+    "netconf_session",
+    "parse_interfaces_oper",
+    "push_fleet",
+    "run_on_fleet",
+    "selection_filter",
+    "sot_commands",
+    "subscribe_fleet",
+]
+
+# Name exported from the package -> submodule it is defined in. The
+# submodules are imported on first use, so that importing one helper does
+# not import the dependencies of all the others.
+_EXPORTS = {
+    "DeviceResult": "netops.fleet",
+    "DeviceSubscription": "netops.subscriptions",
+    "DriftReport": "netops.drift",
+    "FleetView": "netops.subscriptions",
+    "InterfaceOper": "netops.oper",
+    "POOL": "netops.sessions",
+    "PipelineResult": "netops.pipeline",
+    "RateLimitScheduler": "netops.rate_limit",
+    "RpcPipeline": "netops.pipeline",
+    "RunningHashCache": "netops.drift",
+    "SNAPSHOTS": "netops.snapshots",
+    "SessionPool": "netops.sessions",
+    "SnapshotCache": "netops.snapshots",
+    "ThreadOutput": "netops.fleet",
+    "audit_device": "netops.drift",
+    "compare_trees": "netops.drift",
+    "config_delta": "netops.delta",
+    "interface_trees": "netops.drift",
+    "iter_interfaces_oper": "netops.oper",
+    "iter_json_items": "netops.json_stream",
+    "minimal_edit_config": "netops.delta",
+    "netconf_session": "netops.sessions",
+    "parse_interfaces_oper": "netops.oper",
+    "push_fleet": "netops.netmiko_bulk",
+    "run_on_fleet": "netops.fleet",
+    "selection_filter": "netops.delta",
+    "sot_commands": "netops.netmiko_bulk",
+    "subscribe_fleet": "netops.subscriptions",
+}
+
+
+def __getattr__(name:str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for sending only the part of a NETCONF <config>
+payload that differs from the device's running configuration.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import copy
+import ipaddress
+from lxml import etree
+from netops.timing import PARSE, timed
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+NETCONF_NS = "urn:ietf:params:xml:ns:netconf:base:1.0"
+OPERATION = f"{{{NETCONF_NS}}}operation"
+
+NATIVE_NS = "http://cisco.com/ns/yang/Cisco-IOS-XE-native"
+ND_NS = "http://cisco.com/ns/yang/Cisco-IOS-XE-nd"
+OSPFV3_NS = "http://cisco.com/ns/yang/Cisco-IOS-XE-ospfv3"
+
+# Key leaves of the YANG lists used in the sample payloads, by (namespace,
+# name). Elements matching these are list entries and are matched against
+# the running configuration by their keys; everything else is matched by
+# name. A container of another module that happens to share a list's name
+# is not mistaken for that list.
+LIST_KEYS = {
+    (NATIVE_NS, "GigabitEthernet"): ("name",),
+    (OSPFV3_NS, "process"): ("id",),
+    (NATIVE_NS, "prefix-list"): ("prefix",),
+    (ND_NS, "ipv6-prefix-list"): ("ipv6-prefix",),
+}
+
+
+_PARSER = etree.XMLParser(remove_blank_text=True)
+
+
+def parse_xml(xml)->etree._Element:
+    return etree.fromstring(xml.encode("utf-8") if isinstance(xml, str) else xml, _PARSER)
+
+
+def local_name(element)->str:
+    return etree.QName(element).localname
+
+
+def list_keys(element)->tuple:
+    name = etree.QName(element)
+    return LIST_KEYS.get((name.namespace, name.localname), ())
+
+
+def normalize_value(text):
+    '''
+    Compare leaf values the way the device stores them: IOS XE shows IPv6
+    addresses and prefixes in upper case and compressed, the SoT may not.
+    '''
+    text = (text or "").strip()
+    try:
+        if "/" in text:
+            return str(ipaddress.ip_interface(text))
+        return str(ipaddress.ip_address(text))
+    except ValueError:
+        return text
+
+
+def key_values(element)->tuple:
+    ''' Normalized values of the key leaves of a list entry, empty for other elements. '''
+    values = []
+    for key in list_keys(element):
+        child = next((c for c in element if local_name(c) == key), None)
+        values.append(normalize_value(child.text) if child is not None else None)
+    return tuple(values)
+
+
+def find_match(desired, running_parent):
+    ''' The child of running_parent that is the same node, or list entry, as desired. '''
+    if running_parent is None:
+        return None
+    for candidate in running_parent:
+        if candidate.tag == desired.tag and key_values(candidate) == key_values(desired):
+            return candidate
+    return None
+
+
+def _shell(element):
+    ''' Copy of element without text or children. '''
+    return etree.Element(element.tag, attrib=dict(element.attrib), nsmap=element.nsmap)
+
+
+def _diff(desired, running):
+    '''
+    Return the part of desired that is missing from or different in running,
+    or None when running already matches.
+    '''
+    if running is None:
+        created = copy.deepcopy(desired)
+        created.set(OPERATION, "create")
+        return created
+
+    if len(desired) == 0:
+        if normalize_value(desired.text) == normalize_value(running.text):
+            return None
+        replaced = copy.deepcopy(desired)
+        replaced.set(OPERATION, "replace")
+        return replaced
+
+    key_names = list_keys(desired)
+    changes = []
+    for child in desired:
+        if local_name(child) in key_names:
+            continue
+        change = _diff(child, find_match(child, running))
+        if change is not None:
+            changes.append(change)
+    if not changes:
+        return None
+
+    delta = _shell(desired)
+    for child in desired:
+        if local_name(child) in key_names:
+            delta.append(copy.deepcopy(child))
+    delta.extend(changes)
+    return delta
+
+
+def _selection(element):
+    shell = _shell(element)
+    key_names = list_keys(element)
+    if key_names:
+        # A list entry with only its keys selects the whole entry
+        for child in element:
+            if local_name(child) in key_names:
+                shell.append(copy.deepcopy(child))
+        return shell
+    for child in element:
+        shell.append(_selection(child))
+    return shell
+
+
+def selection_filter(payload:str)->str:
+    '''
+    Subtree filter that retrieves from the running configuration every node
+    that the <config> payload touches.
+    '''
+    root = parse_xml(payload)
+    return "".join(etree.tostring(_selection(child), encoding="unicode") for child in root)
+
+
+def config_delta(payload:str, running_data)->str:
+    '''
+    Compare a <config> payload with the <data> element returned by
+    get-config and return a <config> payload with only the changed leaves,
+    or None when nothing needs to be sent.
+
+    New subtrees are sent with operation="create" and changed leaves with
+    operation="replace". List keys are always kept so that the device can
+    locate the entries. Nothing is deleted, just like the full payload,
+    which is merged into the running configuration.
+    '''
+    desired = parse_xml(payload)
+    if isinstance(running_data, (str, bytes)):
+        running_data = parse_xml(running_data)
+
+    changes = [change for change in (_diff(child, find_match(child, running_data))
+                                     for child in desired) if change is not None]
+    if not changes:
+        return None
+
+    delta = etree.Element(desired.tag, nsmap={**(desired.nsmap or {}), "nc": NETCONF_NS})
+    delta.extend(changes)
+    return etree.tostring(delta, encoding="unicode")
+
+
+def minimal_edit_config(connection, payload:str, target:str="running"):
+    '''
+    Fetch the running configuration touched by payload, send an edit-config
+    with only the differences, and return (reply, delta). reply is None and
+    no RPC is sent when the device already matches.
+    '''
+    running = connection.get_config(source=target, filter=("subtree", selection_filter(payload)))
+    with timed(PARSE, getattr(connection, "timing_device", None), "config-delta"):
+        delta = config_delta(payload, running.data_ele)
+    if delta is None:
+        return None, None
+    return connection.edit_config(target=target, config=delta), delta
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for auditing configuration drift: the desired
+<config> payload and the running configuration are both turned into hash
+trees, and only the subtrees whose hashes differ are compared leaf by leaf.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from netops.delta import list_keys, local_name, normalize_value, parse_xml, selection_filter
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+MISSING = "missing"
+UNEXPECTED = "unexpected"
+CHANGED = "changed"
+
+# Bump when the hashing changes so that old cache files are not used
+CACHE_VERSION = 2
+
+
+class HashNode:
+    '''
+    One node of a hash tree. name identifies the node among its siblings:
+    the element name, plus the key values for list entries. digest covers
+    the node's value and, order independently, all of its children.
+    '''
+    __slots__ = ("name", "value", "children", "digest")
+
+    def __init__(self, name:str, value=None, children:dict=None):
+        self.name = name
+        self.value = value
+        self.children = children or {}
+        self.digest = combine(name, value, (child.digest for child in self.children.values()))
+
+    def __repr__(self):
+        return f"HashNode({self.name!r}, {self.digest.hex()[:12]})"
+
+    def to_json(self)->list:
+        return [self.name, self.value, [child.to_json() for child in self.children.values()]]
+
+    @classmethod
+    def from_json(cls, data:list):
+        name, value, children = data
+        nodes = [cls.from_json(child) for child in children]
+        return cls(name, value, {node.name: node for node in nodes})
+
+
+def combine(name:str, value, digests)->bytes:
+    digest = hashlib.sha256(name.encode("utf-8"))
+    digest.update(b"\0" + (value or "").encode("utf-8") + b"\0")
+    for child in sorted(digests):
+        digest.update(child)
+    return digest.digest()
+
+
+def build_tree(element)->HashNode:
+    '''
+    Hash tree of an XML element. Key leaves of list entries are part of the
+    entry's name rather than separate children.
+    '''
+    key_names = list_keys(element)
+    name = local_name(element)
+    if key_names:
+        keys = [normalize_value(child.text) for child in element if local_name(child) in key_names]
+        name = f"{name}[{','.join(keys)}]"
+
+    # Leaf-lists repeat the same element name with different values. Every
+    # entry is named after its value, so the names do not depend on the order
+    # the values come in.
+    counts = {}
+    for child in element:
+        if len(child) == 0:
+            counts[local_name(child)] = counts.get(local_name(child), 0) + 1
+
+    children = {}
+    for child in element:
+        if local_name(child) in key_names:
+            continue
+        node = build_tree(child)
+        if len(child) == 0 and counts[local_name(child)] > 1:
+            node = HashNode(f"{node.name}={node.value}", node.value, node.children)
+        children[node.name] = node
+
+    value = None if children else normalize_value(element.text)
+    return HashNode(name, value, children)
+
+
+def interface_trees(xml)->dict:
+    '''
+    Hash trees of the interface list entries (the children of
+    native/interface) in a <config> payload or get-config <data> reply,
+    keyed by entry name, e.g. "GigabitEthernet[4]".
+    '''
+    root = parse_xml(xml) if isinstance(xml, (str, bytes)) else xml
+    trees = {}
+    for container in root.iter("{*}interface"):
+        if container.getparent() is None or local_name(container.getparent()) != "native":
+            continue
+        for entry in container:
+            node = build_tree(entry)
+            trees[node.name] = node
+    return trees
+
+
+def _list_name(name:str)->str:
+    # Element name of a node, without the key or value of a list entry
+    return name.split("[", 1)[0].split("=", 1)[0]
+
+
+def managed_children(desired:HashNode, running:HashNode)->dict:
+    '''
+    Children of running that desired manages: the ones desired sets, and
+    every entry of the lists and leaf-lists desired sets, so that an extra
+    entry in a managed list is still drift.
+    '''
+    managed = {_list_name(name) for name in desired.children}
+    return {name: child for name, child in running.children.items()
+            if _list_name(name) in managed}
+
+
+def managed_digest(desired:HashNode, running:HashNode)->bytes:
+    '''
+    Digest of running limited, at every level, to the children that desired
+    sets. The SoT only manages part of each interface (its description and
+    IPv6 configuration); other settings on the device are not drift, also
+    when they are nested under a container the SoT manages.
+    '''
+    if not desired.children:
+        return running.digest
+    return combine(running.name, running.value,
+                   (managed_digest(desired.children[name], child) if name in desired.children
+                    else child.digest
+                    for name, child in managed_children(desired, running).items()))
+
+
+def _compare(desired:HashNode, running:HashNode, path:str, drift:list):
+    if desired.digest == managed_digest(desired, running):
+        return
+    if not desired.children and not running.children:
+        drift.append((CHANGED, path, desired.value, running.value))
+        return
+    managed = managed_children(desired, running) if desired.children else running.children
+    for name, child in desired.children.items():
+        if name not in managed:
+            drift.append((MISSING, f"{path}/{name}", child.value, None))
+        else:
+            _compare(child, managed[name], f"{path}/{name}", drift)
+    for name, child in managed.items():
+        if name not in desired.children:
+            drift.append((UNEXPECTED, f"{path}/{name}", None, child.value))
+
+
+class DriftReport:
+    '''
+    Drift of one device: a list of (kind, path, SoT value, running value)
+    tuples, where kind is MISSING, UNEXPECTED or CHANGED.
+    '''
+    __slots__ = ("device", "interfaces", "drift", "cached")
+
+    def __init__(self, device, interfaces:int, drift:list, cached:bool=False):
+        self.device = device
+        self.interfaces = interfaces
+        self.drift = drift
+        self.cached = cached
+
+    @property
+    def in_sync(self)->bool:
+        return not self.drift
+
+    def summary(self)->str:
+        if self.in_sync:
+            return f"{self.device}: in sync ({self.interfaces} interfaces)"
+        drifted = len({path.split("/", 1)[0] for _, path, _, _ in self.drift})
+        lines = [f"{self.device}: {drifted} of {self.interfaces} interfaces drifted"]
+        for kind, path, sot_value, running_value in self.drift:
+            if kind == CHANGED:
+                lines.append(f"  {kind:<10} {path}: SoT {sot_value!r}, running {running_value!r}")
+            else:
+                lines.append(f"  {kind:<10} {path}")
+        return "\n".join(lines)
+
+
+def compare_trees(device, desired:dict, running:dict, cached:bool=False)->DriftReport:
+    '''
+    Compare interface hash trees from interface_trees(). The device level
+    digests are compared first, then each interface, and only interfaces
+    whose digests differ are walked.
+    '''
+    running_digests = {name: managed_digest(node, running[name])
+                       for name, node in desired.items() if name in running}
+    desired_root = combine("", None, (node.digest for node in desired.values()))
+    running_root = combine("", None, running_digests.values())
+    if desired_root == running_root and len(running_digests) == len(desired):
+        return DriftReport(device, len(desired), [], cached)
+
+    drift = []
+    for name, node in desired.items():
+        if name not in running:
+            drift.append((MISSING, name, None, None))
+        elif node.digest != running_digests[name]:
+            _compare(node, running[name], name, drift)
+    return DriftReport(device, len(desired), drift, cached)
+
+
+class RunningHashCache:
+    '''
+    Running configuration hash trees of each device, keyed by a hash of the
+    get-config reply so that an unchanged configuration is not parsed and
+    hashed again. With a path, the cache is kept on disk between audits as
+    JSON, and the digests are computed again when it is loaded, so a cache
+    file cannot inject code or trees whose digests do not match them.
+    '''
+
+    def __init__(self, path:str=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.devices = {}
+        if path:
+            try:
+                with open(path, encoding="utf-8") as cache_file:
+                    cached = json.load(cache_file)
+                if cached.get("version") == CACHE_VERSION:
+                    self.devices = {
+                        device: (bytes.fromhex(reply_hash),
+                                 {name: HashNode.from_json(tree) for name, tree in trees.items()})
+                        for device, (reply_hash, trees) in cached["devices"].items()}
+            except (OSError, ValueError, TypeError, KeyError, AttributeError):
+                self.devices = {}
+
+    def trees(self, device, running_xml):
+        '''
+        Return (interface trees, True if they came from the cache).
+        '''
+        if isinstance(running_xml, str):
+            running_xml = running_xml.encode("utf-8")
+        reply_hash = hashlib.sha256(running_xml).digest()
+        with self.lock:
+            entry = self.devices.get(device)
+        if entry is not None and entry[0] == reply_hash:
+            return entry[1], True
+
+        trees = interface_trees(running_xml)
+        with self.lock:
+            self.devices[device] = (reply_hash, trees)
+        return trees, False
+
+    def prune(self, devices):
+        keep = set(devices)
+        with self.lock:
+            for device in list(self.devices):
+                if device not in keep:
+                    del self.devices[device]
+
+    def save(self):
+        if not self.path:
+            return
+        with self.lock:
+            cached = {"version": CACHE_VERSION,
+                      "devices": {device: [reply_hash.hex(),
+                                           {name: tree.to_json() for name, tree in trees.items()}]
+                                  for device, (reply_hash, trees) in self.devices.items()}}
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as cache_file:
+            json.dump(cached, cache_file)
+        os.replace(temporary, self.path)
+
+
+def audit_device(connection, device, payload:str, cache:RunningHashCache=None,
+                 source:str="running")->DriftReport:
+    '''
+    Read the part of the configuration that payload touches and report how
+    it differs from payload.
+    '''
+    cache = cache if cache is not None else RunningHashCache()
+    reply = connection.get_config(source=source, filter=("subtree", selection_filter(payload)))
+    running, cached = cache.trees(device, reply.data_xml)
+    return compare_trees(device, interface_trees(payload), running, cached)
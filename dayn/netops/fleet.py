@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for running a per-device function concurrently on
+a fleet of devices.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+
+class DeviceResult:
+    '''
+    Outcome of running one function against one device: the return value or
+    the raised exception, and everything the function printed.
+    '''
+    __slots__ = ("device", "result", "error", "output")
+
+    def __init__(self, device, result=None, error=None, output=""):
+        self.device = device
+        self.result = result
+        self.error = error
+        self.output = output
+
+    @property
+    def ok(self)->bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"DeviceResult({self.device!r}, {status})"
+
+
+class ThreadOutput(io.TextIOBase):
+    '''
+    Stand-in for sys.stdout that sends prints from fleet worker threads to a
+    per-thread buffer, so that the output of concurrent devices does not mix.
+    Prints from other threads go to the original stream.
+    '''
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is None:
+            return self.stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, function, *args, **kwargs):
+        '''
+        Call function in the current thread with its prints sent to a
+        buffer. Returns (return value, exception or None, captured output).
+        '''
+        self.local.buffer = io.StringIO()
+        result, error = None, None
+        try:
+            result = function(*args, **kwargs)
+        except Exception as err:
+            error = err
+        finally:
+            captured = self.local.buffer.getvalue()
+            self.local.buffer = None
+        return result, error, captured
+
+
+def _run_one(output, function, device, args, kwargs):
+    result, error, captured = output.capture(function, device, *args, **kwargs)
+    return DeviceResult(device, result=result, error=error, output=captured)
+
+
+def run_on_fleet(function, devices, *args, max_workers:int=10, verbose:bool=True, **kwargs):
+    '''
+    Run function(device, *args, **kwargs) for every device in devices, with at
+    most max_workers devices in flight at the same time.
+
+    Returns a list of DeviceResult objects in the same order as devices. When
+    verbose is True, the output of each device is printed in device order as
+    soon as that device and all devices before it have finished.
+    '''
+    devices = list(devices)
+    output = ThreadOutput(sys.stdout)
+    original_stdout = sys.stdout
+    sys.stdout = output
+    results = []
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [executor.submit(_run_one, output, function, device, args, kwargs)
+                       for device in devices]
+            for future in futures:
+                device_result = future.result()
+                results.append(device_result)
+                if verbose:
+                    original_stdout.write(device_result.output)
+                    if not device_result.ok:
+                        original_stdout.write(f"\n{device_result.device}: failed! {device_result.error}\n")
+                    original_stdout.flush()
+    finally:
+        sys.stdout = original_stdout
+
+    return results
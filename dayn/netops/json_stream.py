@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for decoding the items of a JSON array one at a time
+while the HTTP response body is still being received.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import codecs
+import json
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class _Buffer:
+    ''' Text decoded so far from the byte chunks, with a read position. '''
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self)->bool:
+        ''' Drop the consumed text and append the next chunk. False at the end of input. '''
+        if self.eof:
+            return False
+        self.text = self.text[self.pos:]
+        self.pos = 0
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.eof = True
+            self.text += self.decoder.decode(b"", final=True)
+            return True
+        self.text += self.decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return True
+
+    def skip(self, characters:str=WHITESPACE)->str:
+        ''' Skip the given characters and return the next one, or "" at the end of input. '''
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in characters:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, character:str):
+        if self.skip() != character:
+            raise ValueError(f"Expected {character!r} at offset {self.pos} of the JSON document")
+        self.pos += 1
+
+    def value(self):
+        '''
+        Decode the next complete JSON value. A value that ends exactly at the
+        end of the buffered text could be a truncated number, so more input is
+        read before accepting it.
+        '''
+        self.skip()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if end == len(self.text) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_items(chunks, key:str="response"):
+    '''
+    Yield the items of the array stored under key in a top-level JSON object,
+    for example the clients of {"response": [...], "page": {...}}.
+
+    chunks is an iterable of bytes or str, such as
+    requests' response.iter_content(). Only the item being decoded and the
+    current chunk are kept in memory. Other top-level keys are skipped.
+    '''
+    buffer = _Buffer(chunks)
+    buffer.expect("{")
+
+    while True:
+        character = buffer.skip(WHITESPACE + ",")
+        if character == "}":
+            return
+        if character == "":
+            raise ValueError("Unexpected end of the JSON document")
+
+        name = buffer.value()
+        buffer.expect(":")
+        if name != key:
+            buffer.value()
+            continue
+
+        buffer.expect("[")
+        while True:
+            character = buffer.skip(WHITESPACE + ",")
+            if character == "]":
+                buffer.pos += 1
+                break
+            if character == "":
+                raise ValueError("Unexpected end of the JSON document")
+            yield buffer.value()
@@ -0,0 +1,652 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper that serves simulated IOS XE devices over real
+NETCONF-over-SSH, so that the scripts can be load tested through ncclient
+on a laptop. Hundreds or thousands of devices run in one process, each on
+its own local port (or its own 127.x.y.z address on Linux), backed by the
+datastores of netops.standin.
+
+The devices also accept YANG-push subscriptions (establish-subscription)
+to interfaces-oper leaves such as ipv6-addrs and oper-status, and send
+notifications for them: periodically, or on every change made with
+edit-config or SimulatedDevice.set_oper_status(). --flap makes a random
+interface go down or come back up every so many seconds, to produce test
+notifications.
+
+Usage, from the dayn directory:
+    python -m netops.netconf_server --devices 500 --latency 0.02 --inventory devices.json
+    python -m netops.netconf_server --devices 4 --flap 5
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import argparse
+import ipaddress
+import itertools
+import json
+import queue
+import random
+import resource
+import selectors
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+import paramiko
+from lxml import etree
+from netops.delta import local_name, parse_xml
+from netops.sessions import connect_iosxe
+from netops.standin import NETCONF_NS, OPER_NS, SimulatedFailure, StandInFleet
+from netops.subscriptions import IETF_EVENT_NS, NOTIFICATION_NS, YANG_PUSH_NS
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+BASE_1_0 = "urn:ietf:params:netconf:base:1.0"
+BASE_1_1 = "urn:ietf:params:netconf:base:1.1"
+CAPABILITIES = [
+    BASE_1_0,
+    BASE_1_1,
+    "urn:ietf:params:netconf:capability:writable-running:1.0",
+    "urn:ietf:params:netconf:capability:xpath:1.0",
+    "urn:ietf:params:netconf:capability:notification:1.0",
+    f"{IETF_EVENT_NS}?module=ietf-event-notifications",
+    f"{YANG_PUSH_NS}?module=ietf-yang-push",
+    "http://cisco.com/ns/yang/Cisco-IOS-XE-native?module=Cisco-IOS-XE-native",
+    "http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper?module=Cisco-IOS-XE-interfaces-oper",
+]
+END_OF_MESSAGE = b"]]>]]>"
+READ_SIZE = 64 * 1024
+
+_session_ids = itertools.count(1)
+# IOS XE numbers dynamic subscriptions from 2^31 up
+_subscription_ids = itertools.count(2147483648)
+
+
+class _Channel:
+    '''
+    NETCONF message framing on an SSH channel: end-of-message markers for
+    base:1.0 and chunked framing once both sides have announced base:1.1.
+    '''
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.buffer = b""
+        self.chunked = False
+        self.write_lock = threading.Lock()
+
+    def _fill(self):
+        data = self.channel.recv(READ_SIZE)
+        if not data:
+            raise EOFError("NETCONF client closed the session")
+        self.buffer += data
+
+    def _take(self, length:int)->bytes:
+        while len(self.buffer) < length:
+            self._fill()
+        data, self.buffer = self.buffer[:length], self.buffer[length:]
+        return data
+
+    def _take_line(self)->bytes:
+        while b"\n" not in self.buffer:
+            self._fill()
+        line, self.buffer = self.buffer.split(b"\n", 1)
+        return line
+
+    def read(self)->bytes:
+        if not self.chunked:
+            while END_OF_MESSAGE not in self.buffer:
+                self._fill()
+            message, self.buffer = self.buffer.split(END_OF_MESSAGE, 1)
+            return message
+
+        chunks = []
+        while True:
+            # Each chunk starts with "\n#<size>\n"; "\n##\n" ends the message
+            while not self.buffer.lstrip(b"\n"):
+                self._fill()
+            self.buffer = self.buffer.lstrip(b"\n")
+            header = self._take_line()
+            if header == b"##":
+                return b"".join(chunks)
+            if not header.startswith(b"#") or not header[1:].isdigit():
+                raise ValueError(f"Invalid NETCONF chunk header {header[:20]!r}")
+            chunks.append(self._take(int(header[1:])))
+
+    def write(self, message:str):
+        data = message.encode("utf-8")
+        if self.chunked:
+            data = b"\n#%d\n" % len(data) + data + b"\n##\n"
+        else:
+            data += END_OF_MESSAGE
+        with self.write_lock:
+            self.channel.sendall(data)
+
+    def close(self):
+        # A read blocked on the channel gets EOFError once it is closed
+        self.channel.close()
+
+
+class _SshServer(paramiko.ServerInterface):
+
+    def __init__(self, username, password):
+        self.username = username
+        self.password = password
+        self.netconf_requested = threading.Event()
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        if self.username is None or (username, password) == (self.username, self.password):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_subsystem_request(self, channel, name):
+        if name != "netconf":
+            return False
+        self.netconf_requested.set()
+        return True
+
+
+class UnsupportedOperation(Exception):
+    '''
+    The client asked for an operation the simulator does not implement,
+    answered with an operation-not-supported rpc-error.
+    '''
+
+
+def _rpc_error(message_id, message:str, tag:str="operation-failed")->str:
+    reply = etree.Element(f"{{{NETCONF_NS}}}rpc-reply", nsmap={None: NETCONF_NS})
+    if message_id is not None:
+        reply.set("message-id", message_id)
+    error = etree.SubElement(reply, f"{{{NETCONF_NS}}}rpc-error")
+    for name, text in (("error-type", "application"), ("error-tag", tag),
+                       ("error-severity", "error"), ("error-message", message)):
+        etree.SubElement(error, f"{{{NETCONF_NS}}}{name}").text = text
+    return etree.tostring(reply, encoding="unicode")
+
+
+def _rpc_reply(message_id, body=None)->str:
+    reply = etree.Element(f"{{{NETCONF_NS}}}rpc-reply", nsmap={None: NETCONF_NS})
+    reply.set("message-id", message_id)
+    if body is None:
+        etree.SubElement(reply, f"{{{NETCONF_NS}}}ok")
+    elif isinstance(body, list):
+        reply.extend(body)
+    else:
+        reply.append(body)
+    return etree.tostring(reply, encoding="unicode")
+
+
+def _filter_of(operation):
+    '''
+    Turn the <filter> of a get or get-config into the (type, criteria)
+    tuple that SimulatedDevice accepts.
+    '''
+    element = next((child for child in operation if local_name(child) == "filter"), None)
+    if element is None:
+        return None
+    if element.get("type", "subtree") == "xpath":
+        return ("xpath", element.get("select", ""))
+    return ("subtree", element)
+
+
+class _Subscription:
+    '''
+    One dynamic YANG-push subscription to a leaf of the interfaces list,
+    e.g. /interfaces-ios-xe-oper:interfaces/interface/ipv6-addrs.
+
+    The first notification is a push-update with the leaf of every
+    interface. A periodic subscription sends a new push-update every
+    period seconds; an on-change one sends a push-change-update with the
+    interfaces whose values changed, at most every dampening seconds.
+    '''
+
+    def __init__(self, session, xpath:str, period:float=None, dampening:float=0.0):
+        steps = [step.split(":")[-1] for step in xpath.strip().strip("/").split("/")]
+        if len(steps) != 3 or steps[:2] != ["interfaces", "interface"] \
+                or any("[" in step for step in steps):
+            raise SimulatedFailure(f"Subscriptions to {xpath!r} are not simulated")
+        self.session = session
+        self.leaf = steps[2]
+        self.period = period
+        self.dampening = dampening
+        self.id = str(next(_subscription_ids))
+        self.changed = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _values(self)->dict:
+        device = self.session.device
+        with device.lock:
+            interfaces = device.oper_data()
+        return {entry.findtext(f"{{{OPER_NS}}}name"):
+                [element.text for element in entry.iter(f"{{{OPER_NS}}}{self.leaf}")]
+                for entry in interfaces}
+
+    def _notification(self, kind:str, values:dict)->str:
+        notification = etree.Element(f"{{{NOTIFICATION_NS}}}notification",
+                                     nsmap={None: NOTIFICATION_NS})
+        event_time = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+        etree.SubElement(notification, f"{{{NOTIFICATION_NS}}}eventTime").text = \
+            event_time.replace("+00:00", "Z")
+        push = etree.SubElement(notification, f"{{{YANG_PUSH_NS}}}{kind}",
+                                nsmap={None: YANG_PUSH_NS})
+        etree.SubElement(push, f"{{{YANG_PUSH_NS}}}subscription-id").text = self.id
+        container = "datastore-contents-xml" if kind == "push-update" else "datastore-changes-xml"
+        contents = etree.SubElement(push, f"{{{YANG_PUSH_NS}}}{container}")
+        interfaces = etree.SubElement(contents, f"{{{OPER_NS}}}interfaces", nsmap={None: OPER_NS})
+        for name, leaf_values in values.items():
+            entry = etree.SubElement(interfaces, f"{{{OPER_NS}}}interface")
+            etree.SubElement(entry, f"{{{OPER_NS}}}name").text = name
+            for value in leaf_values:
+                etree.SubElement(entry, f"{{{OPER_NS}}}{self.leaf}").text = value
+        return etree.tostring(notification, encoding="unicode")
+
+    def start(self):
+        if self.period is None:
+            self.session.device.add_listener(self.changed.set)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.changed.set()
+        self.session.device.remove_listener(self.changed.set)
+
+    def _run(self):
+        try:
+            sent = self._values()
+            self.session.channel.write(self._notification("push-update", sent))
+            while True:
+                if self.period is not None:
+                    if self.stopped.wait(self.period):
+                        return
+                    sent = self._values()
+                    self.session.channel.write(self._notification("push-update", sent))
+                    continue
+                self.changed.wait()
+                if self.dampening and self.stopped.wait(self.dampening):
+                    return
+                if self.stopped.is_set():
+                    return
+                self.changed.clear()
+                current = self._values()
+                changes = {name: values for name, values in current.items()
+                           if sent.get(name) != values}
+                changes.update({name: [] for name in sent if name not in current})
+                sent = current
+                if changes:
+                    self.session.channel.write(self._notification("push-change-update", changes))
+        except (EOFError, OSError, paramiko.SSHException):
+            pass
+
+
+class NetconfSession:
+    '''
+    One NETCONF session to a simulated device.
+    '''
+
+    def __init__(self, device, channel):
+        self.device = device
+        self.channel = _Channel(channel)
+        self.session_id = next(_session_ids)
+        self.closed = threading.Event()
+        self.subscriptions = {}
+        self.starting = []
+
+    def hello(self):
+        capabilities = "".join(f"<capability>{capability}</capability>"
+                               for capability in CAPABILITIES)
+        self.channel.write(f'<hello xmlns="{NETCONF_NS}"><capabilities>{capabilities}'
+                           f"</capabilities><session-id>{self.session_id}</session-id></hello>")
+        client_hello = parse_xml(self.channel.read())
+        client_capabilities = {(element.text or "").strip()
+                               for element in client_hello.iter(f"{{{NETCONF_NS}}}capability")}
+        self.channel.chunked = BASE_1_1 in client_capabilities
+
+    def handle(self, operation)->str:
+        '''
+        Run one operation and return the reply body, or None for <ok/>.
+        '''
+        name = local_name(operation)
+        if name == "get":
+            return self.device.rpc(self.device.get, _filter_of(operation), delayed=False)
+        if name == "get-config":
+            source = next((local_name(child) for element in operation
+                           if local_name(element) == "source" for child in element), None)
+            if source != "running":
+                raise SimulatedFailure(f"Only the running datastore is simulated, not {source}")
+            return self.device.rpc(self.device.get_config, _filter_of(operation), delayed=False)
+        if name == "edit-config":
+            config = next((child for child in operation if local_name(child) == "config"), None)
+            if config is None:
+                raise SimulatedFailure("edit-config without <config> is not simulated")
+            self.device.rpc(self.device.edit_config, config, delayed=False)
+            return None
+        if name == "establish-subscription":
+            return self.establish_subscription(operation)
+        if name == "delete-subscription":
+            subscription_id = next((child.text.strip() for child in operation
+                                    if local_name(child) == "subscription-id" and child.text), None)
+            subscription = self.subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                raise SimulatedFailure(f"No subscription {subscription_id}")
+            subscription.stop()
+            return None
+        if name == "close-session":
+            self.closed.set()
+            return None
+        raise UnsupportedOperation(name)
+
+    def establish_subscription(self, operation)->list:
+        '''
+        Set up a yang-push subscription. The period and dampening-period are
+        in centiseconds; without a period the subscription is on-change.
+        '''
+        options = {local_name(child): (child.text or "").strip() for child in operation}
+        if not options.get("stream", "").endswith("yang-push"):
+            raise SimulatedFailure(f"Stream {options.get('stream')!r} is not simulated")
+        if "xpath-filter" not in options:
+            raise SimulatedFailure("Only xpath-filter subscriptions are simulated")
+        try:
+            period = int(options["period"]) / 100 if "period" in options else None
+            dampening = int(options.get("dampening-period", 0)) / 100
+        except ValueError as err:
+            raise SimulatedFailure(f"Invalid subscription period: {err}") from err
+        if period is not None and period <= 0:
+            raise SimulatedFailure("The period must be positive")
+        subscription = _Subscription(self, options["xpath-filter"], period, dampening)
+        self.subscriptions[subscription.id] = subscription
+        # Started once the reply is on its way, so that the first update follows it
+        self.starting.append(subscription)
+
+        result = etree.Element(f"{{{IETF_EVENT_NS}}}subscription-result",
+                               nsmap={None: IETF_EVENT_NS, "notif-bis": IETF_EVENT_NS})
+        result.text = "notif-bis:ok"
+        subscription_id = etree.Element(f"{{{IETF_EVENT_NS}}}subscription-id",
+                                        nsmap={None: IETF_EVENT_NS})
+        subscription_id.text = subscription.id
+        return [result, subscription_id]
+
+    def serve(self):
+        try:
+            self._serve()
+        finally:
+            self.closed.set()
+            for subscription in self.subscriptions.values():
+                subscription.stop()
+
+    def _serve(self):
+        '''
+        Read requests while earlier ones are still being answered. Each
+        request is due the device's RPC latency after it arrived, so that the
+        latencies of pipelined requests overlap like they do on a real
+        network, while the requests are still handled and answered in the
+        order they came in.
+        '''
+        self.hello()
+        requests = queue.Queue()
+        worker = threading.Thread(target=self._answer, args=(requests,), daemon=True)
+        worker.start()
+        try:
+            while not self.closed.is_set():
+                try:
+                    message = self.channel.read()
+                except EOFError:
+                    return
+                requests.put((message, time.monotonic() + self.device.rpc_latency()))
+        finally:
+            requests.put(None)
+            worker.join()
+
+    def _reply(self, message:bytes)->str:
+        message_id = None
+        try:
+            rpc = parse_xml(message)
+            message_id = rpc.get("message-id")
+            operation = rpc[0] if len(rpc) else None
+            if operation is None or local_name(rpc) != "rpc":
+                raise SimulatedFailure("Malformed rpc")
+            return _rpc_reply(message_id, self.handle(operation))
+        except UnsupportedOperation as err:
+            return _rpc_error(message_id, f"{err} is not simulated", "operation-not-supported")
+        except SimulatedFailure as err:
+            return _rpc_error(message_id, str(err))
+        except Exception as err:
+            # A message that does not parse, or a bug in the simulator,
+            # fails this rpc but keeps the session open
+            return _rpc_error(message_id, f"{type(err).__name__}: {err}")
+
+    def _answer(self, requests:queue.Queue):
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            message, due = request
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                self.channel.write(self._reply(message))
+            except (OSError, EOFError, paramiko.SSHException):
+                # The client is gone; the read loop ends on EOF
+                self.closed.set()
+                return
+            for subscription in self.starting:
+                subscription.start()
+            self.starting = []
+            if self.closed.is_set():
+                # close-session: end the read loop too
+                self.channel.close()
+                return
+
+
+class NetconfSimulator:
+    '''
+    Serves every device of a StandInFleet over NETCONF-over-SSH.
+
+    Devices listen on listen_address, one port each from base_port up, or,
+    with loopback_addresses=True, all on base_port but each on its own
+    127.x.y.z address (Linux routes all of 127.0.0.0/8 to the loopback
+    interface). connect() has the same signature as connect_iosxe and maps
+    a device's host to its endpoint, so assigning it to POOL.connect runs
+    the scripts against the simulator through ncclient.
+    '''
+
+    def __init__(self, fleet:StandInFleet, listen_address:str="127.0.0.1", base_port:int=20830,
+                 loopback_addresses:bool=False, username:str=None, password:str=None,
+                 host_key=None):
+        self.fleet = fleet
+        self.username = username
+        self.password = password
+        self.host_key = host_key or paramiko.RSAKey.generate(2048)
+        self.endpoints = {}
+        first = ipaddress.IPv4Address(listen_address)
+        for index, host in enumerate(fleet.hosts):
+            if loopback_addresses:
+                self.endpoints[host] = (str(first + index), base_port)
+            else:
+                self.endpoints[host] = (listen_address, base_port + index)
+        self.selector = selectors.DefaultSelector()
+        self.sockets = []
+        self.sessions = []
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        for host, endpoint in self.endpoints.items():
+            listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind(endpoint)
+            listener.listen(64)
+            listener.setblocking(False)
+            self.selector.register(listener, selectors.EVENT_READ, host)
+            self.sockets.append(listener)
+        self.thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self.thread.start()
+        return self
+
+    def _accept_loop(self):
+        while not self.stopped.is_set():
+            for key, _ in self.selector.select(timeout=0.2):
+                try:
+                    connection, _ = key.fileobj.accept()
+                except OSError:
+                    continue
+                connection.setblocking(True)
+                threading.Thread(target=self._serve_connection, args=(connection, key.data),
+                                 daemon=True).start()
+
+    def _serve_connection(self, connection, host):
+        device = self.fleet[host]
+        transport = None
+        try:
+            device.connect()
+            transport = paramiko.Transport(connection)
+            transport.add_server_key(self.host_key)
+            server = _SshServer(self.username, self.password)
+            transport.start_server(server=server)
+            channel = transport.accept(timeout=30)
+            if channel is None or not server.netconf_requested.wait(30):
+                return
+            session = NetconfSession(device, channel)
+            with self.lock:
+                self.sessions.append(session)
+            try:
+                session.serve()
+            finally:
+                with self.lock:
+                    self.sessions.remove(session)
+        except (SimulatedFailure, EOFError, OSError, paramiko.SSHException):
+            pass
+        finally:
+            if transport is not None:
+                transport.close()
+            connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+        for listener in self.sockets:
+            self.selector.unregister(listener)
+            listener.close()
+        self.sockets = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def connect(self, host, port=830, username=None, password=None, hostkey_verify=False,
+                timeout=10):
+        address, device_port = self.endpoints[host]
+        return connect_iosxe(address, port=device_port, username=username, password=password,
+                             hostkey_verify=False, timeout=timeout)
+
+
+def raise_file_limit():
+    '''
+    Every device needs a listening socket, so raise the open file limit as
+    far as the hard limit allows.
+    '''
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or hard > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def flap_interfaces(fleet:StandInFleet, interval:float, stopped:threading.Event, seed=None):
+    '''
+    Every interval seconds, take a random interface of a random device down,
+    or bring it back up if it was down, until stopped is set.
+    '''
+    rng = random.Random(seed)
+    while not stopped.wait(interval):
+        device = fleet[rng.choice(fleet.hosts)]
+        with device.lock:
+            names = [name for name, _ in device.interfaces()]
+        if not names:
+            continue
+        name = rng.choice(names)
+        up = device.oper_status.get(name, "if-oper-state-ready") == "if-oper-state-ready"
+        status = "if-oper-state-no-pass" if up else "if-oper-state-ready"
+        device.set_oper_status(name, status)
+        print(f"{device.host} {name} oper-status {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve simulated IOS XE devices over NETCONF")
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--listen", default="127.0.0.1", help="address of the first device")
+    parser.add_argument("--base-port", type=int, default=20830)
+    parser.add_argument("--loopback-addresses", action="store_true",
+                        help="one 127.x.y.z address per device instead of one port per device")
+    parser.add_argument("--first-host", default="10.0.0.1",
+                        help="host name of the first device in the inventory")
+    parser.add_argument("--interfaces", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--connect-failure-rate", type=float, default=0.0)
+    parser.add_argument("--oper-padding", type=int, default=0)
+    parser.add_argument("--username", default="developer")
+    parser.add_argument("--password", default="C1sco12345")
+    parser.add_argument("--inventory", help="write the host -> [address, port] map to this JSON file")
+    parser.add_argument("--flap", type=float, metavar="SECONDS",
+                        help="toggle the oper-status of a random interface every SECONDS")
+    args = parser.parse_args()
+
+    raise_file_limit()
+    fleet = StandInFleet(args.devices, first_host=args.first_host, interfaces=args.interfaces,
+                         latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+                         connect_failure_rate=args.connect_failure_rate,
+                         oper_padding=args.oper_padding)
+    simulator = NetconfSimulator(fleet, listen_address=args.listen, base_port=args.base_port,
+                                 loopback_addresses=args.loopback_addresses,
+                                 username=args.username, password=args.password)
+    simulator.start()
+
+    if args.inventory:
+        with open(args.inventory, "w", encoding="utf-8") as inventory:
+            json.dump(simulator.endpoints, inventory, indent=1)
+
+    first, last = fleet.hosts[0], fleet.hosts[-1]
+    print(f"Serving {len(fleet)} simulated devices: {first} at {simulator.endpoints[first]} "
+          f"to {last} at {simulator.endpoints[last]}. Press Ctrl-C to stop.")
+    if args.flap:
+        threading.Thread(target=flap_interfaces, args=(fleet, args.flap, simulator.stopped),
+                         daemon=True).start()
+    try:
+        simulator.stopped.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for pushing CLI configuration with Netmiko in bulk.
+
+send_config_set() sends one command at a time and waits for the device to
+echo it and return the prompt before sending the next one, so the time of
+a push grows with the number of commands times the round trip time. In
+bulk mode the whole command block is written to the channel at once and
+the output is read back in one go and checked for IOS XE error messages
+afterwards. If the bulk output has errors or the prompt does not come
+back, the commands from the first one the device did not acknowledge on
+can be sent again line by line, which shows exactly which command failed.
+
+The command sets are built from the SoT (dayn/sot.yaml), and
+push_fleet() configures many devices in parallel and can time the
+line-by-line path against the bulk one on every device.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import re
+import time
+from netops.fleet import run_on_fleet
+
+try:
+    from netmiko import ConnectHandler
+    from netmiko.exceptions import ReadTimeout
+except ImportError:
+    ConnectHandler = None
+    ReadTimeout = None
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+BULK = "bulk"
+LINE = "line"
+
+# IOS XE reports a rejected command on the lines after its echo
+ERROR_PATTERN = re.compile(r"^\s*%\s*(Invalid|Incomplete command|Ambiguous command|"
+                           r"Unknown command|Unrecognized command|Error|Bad mask)", re.IGNORECASE)
+CONFIG_PROMPT = re.compile(r"^\S+\(config[^)]*\)#(.*)$")
+# Commands that enter a configuration submode, such as interface configuration
+SUBMODE = re.compile(r"^(interface|router|ipv6 router|line|vrf definition)\s", re.IGNORECASE)
+
+# What a bulk push that does not get the prompt back raises
+_BULK_FAILURES = (ReadTimeout, OSError) if ReadTimeout is not None else (OSError,)
+
+
+def sot_commands(values:dict, interfaces:bool=True)->list:
+    '''
+    IOS XE commands for one device's SoT entry: IPv6 unicast routing and
+    an OSPFv3 process for every process id used, and with interfaces=True
+    the same interface settings the NETCONF interface template configures.
+    '''
+    entries = values.get("interfaces") or []
+    processes = []
+    for interface in entries:
+        process_id = str((interface.get("ospfv3") or {}).get("process_id", ""))
+        if process_id and process_id not in processes:
+            processes.append(process_id)
+
+    commands = ["ipv6 unicast-routing"] + [f"ipv6 router ospf {process}" for process in processes]
+    if not interfaces:
+        return commands
+
+    for interface in entries:
+        commands.append(f"interface {interface['type']}{interface['number']}")
+        if interface.get("description"):
+            commands.append(f"description {interface['description']}")
+        commands.append("ipv6 enable")
+        for address in interface.get("ipv6_address") or []:
+            commands.append(f"ipv6 address {address}")
+        if interface.get("nd_prefix"):
+            commands.append(f"ipv6 nd prefix {interface['nd_prefix']}")
+        ospfv3 = interface.get("ospfv3")
+        if ospfv3:
+            commands.append(f"ipv6 ospf {ospfv3['process_id']} area {ospfv3['process_area']}")
+    return commands
+
+
+def find_errors(output:str)->list:
+    '''
+    Error messages in the output of a configuration push, each prefixed
+    with the command it followed.
+    '''
+    errors = []
+    command = None
+    for line in output.splitlines():
+        echo = CONFIG_PROMPT.match(line.strip())
+        if echo:
+            command = echo.group(1).strip() or command
+        elif ERROR_PATTERN.match(line):
+            errors.append(f"{command}: {line.strip()}" if command else line.strip())
+    return errors
+
+
+def acknowledged(output:str, commands:list)->int:
+    '''
+    Number of commands at the start of commands that the device echoed, in
+    order, without an error after them.
+    '''
+    count = 0
+    for line in output.splitlines():
+        echo = CONFIG_PROMPT.match(line.strip())
+        if echo:
+            command = echo.group(1).strip()
+            if not command:
+                continue
+            if count < len(commands) and command == commands[count].strip():
+                count += 1
+            else:
+                break
+        elif ERROR_PATTERN.match(line):
+            # The error belongs to the last echoed command
+            return max(0, count - 1)
+    return count
+
+
+def resume_commands(commands:list, start:int)->list:
+    '''
+    The commands from start on, preceded by the command that entered the
+    submode the command at start is in, so that it is configured in the same
+    place again.
+    '''
+    if start == 0 or start >= len(commands) or SUBMODE.match(commands[start]):
+        return list(commands[start:])
+    for command in reversed(commands[:start]):
+        if SUBMODE.match(command):
+            return [command] + list(commands[start:])
+    return list(commands[start:])
+
+
+def send_line_by_line(connection, commands:list)->str:
+    '''
+    The existing path: one command at a time, waiting for each echo.
+    '''
+    return connection.send_config_set(commands)
+
+
+def send_bulk(connection, commands:list, read_timeout:float=60.0)->str:
+    '''
+    Write the whole block, followed by "end", to the channel at once and
+    read the output until the exec prompt comes back after the "end".
+    '''
+    output = connection.config_mode()
+    block = connection.RETURN.join(list(commands) + ["end"]) + connection.RETURN
+    connection.write_channel(block)
+    output += connection.read_until_pattern(pattern=rf"{re.escape(connection.base_prompt)}#",
+                                            read_timeout=read_timeout)
+    return output
+
+
+class BulkPushResult:
+    '''
+    Outcome of configuring one device in one mode. elapsed is the time of
+    the configuration itself, without connecting. When a bulk push fell
+    back to line by line, resumed_at is the index of the first command that
+    was sent again.
+    '''
+    __slots__ = ("device", "mode", "elapsed", "output", "errors", "fell_back", "resumed_at")
+
+    def __init__(self, device:str, mode:str, elapsed:float, output:str, errors:list,
+                 fell_back:bool=False, resumed_at:int=0):
+        self.device = device
+        self.mode = mode
+        self.elapsed = elapsed
+        self.output = output
+        self.errors = errors
+        self.fell_back = fell_back
+        self.resumed_at = resumed_at
+
+    @property
+    def ok(self)->bool:
+        return not self.errors
+
+    def __repr__(self):
+        return (f"BulkPushResult({self.device!r}, {self.mode!r}, elapsed={self.elapsed:.2f}, "
+                f"errors={len(self.errors)})")
+
+
+def push_commands(connection, device:str, commands:list, mode:str=BULK, fallback:bool=True,
+                  read_timeout:float=60.0)->BulkPushResult:
+    '''
+    Configure commands on an open Netmiko connection. In bulk mode, with
+    fallback=True, a block that fails is sent again line by line from the
+    first command the device did not acknowledge. The output is then the
+    bulk output followed by the line-by-line one, and the errors are those
+    of the line-by-line push.
+    '''
+    started = time.perf_counter()
+    if mode == LINE:
+        output = send_line_by_line(connection, commands)
+        return BulkPushResult(device, LINE, time.perf_counter() - started, output,
+                              find_errors(output))
+
+    try:
+        output = send_bulk(connection, commands, read_timeout=read_timeout)
+        errors = find_errors(output)
+    except _BULK_FAILURES as err:
+        output, errors = "", [f"No prompt after the command block: {err}"]
+    if errors and fallback:
+        # Whatever the block left unread would be taken for the echo of the first command
+        output += connection.clear_buffer() or ""
+        start = acknowledged(output, commands)
+        resumed = send_line_by_line(connection, resume_commands(commands, start))
+        return BulkPushResult(device, BULK, time.perf_counter() - started, output + resumed,
+                              find_errors(resumed), fell_back=True, resumed_at=start)
+    return BulkPushResult(device, BULK, time.perf_counter() - started, output, errors)
+
+
+def push_device(name:str, host:str, commands:list, username:str, password:str,
+                mode:str=BULK, fallback:bool=True, compare:bool=False,
+                device_type:str="cisco_xe")->list:
+    '''
+    Connect to one device and configure it. With compare=True the commands
+    are sent line by line first and then in bulk, and both results are
+    returned so the times can be compared.
+    '''
+    if ConnectHandler is None:
+        raise RuntimeError("Netmiko is not installed: pip install netmiko")
+    device = {
+        "device_type": device_type,
+        "host": host,
+        "username": username,
+        "password": password
+    }
+    modes = [LINE, BULK] if compare else [mode]
+    with ConnectHandler(**device) as connection:
+        return [push_commands(connection, name, commands, mode=each, fallback=fallback)
+                for each in modes]
+
+
+def _push_planned(name, plans, username, password, **kwargs):
+    host, commands = plans[name]
+    return push_device(name, host, commands, username, password, **kwargs)
+
+
+def push_fleet(devices:dict, username:str, password:str, interfaces:bool=True,
+               max_workers:int=10, **kwargs)->list:
+    '''
+    Configure every device of a SoT dictionary (name -> values) with the
+    commands built from its entry, max_workers devices at a time. Returns
+    run_on_fleet's DeviceResult list, with a list of BulkPushResults as the
+    result of every device.
+    '''
+    plans = {name: (values["mgmt"], sot_commands(values, interfaces=interfaces))
+             for name, values in devices.items()}
+    return run_on_fleet(_push_planned, plans, plans, username, password,
+                        max_workers=max_workers, verbose=False, **kwargs)
+
+
+def report(results:list)->str:
+    '''
+    Time per device and mode, with the speedup of bulk over line by line
+    when both were run.
+    '''
+    lines = [f"{'device':12} {'line s':>8} {'bulk s':>8} {'speedup':>8}  status"]
+    totals = {LINE: 0.0, BULK: 0.0}
+    for result in results:
+        if not result.ok:
+            lines.append(f"{result.device:12} {'':>8} {'':>8} {'':>8}  failed! {result.error}")
+            continue
+        times = {push.mode: push.elapsed for push in result.result}
+        for mode, elapsed in times.items():
+            totals[mode] += elapsed
+        speedup = f"{times[LINE] / times[BULK]:.1f}x" \
+            if LINE in times and BULK in times and times[BULK] else ""
+        errors = [error for push in result.result for error in push.errors]
+        status = "ok" if not errors else f"{len(errors)} errors: {'; '.join(errors[:3])}"
+        for push in result.result:
+            if push.fell_back:
+                status += f" (bulk fell back to line by line from command {push.resumed_at + 1})"
+        line_time = f"{times[LINE]:.2f}" if LINE in times else ""
+        bulk_time = f"{times[BULK]:.2f}" if BULK in times else ""
+        lines.append(f"{result.device:12} {line_time:>8} {bulk_time:>8} {speedup:>8}  {status}")
+    line_total = f"{totals[LINE]:.2f}" if totals[LINE] else ""
+    bulk_total = f"{totals[BULK]:.2f}" if totals[BULK] else ""
+    lines.append(f"{'total':12} {line_total:>8} {bulk_total:>8}")
+    return "\n".join(lines)
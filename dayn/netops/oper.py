@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for parsing Cisco-IOS-XE-interfaces-oper replies one
+interface at a time instead of turning the whole reply into nested
+dictionaries.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import xml.etree.ElementTree as ET
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+CHUNK_SIZE = 64 * 1024
+
+
+class InterfaceOper:
+    '''
+    Operational IPv6/IPv4 addresses and oper-status of one interface.
+    Supports item access
+    (record["ipv6"]) so it can stand in for the per-interface dictionaries
+    the view scripts used to build.
+    '''
+    __slots__ = ("name", "ipv4", "ipv6", "oper_status")
+
+    def __init__(self, name:str, ipv4:str=None, ipv6:list=None, oper_status:str=None):
+        self.name = name
+        self.ipv4 = ipv4
+        self.ipv6 = ipv6 if ipv6 is not None else []
+        self.oper_status = oper_status
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self):
+        return (f"InterfaceOper(name={self.name!r}, ipv4={self.ipv4!r}, ipv6={self.ipv6!r}, "
+                f"oper_status={self.oper_status!r})")
+
+
+def _local_name(tag:str)->str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _chunks(data_xml):
+    if hasattr(data_xml, "read"):
+        while True:
+            chunk = data_xml.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for start in range(0, len(data_xml), CHUNK_SIZE):
+            yield data_xml[start:start + CHUNK_SIZE]
+
+
+def iter_interfaces_oper(data_xml):
+    '''
+    Yield an InterfaceOper for every <interface> in an interfaces-oper reply.
+
+    data_xml can be a string, bytes or a file-like object. The reply is fed
+    to the parser in chunks and every <interface> element is dropped as soon
+    as its record has been built, so only the fields used by the scripts are
+    kept in memory.
+    '''
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack = []
+
+    for chunk in _chunks(data_xml):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                stack.append(element)
+                continue
+
+            stack.pop()
+            if _local_name(element.tag) != "interface" or not stack \
+                    or _local_name(stack[-1].tag) != "interfaces":
+                continue
+
+            record = InterfaceOper(None)
+            for child in element:
+                field = _local_name(child.tag)
+                if field == "name":
+                    record.name = child.text
+                elif field == "ipv4":
+                    record.ipv4 = child.text
+                elif field == "ipv6-addrs" and child.text:
+                    record.ipv6.append(child.text)
+                elif field == "oper-status":
+                    record.oper_status = child.text
+            stack[-1].remove(element)
+            yield record
+    parser.close()
+
+
+def parse_interfaces_oper(data_xml)->dict:
+    '''
+    Build the interface name -> InterfaceOper mapping for an interfaces-oper
+    reply.
+    '''
+    return {record.name: record for record in iter_interfaces_oper(data_xml)}
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for pipelining several NETCONF RPCs on one session,
+so that the device works on all of them within a single round trip.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import time
+from ncclient.operations import RaiseMode, TimeoutExpiredError
+from netops.timing import RPC, TIMINGS
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+
+class PipelineResult:
+    '''
+    Replies of a pipelined run, in the order the RPCs were queued, together
+    with the timing of the run. latencies holds the send-to-reply time of
+    every RPC. Sent one by one, the RPCs would have taken about the sum of
+    these, so saved estimates the time pipelining saved. The estimate is on
+    the high side when replies queue up behind each other on the device;
+    the view_interface_ipv6_sequential case of benchmarks/fleet_benchmark.py
+    measures the real sequential baseline.
+    '''
+
+    def __init__(self, replies, message_ids, elapsed, latencies):
+        self.replies = replies
+        self.by_message_id = dict(zip(message_ids, replies))
+        self.elapsed = elapsed
+        self.latencies = latencies
+
+    @property
+    def saved(self)->float:
+        return max(0.0, sum(self.latencies) - self.elapsed)
+
+    def summary(self)->str:
+        return (f"Pipelined {len(self.replies)} RPCs in {self.elapsed:.3f}s, "
+                f"about {self.saved:.3f}s less than sending them one by one")
+
+
+class RpcPipeline:
+    '''
+    Queue of RPCs to send on one ncclient Manager without waiting for the
+    replies in between.
+
+    Operations are queued by Manager method name, for example
+    add("get", filter=("subtree", my_filter)). run() sends every queued RPC
+    back to back and then collects the replies, which ncclient matches to
+    the requests by message-id.
+    '''
+
+    def __init__(self, connection, timeout:float=None):
+        self.connection = connection
+        self.timeout = connection.timeout if timeout is None else timeout
+        self._queue = []
+
+    def add(self, operation:str, **kwargs):
+        self._queue.append((operation, kwargs))
+        return self
+
+    def __len__(self):
+        return len(self._queue)
+
+    @staticmethod
+    def _raises(rpc, error)->bool:
+        '''
+        The check ncclient makes before raising an rpc-error from a
+        synchronous call: errors the device handler exempts are never raised,
+        the others according to the session's raise_mode.
+        '''
+        handler = getattr(rpc, "_device_handler", None)
+        if handler is not None and handler.is_rpc_error_exempt(error.message):
+            return False
+        raise_mode = getattr(rpc, "raise_mode", RaiseMode.ALL)
+        return raise_mode == RaiseMode.ALL or (raise_mode == RaiseMode.ERRORS
+                                               and error.severity == "error")
+
+    def run(self)->PipelineResult:
+        '''
+        Send all queued RPCs and wait for all replies. Raises the first
+        transport error, and the first rpc-error that the connection's
+        raise_mode raises, like the synchronous calls would.
+        After a TimeoutExpiredError the session may still receive replies
+        for this run; with a pooled session, letting the error leave the
+        netconf_session() block closes the session instead of reusing it.
+        '''
+        previous_mode = self.connection.async_mode
+        self.connection.async_mode = True
+        rpcs, sent_at = [], []
+        started = time.perf_counter()
+        try:
+            for operation, kwargs in self._queue:
+                sent_at.append(time.perf_counter())
+                rpcs.append(getattr(self.connection, operation)(**kwargs))
+        finally:
+            self.connection.async_mode = previous_mode
+
+        # Replies are taken in the order the RPCs were sent, which is also the
+        # order the device answers them in
+        received_at = []
+        deadline = started + self.timeout
+        for rpc in rpcs:
+            if not rpc.event.wait(max(0.0, deadline - time.perf_counter())):
+                # The session still has replies on the way, so it must not be reused
+                raise TimeoutExpiredError("ncclient timed out while waiting for a pipelined rpc reply.")
+            received_at.append(time.perf_counter())
+        elapsed = time.perf_counter() - started
+
+        replies = []
+        for rpc in rpcs:
+            if rpc.error:
+                raise rpc.error
+            reply = rpc.reply
+            reply.parse()
+            if reply.error is not None and self._raises(rpc, reply.error):
+                raise reply.error
+            replies.append(reply)
+
+        latencies = [received - sent for sent, received in zip(sent_at, received_at)]
+        if TIMINGS.enabled:
+            device = getattr(self.connection, "timing_device", None)
+            for (operation, _), latency in zip(self._queue, latencies):
+                TIMINGS.observe(RPC, latency, device, operation)
+        return PipelineResult(replies, [rpc.id for rpc in rpcs], elapsed, latencies)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helpers for pacing Catalyst Center API calls per endpoint and
+backing off when the API answers with HTTP 429 Too Many Requests.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+TOO_MANY_REQUESTS = 429
+
+
+def parse_retry_after(value, default:float=1.0)->float:
+    '''
+    Seconds to wait according to a Retry-After header, which holds either a
+    number of seconds or an HTTP date.
+    '''
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class EndpointLimiter:
+    '''
+    Token bucket for one endpoint whose rate adapts to the API (AIMD): the
+    rate grows by `increase` requests per second for every second's worth
+    of successful (2xx) calls (up to max_rate), and a 429 multiplies it by
+    `decrease` (down to min_rate) and pauses the endpoint for the
+    Retry-After time.
+
+    Only requests sent after the last decrease can decrease the rate again,
+    so a burst of 429s for requests that were already in flight counts as
+    one signal. With a gentle decrease the rate stays just below the API's
+    limit instead of dropping to half of it on every 429.
+    '''
+
+    def __init__(self, rate:float, min_rate:float, max_rate:float, increase:float,
+                 decrease:float, burst:float=1):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._decreased_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def acquire(self)->float:
+        '''
+        Block until the endpoint may be called. Returns the time the call is
+        let through, to be passed to on_throttled() if the call gets a 429.
+        '''
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return now
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttled(self, retry_after:float, sent_at:float=None):
+        with self._lock:
+            now = time.monotonic()
+            if sent_at is None or sent_at >= self._decreased_at:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._decreased_at = now
+            self._paused_until = max(self._paused_until, now + retry_after)
+            self._tokens = 0
+            self._updated = now
+
+
+class RateLimitScheduler:
+    '''
+    Sends requests through one EndpointLimiter per endpoint and retries
+    requests answered with 429 up to max_retries times.
+    '''
+
+    def __init__(self, rate:float=5, min_rate:float=0.2, max_rate:float=100,
+                 increase:float=0.5, decrease:float=0.9, max_retries:int=5):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.throttled = 0
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, endpoint:str)->EndpointLimiter:
+        with self._lock:
+            if endpoint not in self._limiters:
+                self._limiters[endpoint] = EndpointLimiter(self.rate, self.min_rate, self.max_rate,
+                                                           self.increase, self.decrease)
+            return self._limiters[endpoint]
+
+    def rates(self)->dict:
+        '''
+        Current requests per second allowed for each endpoint seen so far.
+        '''
+        with self._lock:
+            return {endpoint: limiter.rate for endpoint, limiter in self._limiters.items()}
+
+    def send(self, endpoint:str, send_request):
+        '''
+        Call send_request() when the endpoint's limiter allows it and return
+        its response. A 429 response is retried after the Retry-After time;
+        the last response is returned once max_retries is used up.
+        '''
+        limiter = self.limiter(endpoint)
+        for attempt in range(self.max_retries + 1):
+            sent_at = limiter.acquire()
+            response = send_request()
+            if response.status_code != TOO_MANY_REQUESTS:
+                # Errors such as 401 or 5xx neither raise nor lower the rate
+                if 200 <= response.status_code < 300:
+                    limiter.on_success()
+                return response
+            with self._lock:
+                self.throttled += 1
+            if attempt < self.max_retries:
+                response.close()
+            limiter.on_throttled(parse_retry_after(response.headers.get("Retry-After")), sent_at)
+        return response
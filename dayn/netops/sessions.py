@@ -0,0 +1,334 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for reusing NETCONF sessions between calls to the
+same device.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import atexit
+import hashlib
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from ncclient import manager
+from ncclient.devices.iosxe import IosxeDeviceHandler
+from netops.timing import NETCONF_HELLO, RPC, SSH_HANDSHAKE, TCP_CONNECT, TIMINGS, timed
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+
+class _TimedIosxeDeviceHandler(IosxeDeviceHandler):
+    '''
+    IOS XE device handler that notes when the NETCONF hello starts and ends.
+    ncclient asks the handler for the hello's namespaces right after the SSH
+    subsystem is open, and for the reply parser right after the server's
+    hello has been received.
+    '''
+
+    def __init__(self, device_params, ignore_errors=None):
+        super().__init__(device_params, ignore_errors)
+        self.hello_started = None
+        self.hello_finished = None
+
+    def get_xml_base_namespace_dict(self):
+        if self.hello_started is None:
+            self.hello_started = time.perf_counter()
+        return super().get_xml_base_namespace_dict()
+
+    def get_xml_parser(self, session):
+        if self.hello_finished is None:
+            self.hello_finished = time.perf_counter()
+        return super().get_xml_parser(session)
+
+
+def _connect_iosxe_timed(host, port, username, password, hostkey_verify, timeout):
+    '''
+    connect_iosxe() split into TCP connect, SSH handshake and NETCONF hello.
+    '''
+    started = time.perf_counter()
+    sock = socket.create_connection((host, port), timeout=timeout)
+    connected = time.perf_counter()
+    try:
+        connection = manager.connect(host=host, port=port, username=username, password=password,
+                                     hostkey_verify=hostkey_verify, sock=sock, timeout=timeout,
+                                     device_params={"name":"iosxe",
+                                                    "handler":_TimedIosxeDeviceHandler})
+    except Exception:
+        sock.close()
+        raise
+
+    handler = connection._device_handler
+    TIMINGS.observe(TCP_CONNECT, connected - started, host)
+    if handler.hello_started is not None and handler.hello_finished is not None:
+        TIMINGS.observe(SSH_HANDSHAKE, handler.hello_started - connected, host)
+        TIMINGS.observe(NETCONF_HELLO, handler.hello_finished - handler.hello_started, host)
+    return connection
+
+
+def connect_iosxe(host, port=830, username=None, password=None, hostkey_verify=False, timeout=10):
+    '''
+    Open a new NETCONF session to an IOS XE device.
+    '''
+    if TIMINGS.enabled:
+        return _connect_iosxe_timed(host, port, username, password, hostkey_verify, timeout)
+    return manager.connect(host=host, port=port, username=username, password=password,
+                           hostkey_verify=hostkey_verify, device_params={"name":"iosxe"},
+                           timeout=timeout)
+
+
+class TimedConnection:
+    '''
+    Wrapper around a session that times every synchronous RPC round trip.
+    Everything else, including setting async_mode, goes to the session.
+    '''
+
+    RPC_METHODS = {"get", "get_config", "edit_config", "dispatch", "lock", "unlock", "commit",
+                   "discard_changes", "validate", "copy_config", "delete_config",
+                   "create_subscription", "establish_subscription", "save_config"}
+
+    def __init__(self, connection, device):
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "timing_device", device)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._connection, name)
+        if name not in self.RPC_METHODS or not callable(attribute):
+            return attribute
+
+        def timed_rpc(*args, **kwargs):
+            if self._connection.async_mode:
+                return attribute(*args, **kwargs)
+            with timed(RPC, self.timing_device, name):
+                return attribute(*args, **kwargs)
+        return timed_rpc
+
+    def __setattr__(self, name, value):
+        setattr(self._connection, name, value)
+
+
+class SessionPool:
+    '''
+    Pool of open NETCONF sessions keyed by (host, port, username, a hash of
+    the password, hostkey_verify), so that a session is only reused with the
+    credentials and host key policy it was opened with.
+
+    A session is lent to one caller at a time and returned to the pool when
+    the caller is done. Sessions that are no longer connected or that have
+    been idle longer than idle_timeout seconds are closed instead of reused.
+    At most max_sessions sessions are open at the same time; when the pool is
+    full, the least recently used idle session is closed to make room, and if
+    every session is in use the caller waits for one to be returned.
+
+    Sessions are closed outside the pool's lock, so a device that hangs on
+    close-session does not hold up callers borrowing other sessions.
+    '''
+
+    def __init__(self, max_sessions:int=100, idle_timeout:float=300, connect=connect_iosxe):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.connect = connect
+        self._idle = []  # (key, connection, returned_at), oldest first
+        self._open = 0
+        self._lock = threading.Condition()
+
+    def __len__(self):
+        with self._lock:
+            return self._open
+
+    @staticmethod
+    def key(host, port=830, username=None, password=None, hostkey_verify=False)->tuple:
+        secret = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+        return (host, port, username, secret, bool(hostkey_verify))
+
+    @staticmethod
+    def _alive(connection)->bool:
+        '''
+        The session says it is connected and, for ncclient sessions, its
+        reader thread is running and the SSH transport is still active.
+        '''
+        if not getattr(connection, "connected", False):
+            return False
+        session = getattr(connection, "_session", None)
+        if session is None:
+            return True
+        if hasattr(session, "is_alive") and not session.is_alive():
+            return False
+        transport = getattr(session, "_transport", None)
+        return transport is None or transport.is_active()
+
+    def _forget(self, connections:list):
+        ''' Stop counting sessions that are about to be closed. Lock must be held. '''
+        self._open -= len(connections)
+        if connections:
+            self._lock.notify_all()
+
+    @staticmethod
+    def _close(connections:list):
+        ''' Close sessions. Must be called without the lock. '''
+        for connection in connections:
+            try:
+                connection.close_session()
+            except Exception:
+                pass
+
+    def _take_idle(self, key, stale:list):
+        '''
+        Return the most recently used live idle session for key, or None.
+        Dead or expired sessions found on the way are moved to stale. Lock
+        must be held.
+        '''
+        now = time.monotonic()
+        for index in range(len(self._idle) - 1, -1, -1):
+            idle_key, connection, returned_at = self._idle[index]
+            if idle_key != key:
+                continue
+            del self._idle[index]
+            if self._alive(connection) and now - returned_at <= self.idle_timeout:
+                return connection
+            stale.append(connection)
+        return None
+
+    def _reserve(self, timeout, stale:list):
+        '''
+        Reserve room for one new session, waiting if needed. Idle sessions
+        evicted to make room are moved to stale. Lock must be held.
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._open - len(stale) >= self.max_sessions:
+            if self._idle:
+                _, connection, _ = self._idle.pop(0)
+                stale.append(connection)
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"No free NETCONF session slot (max_sessions={self.max_sessions})")
+            self._lock.wait(remaining)
+        self._open += 1
+
+    def acquire(self, host, port=830, username=None, password=None, hostkey_verify=False,
+                timeout=10):
+        '''
+        Borrow a session for the device, opening a new one if no idle session
+        is available. The session must be handed back with release().
+        '''
+        key = self.key(host, port, username, password, hostkey_verify)
+        stale = []
+        try:
+            with self._lock:
+                try:
+                    connection = self._take_idle(key, stale)
+                    if connection is not None:
+                        return key, connection
+                    self._reserve(timeout, stale)
+                finally:
+                    self._forget(stale)
+        finally:
+            self._close(stale)
+
+        try:
+            connection = self.connect(host, port=port, username=username, password=password,
+                                      hostkey_verify=hostkey_verify, timeout=timeout)
+        except Exception:
+            with self._lock:
+                self._forget([None])
+            raise
+        return key, connection
+
+    def release(self, key, connection, reuse:bool=True):
+        '''
+        Hand a borrowed session back to the pool. With reuse=False, or when
+        the session is no longer alive, it is closed instead.
+        '''
+        with self._lock:
+            if reuse and self._alive(connection):
+                self._idle.append((key, connection, time.monotonic()))
+                self._lock.notify()
+                return
+            self._forget([connection])
+        self._close([connection])
+
+    @contextmanager
+    def session(self, host, port=830, username=None, password=None, hostkey_verify=False,
+                timeout=10):
+        '''
+        Context manager version of acquire() and release(), usable in place of
+        ncclient's manager.connect(). If the block raises, the session may be
+        left with replies still pending, so it is closed instead of reused.
+        '''
+        key, connection = self.acquire(host, port=port, username=username, password=password,
+                                       hostkey_verify=hostkey_verify, timeout=timeout)
+        try:
+            yield connection
+        except BaseException:
+            self.release(key, connection, reuse=False)
+            raise
+        self.release(key, connection)
+
+    def evict_idle(self):
+        '''
+        Close the idle sessions that are dead or past idle_timeout.
+        '''
+        now = time.monotonic()
+        stale = []
+        with self._lock:
+            keep = []
+            for key, connection, returned_at in self._idle:
+                if self._alive(connection) and now - returned_at <= self.idle_timeout:
+                    keep.append((key, connection, returned_at))
+                else:
+                    stale.append(connection)
+            self._idle = keep
+            self._forget(stale)
+        self._close(stale)
+
+    def close(self):
+        '''
+        Close every idle session. Sessions that are lent out stay open until
+        they are returned.
+        '''
+        with self._lock:
+            stale = [connection for _, connection, _ in self._idle]
+            self._idle = []
+            self._forget(stale)
+        self._close(stale)
+
+
+POOL = SessionPool()
+atexit.register(POOL.close)
+
+
+@contextmanager
+def _timed_session(device):
+    with POOL.session(**device) as connection:
+        yield TimedConnection(connection, device.get("host"))
+
+
+def netconf_session(**device):
+    '''
+    Borrow a session from the shared pool. Accepts the same host, port,
+    username, password and hostkey_verify keys as the scripts' device dicts.
+    With timing enabled, the RPCs sent on the session are timed.
+    '''
+    if TIMINGS.enabled:
+        return _timed_session(device)
+    return POOL.session(**device)
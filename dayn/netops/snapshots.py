@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for caching per-device snapshots of NETCONF replies,
+such as the native GigabitEthernet configuration and the interfaces-oper
+data, so that a view run shortly after another does not fetch the same
+data again.
+
+Snapshots expire after a TTL and the least recently used ones are dropped
+when the cache grows past its size limit. With a directory, snapshots are
+also written to disk, so that they are shared with the other scripts and
+later runs. Our own configuration scripts invalidate the snapshots of a
+device when they write to it. On disk, invalidation touches an epoch file
+of the device, and snapshots fetched before the latest epoch are neither
+written nor read, so a write by one process also hides the older snapshots
+of the others. The in-memory layer of a process only sees its own writes.
+
+The shared SNAPSHOTS cache is configured with environment variables:
+NETOPS_SNAPSHOT_TTL in seconds (default 30, 0 turns the cache off) and
+NETOPS_SNAPSHOT_DIR for the on-disk layer (off by default).
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+CONFIG = "gigabitethernet-config"
+OPER = "interfaces-oper"
+KINDS = (CONFIG, OPER)
+
+
+class SnapshotCache:
+    '''
+    Reply XML per (device, kind), valid for ttl seconds. At most max_bytes
+    of XML is kept in memory, least recently used snapshots are dropped
+    first. With directory, snapshots are also kept on disk and a snapshot
+    missing from memory is read from there while it is fresh.
+
+    To keep a reply fetched before a write from being stored after it, take
+    generation() before fetching and pass it to put(); invalidate() moves
+    the device to a new generation. A generation holds the in-process
+    counter and the time it was taken. On disk a snapshot file's mtime is
+    the time its fetch started, and it is only valid when that is later
+    than the mtime of the device's epoch file, which invalidate() touches.
+    '''
+
+    def __init__(self, ttl:float=30.0, max_bytes:int=64 * 1024 * 1024, directory:str=None):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # (device, kind) -> (stored_at, xml), least recently used first
+        self.size = 0
+        self.generations = {}
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def enabled(self)->bool:
+        return self.ttl > 0
+
+    def generation(self, device)->tuple:
+        with self.lock:
+            return self.generations.get(str(device), 0), time.time()
+
+    def _path(self, device, kind:str)->str:
+        name = hashlib.sha256(f"{device}\0{kind}".encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{name}.xml")
+
+    def _epoch_path(self, device)->str:
+        name = hashlib.sha256(f"{device}".encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{name}.epoch")
+
+    def _epoch(self, device)->float:
+        '''
+        Time of the latest invalidation of the device by any process, 0.0
+        when it has never been invalidated.
+        '''
+        try:
+            return os.path.getmtime(self._epoch_path(device))
+        except OSError:
+            return 0.0
+
+    def _drop(self, key):
+        ''' Lock must be held. '''
+        _, xml = self.entries.pop(key)
+        self.size -= len(xml)
+
+    def _store(self, key, stored_at:float, xml:str):
+        ''' Lock must be held. '''
+        if key in self.entries:
+            self._drop(key)
+        if len(xml) > self.max_bytes:
+            return
+        self.entries[key] = (stored_at, xml)
+        self.size += len(xml)
+        while self.size > self.max_bytes:
+            self._drop(next(iter(self.entries)))
+
+    def _read_disk(self, device, kind:str, now:float):
+        path = self._path(device, kind)
+        try:
+            stored_at = os.path.getmtime(path)
+            if now - stored_at > self.ttl or stored_at <= self._epoch(device):
+                return None
+            with open(path, "r", encoding="utf-8") as snapshot_file:
+                return stored_at, snapshot_file.read()
+        except OSError:
+            return None
+
+    def get(self, device, kind:str):
+        '''
+        Return the snapshot XML, or None when there is no fresh snapshot.
+        '''
+        if not self.enabled:
+            return None
+        key = (str(device), kind)
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self._drop(key)
+
+        entry = self._read_disk(key[0], kind, now) if self.directory else None
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self._store(key, *entry)
+            self.hits += 1
+        return entry[1]
+
+    def put(self, device, kind:str, xml, generation:tuple=None):
+        if not self.enabled or xml is None:
+            return
+        if isinstance(xml, bytes):
+            xml = xml.decode("utf-8")
+        key = (str(device), kind)
+        now = time.time()
+        fetched_at = now if generation is None else generation[1]
+        temporary = None
+        if self.directory and fetched_at > self._epoch(key[0]):
+            # The file is written outside the lock and only moved into place under it,
+            # after the generation check, so an invalidate() cannot be overtaken.
+            # Its mtime is the fetch time, which reads compare with the epoch.
+            path = self._path(key[0], kind)
+            temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temporary, "w", encoding="utf-8") as snapshot_file:
+                    snapshot_file.write(xml)
+                os.utime(temporary, (fetched_at, fetched_at))
+            except OSError:
+                try:
+                    os.remove(temporary)
+                except OSError:
+                    pass
+                temporary = None
+        with self.lock:
+            current = generation is None or generation[0] == self.generations.get(key[0], 0)
+            if current:
+                self._store(key, now, xml)
+            if temporary is not None and current:
+                try:
+                    os.replace(temporary, path)
+                    temporary = None
+                except OSError:
+                    pass
+        if temporary is not None:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+
+    def invalidate(self, device, kinds=KINDS):
+        '''
+        Forget the snapshots of a device, in memory and on disk. writing()
+        calls this after every write to the device. On disk the device's
+        epoch file is touched first, so that other processes stop reading
+        and writing the snapshots fetched before now.
+        '''
+        device = str(device)
+        with self.lock:
+            self.generations[device] = self.generations.get(device, 0) + 1
+            for kind in kinds:
+                if (device, kind) in self.entries:
+                    self._drop((device, kind))
+        if self.directory:
+            now = time.time()
+            try:
+                with open(self._epoch_path(device), "a", encoding="utf-8"):
+                    pass
+                os.utime(self._epoch_path(device), (now, now))
+            except OSError:
+                pass
+            for kind in kinds:
+                try:
+                    os.remove(self._path(device, kind))
+                except OSError:
+                    pass
+
+    @contextmanager
+    def writing(self, device):
+        '''
+        Wrap a write to the device: its snapshots are invalidated when the
+        block ends, also when the write fails.
+        '''
+        try:
+            yield
+        finally:
+            self.invalidate(device)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+SNAPSHOTS = SnapshotCache(ttl=float(os.environ.get("NETOPS_SNAPSHOT_TTL", "30")),
+                          directory=os.environ.get("NETOPS_SNAPSHOT_DIR") or None)
@@ -0,0 +1,526 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper with an in-process stand-in for IOS XE NETCONF
+devices. Each simulated device keeps its own running configuration for the
+native ipv6 and interface subtrees and derives interfaces-oper data from
+it. StandInFleet.connect can be given to SessionPool (or assigned to
+POOL.connect) so that the scripts run unchanged against thousands of
+simulated devices.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import copy
+import hashlib
+import ipaddress
+import itertools
+import random
+import threading
+import time
+from lxml import etree
+from netops.delta import OPERATION, find_match, local_name, normalize_value, parse_xml
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+NETCONF_NS = "urn:ietf:params:xml:ns:netconf:base:1.0"
+NATIVE_NS = "http://cisco.com/ns/yang/Cisco-IOS-XE-native"
+ETHERNET_NS = "http://cisco.com/ns/yang/Cisco-IOS-XE-ethernet"
+OPER_NS = "http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper"
+
+
+class SimulatedFailure(Exception):
+    '''
+    Raised for an injected failure or an RPC the device rejects.
+    '''
+
+
+def _element(tag:str, text=None, namespace:str=None, children=()):
+    element = etree.Element(f"{{{namespace}}}{tag}" if namespace else tag,
+                            nsmap={None: namespace} if namespace else None)
+    if text is not None:
+        element.text = str(text)
+    element.extend(children)
+    return element
+
+
+def _sub(parent, tag:str, text=None):
+    ''' Child element in the parent's namespace. '''
+    namespace = etree.QName(parent).namespace
+    child = etree.SubElement(parent, f"{{{namespace}}}{tag}" if namespace else tag)
+    if text is not None:
+        child.text = str(text)
+    return child
+
+
+def _is_content_match(element)->bool:
+    return len(element) == 0 and bool((element.text or "").strip())
+
+
+def _subtree_match(node, selector):
+    '''
+    Apply one subtree filter element (RFC 6241 section 6) to node. Returns
+    the selected copy of node, or None when node does not match.
+    '''
+    if selector.tag != node.tag:
+        return None
+    if len(selector) == 0:
+        if _is_content_match(selector) and normalize_value(selector.text) != normalize_value(node.text):
+            return None
+        return copy.deepcopy(node)
+
+    content = [child for child in selector if _is_content_match(child)]
+    selection = [child for child in selector if not _is_content_match(child)]
+    for match in content:
+        found = [child for child in node if child.tag == match.tag]
+        if not any(normalize_value(child.text) == normalize_value(match.text) for child in found):
+            return None
+    if not selection:
+        return copy.deepcopy(node)
+
+    result = etree.Element(node.tag, nsmap=node.nsmap)
+    for child in node:
+        if any(child.tag == match.tag for match in content):
+            result.append(copy.deepcopy(child))
+            continue
+        for sub_selector in selection:
+            selected = _subtree_match(child, sub_selector)
+            if selected is not None:
+                result.append(selected)
+                break
+    return result
+
+
+def subtree_filter(data, selectors):
+    '''
+    Return a <data> element with the parts of data (the children of a
+    datastore root) that the subtree filter elements select.
+    '''
+    result = _element("data", namespace=NETCONF_NS)
+    for node in data:
+        for selector in selectors:
+            selected = _subtree_match(node, selector)
+            if selected is not None:
+                result.append(selected)
+    return result
+
+
+def xpath_filter(data, path:str):
+    '''
+    Minimal XPath filter: a /-separated path of element names, such as the
+    "native/ipv6" used by view_ipv6. Predicates are not supported.
+    '''
+    steps = [step.split(":")[-1] for step in path.strip("/").split("/") if step]
+    if any("[" in step or "*" in step for step in steps):
+        raise SimulatedFailure(f"Unsupported XPath filter {path!r}")
+    result = _element("data", namespace=NETCONF_NS)
+
+    def select(nodes, remaining, parent):
+        for node in nodes:
+            if local_name(node) != remaining[0]:
+                continue
+            if len(remaining) == 1:
+                parent.append(copy.deepcopy(node))
+                continue
+            shell = etree.Element(node.tag, nsmap=node.nsmap)
+            select(node, remaining[1:], shell)
+            if len(shell):
+                parent.append(shell)
+
+    select(data, steps, result)
+    return result
+
+
+def merge_config(running, config):
+    '''
+    Merge the children of a <config> element into running, honouring the
+    create, merge, replace, delete and remove operations.
+    '''
+    for element in config:
+        _merge(running, element, "merge")
+
+
+def _strip_operations(element):
+    for node in element.iter():
+        node.attrib.pop(OPERATION, None)
+    etree.cleanup_namespaces(element)
+    return element
+
+
+def _merge(parent, element, inherited:str):
+    operation = element.get(OPERATION, inherited)
+    match = find_match(element, parent)
+
+    if operation in ("delete", "remove"):
+        if match is None:
+            if operation == "delete":
+                raise SimulatedFailure(f"data-missing: {local_name(element)}")
+            return
+        parent.remove(match)
+        return
+    if operation == "create" and match is not None:
+        raise SimulatedFailure(f"data-exists: {local_name(element)}")
+
+    if match is None or operation == "replace" or len(element) == 0:
+        replacement = _strip_operations(copy.deepcopy(element))
+        if match is None:
+            parent.append(replacement)
+        else:
+            parent.replace(match, replacement)
+        return
+    for child in element:
+        _merge(match, child, operation)
+
+
+class SimulatedDevice:
+    '''
+    One simulated IOS XE device.
+
+    latency is the time of every RPC round trip and connect_latency the time
+    to open a session, both plus up to jitter seconds. failure_rate is the
+    share of RPCs and connect_failure_rate the share of connects that fail.
+    oper_padding adds that many bytes of counters to every interface in the
+    interfaces-oper data, to simulate larger replies.
+
+    Functions added with add_listener() are called after every change to
+    the running configuration or to an interface's oper-status, which is
+    how the NETCONF simulator drives on-change subscriptions.
+    '''
+
+    def __init__(self, host:str, interfaces:int=8, latency:float=0.0, connect_latency:float=None,
+                 jitter:float=0.0, failure_rate:float=0.0, connect_failure_rate:float=0.0,
+                 oper_padding:int=0, seed=None):
+        self.host = host
+        self.latency = latency
+        self.connect_latency = 3 * latency if connect_latency is None else connect_latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.connect_failure_rate = connect_failure_rate
+        self.oper_padding = oper_padding
+        self.random = random.Random(seed if seed is not None else host)
+        self.lock = threading.RLock()
+        self.running = self._initial_config(interfaces)
+        self.oper_status = {}
+        self.listeners = []
+        self.rpc_count = 0
+        self.edit_count = 0
+
+    def _initial_config(self, interfaces:int):
+        native = _element("native", namespace=NATIVE_NS)
+        _sub(native, "hostname", self.host)
+        interface_list = _sub(native, "interface")
+        for number in range(1, interfaces + 1):
+            entry = _sub(interface_list, "GigabitEthernet")
+            _sub(entry, "name", number)
+            negotiation = etree.SubElement(entry, f"{{{ETHERNET_NS}}}negotiation",
+                                           nsmap={None: ETHERNET_NS})
+            _sub(negotiation, "auto", "true")
+        return [native]
+
+    def _delay(self, seconds:float):
+        seconds += self.random.uniform(0, self.jitter) if self.jitter else 0.0
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def _maybe_fail(self, rate:float, what:str):
+        if rate and self.random.random() < rate:
+            raise SimulatedFailure(f"Injected {what} failure on {self.host}")
+
+    def connect(self):
+        self._delay(self.connect_latency)
+        self._maybe_fail(self.connect_failure_rate, "connect")
+
+    def rpc_latency(self)->float:
+        '''
+        Latency of one RPC: latency plus up to jitter seconds.
+        '''
+        return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def rpc(self, handler, *args, delayed:bool=True):
+        '''
+        Run one RPC handler with the configured latency and failures. With
+        delayed=False the caller has already applied the latency.
+        '''
+        if delayed:
+            self._delay(self.latency)
+        with self.lock:
+            self.rpc_count += 1
+            self._maybe_fail(self.failure_rate, "RPC")
+            return handler(*args)
+
+    def _filtered(self, data, filter):
+        if filter is None:
+            result = _element("data", namespace=NETCONF_NS)
+            result.extend(copy.deepcopy(node) for node in data)
+            return result
+        kind, criteria = filter
+        if kind == "xpath":
+            return xpath_filter(data, criteria)
+        if isinstance(criteria, str):
+            criteria = parse_xml(f"<filter>{criteria}</filter>")
+        elif local_name(criteria) != "filter":
+            criteria = [criteria]
+        return subtree_filter(data, list(criteria))
+
+    def get_config(self, filter=None):
+        return self._filtered(self.running, filter)
+
+    def get(self, filter=None):
+        return self._filtered(self.running + [self.oper_data()], filter)
+
+    def edit_config(self, config):
+        if isinstance(config, (str, bytes)):
+            config = parse_xml(config)
+        if local_name(config) != "config":
+            config = _element("config", namespace=NETCONF_NS, children=[copy.deepcopy(config)])
+        native = [node for node in config if local_name(node) == "native"]
+        if len(native) != len(config):
+            raise SimulatedFailure("Only the native model is simulated")
+        merge_config(_RunningRoot(self.running), config)
+        self.edit_count += 1
+        self._changed()
+
+    def add_listener(self, listener):
+        with self.lock:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self.lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+    def _changed(self):
+        for listener in list(self.listeners):
+            listener()
+
+    def set_oper_status(self, name:str, status:str):
+        '''
+        Change the oper-status of an interface, e.g. to "if-oper-state-down"
+        to simulate a link going down.
+        '''
+        with self.lock:
+            self.oper_status[name] = status
+            self._changed()
+
+    def interfaces(self):
+        '''
+        Yield (name, ipv6 element or None) for the configured interfaces.
+        '''
+        native = next((node for node in self.running if local_name(node) == "native"), None)
+        interface_list = native.find(f"{{{NATIVE_NS}}}interface") if native is not None else None
+        for entry in interface_list if interface_list is not None else ():
+            name = entry.findtext(f"{{{NATIVE_NS}}}name")
+            yield f"{local_name(entry)}{name}", entry.find(f"{{{NATIVE_NS}}}ipv6")
+
+    def link_local(self, name:str)->str:
+        suffix = hashlib.sha256(f"{self.host}/{name}".encode("utf-8")).digest()[:8]
+        return str(ipaddress.IPv6Address(b"\xfe\x80" + bytes(6) + suffix)).upper()
+
+    def ipv6_addresses(self, name:str, ipv6)->list:
+        '''
+        Addresses an interface would have with this IPv6 configuration: the
+        link-local address and every configured prefix, upper case like
+        IOS XE shows them.
+        '''
+        if ipv6 is None:
+            return []
+        addresses = [f"{self.link_local(name)}/64"]
+        for prefix in ipv6.iter(f"{{{NATIVE_NS}}}prefix"):
+            if prefix.text and "/" in prefix.text:
+                addresses.append(str(ipaddress.IPv6Interface(prefix.text.strip())).upper())
+        return addresses
+
+    def oper_data(self):
+        interfaces = _element("interfaces", namespace=OPER_NS)
+        for index, (name, ipv6) in enumerate(self.interfaces()):
+            entry = _sub(interfaces, "interface")
+            _sub(entry, "name", name)
+            _sub(entry, "interface-type", "iana-iftype-ethernet-csmacd")
+            _sub(entry, "admin-status", "if-state-up")
+            _sub(entry, "oper-status", self.oper_status.get(name, "if-oper-state-ready"))
+            _sub(entry, "ipv4", "0.0.0.0")
+            for address in self.ipv6_addresses(name, ipv6):
+                _sub(entry, "ipv6-addrs", address)
+            if self.oper_padding:
+                statistics = _sub(entry, "statistics")
+                for counter in range(max(1, self.oper_padding // 40)):
+                    _sub(statistics, "counter", f"{counter}:{index * 1000003 + counter:020d}")
+        return interfaces
+
+
+class _RunningRoot:
+    '''
+    Adapter that lets merge_config() treat the list of top-level datastore
+    nodes like the children of one element.
+    '''
+
+    def __init__(self, nodes:list):
+        self.nodes = nodes
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def append(self, element):
+        self.nodes.append(element)
+
+    def remove(self, element):
+        self.nodes.remove(element)
+
+    def replace(self, old, new):
+        self.nodes[self.nodes.index(old)] = new
+
+
+class StandInReply:
+    '''
+    Reply with the attributes of ncclient's RPCReply that the scripts use.
+    '''
+
+    def __init__(self, message_id:str, data=None):
+        self.message_id = message_id
+        self.data_ele = data
+        self.ok = True
+        self.error = None
+        self.errors = []
+
+    @property
+    def data_xml(self)->str:
+        return etree.tostring(self.data_ele, encoding="unicode") if self.data_ele is not None else None
+
+    @property
+    def data(self):
+        return self.data_ele
+
+    @property
+    def xml(self)->str:
+        body = self.data_xml if self.data_ele is not None else "<ok/>"
+        return (f'<rpc-reply xmlns="{NETCONF_NS}" message-id="{self.message_id}">'
+                f"{body}</rpc-reply>")
+
+    def parse(self):
+        return self
+
+    def __str__(self):
+        return self.xml
+
+
+class StandInRPC:
+    '''
+    Pending RPC returned in async_mode, with the event, reply and error
+    attributes that RpcPipeline reads.
+    '''
+
+    def __init__(self, message_id:str, work):
+        self.id = message_id
+        self.event = threading.Event()
+        self.reply = None
+        self.error = None
+        threading.Thread(target=self._run, args=(work,), daemon=True).start()
+
+    def _run(self, work):
+        try:
+            self.reply = work()
+        except Exception as err:
+            self.error = err
+        finally:
+            self.event.set()
+
+
+_message_ids = itertools.count(101)
+
+
+class StandInManager:
+    '''
+    Session to a SimulatedDevice with the parts of ncclient's Manager API the
+    scripts use: get, get_config, edit_config, async_mode and close_session.
+    '''
+
+    def __init__(self, device:SimulatedDevice, timeout:float=30):
+        self.device = device
+        self.timeout = timeout
+        self.async_mode = False
+        self.connected = True
+
+    def _call(self, handler, *args):
+        if not self.connected:
+            raise SimulatedFailure(f"Session to {self.device.host} is closed")
+
+        message_id = str(next(_message_ids))
+
+        def work():
+            return StandInReply(message_id, self.device.rpc(handler, *args))
+
+        if self.async_mode:
+            return StandInRPC(message_id, work)
+        return work()
+
+    def get(self, filter=None):
+        return self._call(self.device.get, filter)
+
+    def get_config(self, source="running", filter=None):
+        if source != "running":
+            raise SimulatedFailure(f"Only the running datastore is simulated, not {source}")
+        return self._call(self.device.get_config, filter)
+
+    def edit_config(self, config, target="running", **kwargs):
+        if target != "running":
+            raise SimulatedFailure(f"Only the running datastore is simulated, not {target}")
+        return self._call(lambda: self.device.edit_config(config))
+
+    def close_session(self):
+        self.connected = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close_session()
+
+
+class StandInFleet:
+    '''
+    A set of simulated devices addressed by host. connect() has the same
+    signature as netops.sessions.connect_iosxe.
+    '''
+
+    def __init__(self, count:int, first_host:str="10.0.0.1", **device_options):
+        first = ipaddress.IPv4Address(first_host)
+        self.devices = {}
+        for index in range(count):
+            host = str(first + index)
+            self.devices[host] = SimulatedDevice(host, **device_options)
+
+    @property
+    def hosts(self)->list:
+        return list(self.devices)
+
+    def __getitem__(self, host):
+        return self.devices[host]
+
+    def __len__(self):
+        return len(self.devices)
+
+    def connect(self, host, port=830, username=None, password=None, hostkey_verify=False,
+                timeout=10):
+        try:
+            device = self.devices[host]
+        except KeyError:
+            raise SimulatedFailure(f"No simulated device at {host}") from None
+        device.connect()
+        return StandInManager(device, timeout=timeout)
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for following interface state with YANG-push instead
+of polling: dynamic subscriptions (establish-subscription) for leaves of
+Cisco-IOS-XE-interfaces-oper such as ipv6-addrs and oper-status, either
+on-change or periodic, and an in-memory view of the fleet that is kept up
+to date from the notifications.
+
+Each device gets a dedicated NETCONF session, because notifications are
+delivered on the session that set up the subscription and the
+subscription ends when that session is closed.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import threading
+from lxml import etree
+from netops.delta import local_name, parse_xml
+from netops.fleet import run_on_fleet
+from netops.oper import InterfaceOper
+from netops.sessions import POOL
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+IETF_EVENT_NS = "urn:ietf:params:xml:ns:yang:ietf-event-notifications"
+YANG_PUSH_NS = "urn:ietf:params:xml:ns:yang:ietf-yang-push"
+NOTIFICATION_NS = "urn:ietf:params:xml:ns:netconf:notification:1.0"
+
+IPV6_ADDRS = "/interfaces-ios-xe-oper:interfaces/interface/ipv6-addrs"
+OPER_STATUS = "/interfaces-ios-xe-oper:interfaces/interface/oper-status"
+
+# Interface leaves that can be followed, and the InterfaceOper attribute each one updates
+FIELDS = {"ipv6-addrs": "ipv6", "oper-status": "oper_status"}
+
+
+def leaf_of(xpath:str)->str:
+    '''
+    Name of the leaf an xpath filter selects, without the module prefix.
+    '''
+    return xpath.rstrip("/").rsplit("/", 1)[-1].split(":")[-1]
+
+
+def subscription_request(xpath:str, period:float=None):
+    '''
+    establish-subscription RPC for the yang-push stream in the form IOS XE
+    accepts. Without period the subscription is on-change, otherwise the
+    device pushes the selected data every period seconds.
+    '''
+    request = etree.Element(f"{{{IETF_EVENT_NS}}}establish-subscription",
+                            nsmap={None: IETF_EVENT_NS, "yp": YANG_PUSH_NS})
+    etree.SubElement(request, f"{{{IETF_EVENT_NS}}}stream").text = "yp:yang-push"
+    etree.SubElement(request, f"{{{YANG_PUSH_NS}}}xpath-filter").text = xpath
+    if period is None:
+        etree.SubElement(request, f"{{{YANG_PUSH_NS}}}dampening-period").text = "0"
+    else:
+        # The period is given in centiseconds
+        etree.SubElement(request, f"{{{YANG_PUSH_NS}}}period").text = str(max(1, round(period * 100)))
+    return request
+
+
+def establish_subscription(connection, xpath:str, period:float=None)->str:
+    '''
+    Set up one subscription on the session and return its subscription-id.
+    '''
+    reply = parse_xml(connection.dispatch(subscription_request(xpath, period)).xml)
+    result = next((element.text for element in reply.iter()
+                   if local_name(element) == "subscription-result"), None)
+    subscription_id = next((element.text for element in reply.iter()
+                            if local_name(element) == "subscription-id"), None)
+    if not result or not result.strip().endswith("ok") or not subscription_id:
+        raise RuntimeError(f"Subscription to {xpath} was not accepted: {result}")
+    return subscription_id.strip()
+
+
+class PushUpdate:
+    '''
+    Content of one push-update or push-change-update notification: the
+    values of every leaf per interface. A push-update (complete=True) holds
+    all the subscribed data; a push-change-update only what changed.
+    '''
+    __slots__ = ("subscription_id", "complete", "interfaces")
+
+    def __init__(self, subscription_id:str, complete:bool, interfaces:dict):
+        self.subscription_id = subscription_id
+        self.complete = complete
+        self.interfaces = interfaces
+
+
+def parse_notification(notification_xml)->PushUpdate:
+    '''
+    Parse a YANG-push notification. Returns None for other notifications.
+    '''
+    notification = parse_xml(notification_xml)
+    for body in notification:
+        kind = local_name(body)
+        if kind not in ("push-update", "push-change-update"):
+            continue
+        subscription_id = next((element.text.strip() for element in body
+                                if local_name(element) == "subscription-id" and element.text), None)
+        interfaces = {}
+        for element in body.iter():
+            if not isinstance(element.tag, str) or local_name(element) != "interface":
+                continue
+            leaves = {}
+            for child in element:
+                leaves.setdefault(local_name(child), []).append((child.text or "").strip())
+            name = leaves.pop("name", [None])[0]
+            if name:
+                interfaces[name] = leaves
+        return PushUpdate(subscription_id, kind == "push-update", interfaces)
+    return None
+
+
+class FleetView:
+    '''
+    In-memory interface state of a fleet, host -> interface name ->
+    InterfaceOper, updated from YANG-push notifications. Safe to read while
+    the notification threads write to it.
+    '''
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.devices = {}
+        self.synced = set()
+        self.notifications = 0
+
+    def apply(self, host:str, leaf:str, update:PushUpdate)->list:
+        '''
+        Apply the values of leaf from one notification. Returns the changes
+        as (interface, leaf, old value, new value) tuples; the first full
+        update of a leaf only fills in the view and returns no changes.
+        '''
+        attribute = FIELDS[leaf]
+        changes = []
+        with self.lock:
+            self.notifications += 1
+            initial = update.complete and (host, leaf) not in self.synced
+            if update.complete:
+                self.synced.add((host, leaf))
+            interfaces = self.devices.setdefault(host, {})
+            names = list(update.interfaces)
+            if update.complete:
+                # Interfaces missing from a full update no longer have the leaf
+                names += [name for name in interfaces if name not in update.interfaces]
+            for name in names:
+                values = [value for value in update.interfaces.get(name, {}).get(leaf, []) if value]
+                new = values if attribute == "ipv6" else (values[0] if values else None)
+                record = interfaces.get(name)
+                if record is None:
+                    record = interfaces[name] = InterfaceOper(name)
+                old = getattr(record, attribute)
+                if old != new:
+                    setattr(record, attribute, new)
+                    changes.append((name, leaf, old, new))
+        return [] if initial else changes
+
+    def interfaces(self, host:str)->dict:
+        '''
+        Copy of the current state of one device, in the same shape as
+        parse_interfaces_oper() returns.
+        '''
+        with self.lock:
+            return {name: InterfaceOper(record.name, record.ipv4, list(record.ipv6),
+                                        record.oper_status)
+                    for name, record in self.devices.get(host, {}).items()}
+
+
+class DeviceSubscription:
+    '''
+    YANG-push subscriptions to one device on a dedicated session. Once
+    started, a background thread takes the notifications off the session
+    and applies them to the view; on_change(host, changes) is called for
+    every notification that changed something. synced is set once every
+    subscription has delivered its first full update.
+    '''
+
+    def __init__(self, view:FleetView, host:str, username:str, password:str, port:int=830,
+                 xpaths=(IPV6_ADDRS, OPER_STATUS), period:float=None, on_change=None):
+        self.view = view
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self.xpaths = xpaths
+        self.period = period
+        self.on_change = on_change
+        self.connection = None
+        self.subscriptions = {}
+        self.pending = set()
+        self.error = None
+        self.synced = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        # A dedicated session rather than POOL.session(): the subscriptions live as
+        # long as the session, so it must not be handed back to the pool or to other
+        # callers, and POOL.connect skips the RPC timing wrapper and pool accounting
+        self.connection = POOL.connect(self.host, port=self.port, username=self.username,
+                                       password=self.password, hostkey_verify=False)
+        try:
+            for xpath in self.xpaths:
+                subscription_id = establish_subscription(self.connection, xpath, self.period)
+                self.subscriptions[subscription_id] = leaf_of(xpath)
+                self.pending.add(subscription_id)
+        except Exception:
+            self.close()
+            raise
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def _run(self):
+        while not self.stopped.is_set():
+            notification = self.connection.take_notification(block=True, timeout=0.5)
+            if notification is None:
+                if not self.connection.connected:
+                    self.error = "NETCONF session closed"
+                    return
+                continue
+            try:
+                self._handle(notification)
+            except Exception as err:
+                self.error = f"Handling a notification failed: {err!r}"
+                return
+
+    def _handle(self, notification):
+        update = parse_notification(notification.notification_xml)
+        leaf = self.subscriptions.get(update.subscription_id) if update else None
+        if leaf is None:
+            return
+        changes = self.view.apply(self.host, leaf, update)
+        if update.complete and self.pending:
+            self.pending.discard(update.subscription_id)
+            if not self.pending:
+                self.synced.set()
+        if changes and self.on_change is not None:
+            self.on_change(self.host, changes)
+
+    def close(self):
+        '''
+        Close the session, which also ends its subscriptions.
+        '''
+        self.stopped.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        try:
+            self.connection.close_session()
+        except Exception:
+            pass
+
+
+def _start_subscription(host, view, username, password, sync_timeout, **kwargs)->DeviceSubscription:
+    subscription = DeviceSubscription(view, host, username, password, **kwargs).start()
+    subscription.synced.wait(sync_timeout)
+    return subscription
+
+
+def subscribe_fleet(view:FleetView, devices, username:str, password:str, max_workers:int=10,
+                    sync_timeout:float=30, **kwargs)->list:
+    '''
+    Start a DeviceSubscription for every device, max_workers at a time, and
+    wait up to sync_timeout seconds per device for the first full updates.
+    Returns run_on_fleet's DeviceResult list; the result of each device
+    that succeeded is its DeviceSubscription.
+    '''
+    return run_on_fleet(_start_subscription, devices, view, username, password, sync_timeout,
+                        max_workers=max_workers, verbose=False, **kwargs)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for compiling each Jinja2 template only once and
+keeping the compiled bytecode on disk between pipeline runs.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import os
+import jinja2
+from jinja2.bccache import Bucket
+from netops.timing import RENDER, timed
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+# Relative to the registry's search path, so the cache sits next to the templates
+BYTECODE_CACHE_DIR = ".jinja_cache"
+
+
+class ContentHashBytecodeCache(jinja2.FileSystemBytecodeCache):
+    '''
+    Bytecode cache whose entries are named after the template name and a
+    hash of its source, so an edited template never picks up stale
+    bytecode. The directory is only created when the first bytecode is
+    written.
+    '''
+
+    def get_bucket(self, environment, name, filename, source):
+        checksum = self.get_source_checksum(source)
+        bucket = Bucket(environment, f"{self.get_cache_key(name, filename)}-{checksum}", checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def dump_bytecode(self, bucket):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            # A read-only tree only costs compiling again on the next run
+            pass
+
+
+class _PathLoader(jinja2.BaseLoader):
+    '''
+    Loads a template from a file path, resolved against search_path the
+    way open() resolves it against the working directory, so absolute
+    paths and paths with ".." work too.
+    '''
+
+    def __init__(self, search_path):
+        self.search_path = search_path
+
+    def get_source(self, environment, template):
+        path = os.path.join(self.search_path, template)
+        try:
+            with open(path, encoding="utf-8") as template_file:
+                source = template_file.read()
+            mtime = os.path.getmtime(path)
+        except OSError as err:
+            raise jinja2.TemplateNotFound(template) from err
+        return source, path, lambda: _mtime(path) == mtime
+
+
+def _mtime(path:str):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class TemplateRegistry:
+    '''
+    Compiled Jinja2 templates looked up by file path under search_path.
+
+    Each template is compiled once per process and reused for every render.
+    The compiled bytecode is also stored under cache_dir, which is relative
+    to search_path unless absolute, so the next run skips compiling unless
+    the template file has changed. Set cache_dir to None to keep the
+    compiled templates in memory only. Nothing is read or written until
+    the first render.
+    '''
+
+    def __init__(self, search_path=".", cache_dir:str=BYTECODE_CACHE_DIR):
+        self.search_path = search_path
+        self.cache_dir = cache_dir
+        self._environment = None
+
+    @property
+    def environment(self)->jinja2.Environment:
+        if self._environment is None:
+            search_path = os.path.abspath(self.search_path)
+            bytecode_cache = None
+            if self.cache_dir:
+                bytecode_cache = ContentHashBytecodeCache(os.path.join(search_path, self.cache_dir))
+            self._environment = jinja2.Environment(loader=_PathLoader(search_path),
+                                                   bytecode_cache=bytecode_cache,
+                                                   auto_reload=True)
+        return self._environment
+
+    def get(self, template_name:str)->jinja2.Template:
+        return self.environment.get_template(str(template_name))
+
+    def render(self, template_name:str, **context)->str:
+        with timed(RENDER, operation=str(template_name)):
+            return self.get(template_name).render(**context)
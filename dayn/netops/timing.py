@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for timing the phases of every device operation
+(TCP connect, SSH handshake, NETCONF hello, RPC round trips, parsing,
+rendering and Catalyst Center API calls) into latency histograms that can
+be exported as JSON and Prometheus text.
+
+Timing is off unless the NETOPS_TIMING environment variable is set (or
+TIMINGS.enable() is called). When it is off, timed() returns a shared
+no-op context manager, so the instrumented code pays only for one
+attribute check. When NETOPS_TIMING is set, the histograms are written to
+NETOPS_TIMING_FILE.json and .prom (default netops_timings) at exit.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import atexit
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+TCP_CONNECT = "tcp_connect"
+SSH_HANDSHAKE = "ssh_handshake"
+NETCONF_HELLO = "netconf_hello"
+RPC = "rpc"
+PARSE = "parse"
+RENDER = "render"
+API = "api"
+
+# Upper bounds of the histogram buckets in seconds, like Prometheus' defaults
+# with a few more at the fast end for parsing and rendering
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+           1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC = "netops_phase_duration_seconds"
+
+
+class Histogram:
+    '''
+    Latency histogram with fixed buckets, plus count, sum, min and max.
+    '''
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def observe(self, seconds:float):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = seconds if self.minimum is None else min(self.minimum, seconds)
+        self.maximum = seconds if self.maximum is None else max(self.maximum, seconds)
+
+    def quantile(self, fraction:float):
+        '''
+        Estimate of the given quantile: the upper bound of the bucket it
+        falls in, but never more than the largest observation.
+        '''
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(BUCKETS[index], self.maximum) if index < len(BUCKETS) else self.maximum
+        return self.maximum
+
+    def to_dict(self)->dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": {str(bound): count for bound, count
+                        in zip(BUCKETS + ("+Inf",), self.counts)},
+        }
+
+
+class _Phase:
+    __slots__ = ("timings", "phase", "device", "operation", "started")
+
+    def __init__(self, timings, phase, device, operation):
+        self.timings = timings
+        self.phase = phase
+        self.device = device
+        self.operation = operation
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timings.observe(self.phase, time.perf_counter() - self.started, self.device,
+                             self.operation)
+        return False
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+class Timings:
+    '''
+    Histograms per (phase, operation), and the time per device per phase.
+    operation narrows a phase down, e.g. phase "rpc" with operation
+    "get_config", or phase "api" with the API path.
+    '''
+
+    def __init__(self, enabled:bool=False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.devices = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {}
+            self.devices = {}
+
+    def phase(self, phase:str, device=None, operation:str=None):
+        '''
+        Context manager that times the block as one observation of phase.
+        '''
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, phase, device, operation)
+
+    def observe(self, phase:str, seconds:float, device=None, operation:str=None):
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get((phase, operation))
+            if histogram is None:
+                histogram = self.histograms[(phase, operation)] = Histogram()
+            histogram.observe(seconds)
+            if device is not None:
+                per_device = self.devices.setdefault(str(device), {})
+                count, total = per_device.get(phase, (0, 0.0))
+                per_device[phase] = (count + 1, total + seconds)
+
+    def to_dict(self)->dict:
+        with self.lock:
+            return {
+                "phases": [{"phase": phase, "operation": operation, **histogram.to_dict()}
+                           for (phase, operation), histogram in sorted(
+                               self.histograms.items(), key=lambda item: (item[0][0], item[0][1] or ""))],
+                "devices": {device: {phase: {"count": count, "seconds": total}
+                                     for phase, (count, total) in phases.items()}
+                            for device, phases in sorted(self.devices.items())},
+            }
+
+    def to_json(self)->str:
+        return json.dumps(self.to_dict(), indent=1)
+
+    def to_prometheus(self)->str:
+        '''
+        Histograms in the Prometheus text exposition format.
+        '''
+        lines = [f"# HELP {METRIC} Time spent per phase of device operations.",
+                 f"# TYPE {METRIC} histogram"]
+        with self.lock:
+            for (phase, operation), histogram in sorted(
+                    self.histograms.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+                labels = f'phase="{_escape(phase)}"'
+                if operation is not None:
+                    labels += f',operation="{_escape(operation)}"'
+                cumulative = 0
+                for bound, count in zip(BUCKETS + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{METRIC}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{METRIC}_sum{{{labels}}} {histogram.total}")
+                lines.append(f"{METRIC}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self)->str:
+        lines = [f"{'phase':14} {'operation':28} {'count':>7} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+        for entry in self.to_dict()["phases"]:
+            p95 = entry["p95"] * 1000 if entry["p95"] is not None else float("nan")
+            lines.append(f"{entry['phase']:14} {(entry['operation'] or '-')[:28]:28} "
+                         f"{entry['count']:>7} {entry['mean'] * 1000:>9.2f} {p95:>9.2f} "
+                         f"{entry['max'] * 1000:>9.2f}")
+        return "\n".join(lines)
+
+    def save(self, prefix:str):
+        '''
+        Write prefix.json and prefix.prom.
+        '''
+        with open(f"{prefix}.json", "w", encoding="utf-8") as json_file:
+            json_file.write(self.to_json())
+        with open(f"{prefix}.prom", "w", encoding="utf-8") as prometheus_file:
+            prometheus_file.write(self.to_prometheus())
+
+
+def _escape(value:str)->str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+TIMINGS = Timings(enabled=os.environ.get("NETOPS_TIMING", "") not in ("", "0"))
+
+
+def timed(phase:str, device=None, operation:str=None):
+    '''
+    Time a block into the shared TIMINGS: with timed(PARSE, device_ip): ...
+    '''
+    if not TIMINGS.enabled:
+        return _NO_PHASE
+    return _Phase(TIMINGS, phase, device, operation)
+
+
+def _export_at_exit():
+    if not TIMINGS.enabled or not TIMINGS.histograms:
+        return
+    prefix = os.environ.get("NETOPS_TIMING_FILE", "netops_timings")
+    TIMINGS.save(prefix)
+    sys.stderr.write(f"\nPhase timings (saved to {prefix}.json and {prefix}.prom):\n"
+                     f"{TIMINGS.summary()}\n")
+
+atexit.register(_export_at_exit)
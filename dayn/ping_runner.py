@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for running pings from many devices at the same time,
+with a limit on how many pings each device runs in parallel, and for
+reading the latency and loss statistics from the IOS XE ping output.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import queue
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+# Success rate is 100 percent (5/5), round-trip min/avg/max = 1/2/4 ms
+SUCCESS_RATE = re.compile(r"Success rate is (\d+) percent \((\d+)/(\d+)\)")
+ROUND_TRIP = re.compile(r"round-trip min/avg/max = (\d+)/(\d+)/(\d+) ms")
+
+
+class PingResult:
+    '''
+    Outcome of one ping from one device to one destination. Statistics are
+    None when the output could not be parsed or the ping raised an error.
+    '''
+    __slots__ = ("device", "destination", "sent", "received", "rtt_min", "rtt_avg", "rtt_max",
+                 "error", "elapsed")
+
+    def __init__(self, device:str, destination:str, sent=None, received=None, rtt_min=None,
+                 rtt_avg=None, rtt_max=None, error=None, elapsed:float=0.0):
+        self.device = device
+        self.destination = destination
+        self.sent = sent
+        self.received = received
+        self.rtt_min = rtt_min
+        self.rtt_avg = rtt_avg
+        self.rtt_max = rtt_max
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def loss(self):
+        ''' Packet loss in percent, or None without statistics. '''
+        if not self.sent:
+            return None
+        return 100.0 * (self.sent - self.received) / self.sent
+
+    @property
+    def ok(self)->bool:
+        # A ping that did not raise passes; when the output has a success
+        # rate line, something must also have come back
+        return self.error is None and (self.sent is None or bool(self.received))
+
+    def statistics(self)->str:
+        if self.sent is None:
+            return "no statistics"
+        text = f"{self.received}/{self.sent} received, {self.loss:.0f}% loss"
+        if self.rtt_avg is not None:
+            text += f", rtt min/avg/max {self.rtt_min}/{self.rtt_avg}/{self.rtt_max} ms"
+        return text
+
+    def __repr__(self):
+        return f"PingResult({self.device!r}, {self.destination!r}, {self.statistics()})"
+
+
+def parse_ping_output(output)->dict:
+    '''
+    Read sent, received and round-trip times from IOS XE ping output.
+    '''
+    statistics = {}
+    match = SUCCESS_RATE.search(output or "")
+    if match:
+        statistics["received"], statistics["sent"] = int(match.group(2)), int(match.group(3))
+    match = ROUND_TRIP.search(output or "")
+    if match:
+        statistics["rtt_min"], statistics["rtt_avg"], statistics["rtt_max"] = (
+            int(value) for value in match.groups())
+    return statistics
+
+
+def device_name(device)->str:
+    return getattr(device, "hostname", None) or getattr(device, "name", None) or str(device)
+
+
+def ping_once(device, destination:str)->PingResult:
+    '''
+    Ping destination from device with device.ping() and return the result.
+    An exception from the device is recorded as the result's error.
+    '''
+    started = time.perf_counter()
+    try:
+        output = device.ping(destination)
+    except Exception as err:
+        # The ping service raises on unreachable destinations, but the
+        # output with the statistics is often attached to the exception
+        statistics = parse_ping_output(str(err))
+        return PingResult(device_name(device), destination, error=err,
+                          elapsed=time.perf_counter() - started, **statistics)
+    return PingResult(device_name(device), destination, elapsed=time.perf_counter() - started,
+                      **parse_ping_output(output))
+
+
+def _drain(device, destinations, ping, results):
+    '''
+    Ping the device's destinations until there are none left. A ping
+    function that raises gives a failed result instead of ending the worker,
+    so every destination always gets a result.
+    '''
+    while True:
+        try:
+            destination = destinations.get_nowait()
+        except queue.Empty:
+            return
+        started = time.perf_counter()
+        try:
+            result = ping(device, destination)
+        except Exception as err:
+            result = PingResult(device_name(device), destination, error=err,
+                                elapsed=time.perf_counter() - started)
+        results.put(result)
+
+
+def run_pings(devices, destinations, per_device_limit:int=1, ping=ping_once,
+              max_workers:int=64):
+    '''
+    Ping every destination from every device, at most per_device_limit pings
+    per device and max_workers pings in total in parallel. Yields a
+    PingResult per device/destination pair as soon as it is done.
+
+    A pyATS device runs one command at a time on a connection, so limits
+    above one need a connection pool: device.connect(pool_size=limit).
+    '''
+    devices = list(devices)
+    destinations = list(destinations)
+    per_device_limit = max(1, per_device_limit)
+    results = queue.Queue()
+
+    workers = max(1, min(max_workers, len(devices) * per_device_limit))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for device in devices:
+            pending = queue.Queue()
+            for destination in destinations:
+                pending.put(destination)
+            futures += [executor.submit(_drain, device, pending, ping, results)
+                        for _ in range(min(per_device_limit, len(destinations)))]
+
+        for _ in range(len(devices) * len(destinations)):
+            yield results.get()
+        for future in futures:
+            future.result()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for finding IPv6 addressing conflicts across the whole
+SoT: duplicate addresses, prefixes used on more than one interface of the
+same device, and prefixes that contain another interface's prefix. A
+prefix shared by interfaces of different devices is a link between them
+and is not a conflict.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import ipaddress
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+DUPLICATE_ADDRESS = "duplicate address"
+OVERLAP = "overlap"
+CONTAINMENT = "containment"
+
+_ALL_ONES = (1 << 128) - 1
+
+
+class Conflict:
+    '''
+    One addressing conflict: the same host address on two interfaces
+    (DUPLICATE_ADDRESS), the same prefix on two interfaces that are not the
+    two ends of one link (OVERLAP), or a prefix that strictly contains a longer one on another
+    interface (CONTAINMENT, where first is the shorter prefix). Owners are
+    (device, interface) tuples.
+    '''
+    __slots__ = ("kind", "first", "first_owner", "second", "second_owner")
+
+    def __init__(self, kind:str, first, first_owner, second, second_owner):
+        self.kind = kind
+        self.first = first
+        self.first_owner = first_owner
+        self.second = second
+        self.second_owner = second_owner
+
+    def __str__(self):
+        first_owner = _owner_name(self.first_owner)
+        second_owner = _owner_name(self.second_owner)
+        if self.kind == DUPLICATE_ADDRESS:
+            return f"Duplicate address {self.first} on {first_owner} and {second_owner}"
+        if self.kind == OVERLAP:
+            return f"Prefix {self.first} is used on both {first_owner} and {second_owner}"
+        return f"{self.first} on {first_owner} contains {self.second} on {second_owner}"
+
+    def __repr__(self):
+        return f"Conflict({self.kind!r}, {self.first}, {self.second})"
+
+
+def _owner_name(owner)->str:
+    device, interface = owner
+    return f"{device} GigabitEthernet{interface}"
+
+
+class PrefixTrie:
+    '''
+    IPv6 prefix trie, stored level by level: one dictionary per prefix
+    length in use, mapping the network address to the owners of that
+    prefix. Looking for the prefixes that contain a new prefix takes one
+    dictionary lookup per length in use (typically a handful, such as /48,
+    /56 and /64) instead of a comparison with every other prefix.
+
+    Host addresses are kept separately, as only exact duplicates matter.
+    '''
+
+    def __init__(self):
+        self.levels = {}
+        self.addresses = {}
+        self.owner_addresses = {}
+        self.conflicts = []
+
+    def add_address(self, address, owner):
+        address = ipaddress.IPv6Address(address)
+        owners = self.addresses.setdefault(int(address), [])
+        for existing in owners:
+            if existing != owner:
+                self.conflicts.append(Conflict(DUPLICATE_ADDRESS, address, existing, address, owner))
+                break
+        if owner not in owners:
+            owners.append(owner)
+        self.owner_addresses.setdefault(owner, set()).add(address)
+
+    def _addresses_in(self, owner, prefix)->set:
+        return {address for address in self.owner_addresses.get(owner, ()) if address in prefix}
+
+    def is_shared_link(self, prefix, first, second)->bool:
+        '''
+        The prefix is a link between two devices, such as a point-to-point
+        /64: the owners are on different devices and each has a host address
+        of its own on the prefix.
+        '''
+        if first[0] == second[0]:
+            return False
+        first_addresses = self._addresses_in(first, prefix)
+        second_addresses = self._addresses_in(second, prefix)
+        return bool(first_addresses and second_addresses and first_addresses != second_addresses)
+
+    def add_prefix(self, prefix, owner):
+        '''
+        Add a prefix and record its conflicts with prefixes already in the
+        trie. Containment is only found from the shorter prefix's side, so
+        prefixes must be added shortest first; insert() takes care of that.
+        '''
+        prefix = ipaddress.IPv6Network(prefix, strict=False)
+        network = int(prefix.network_address)
+
+        for length in sorted(self.levels):
+            if length >= prefix.prefixlen:
+                break
+            mask = _ALL_ONES ^ (_ALL_ONES >> length)
+            for existing in self.levels[length].get(network & mask, ()):
+                if existing != owner:
+                    container = ipaddress.IPv6Network((network & mask, length))
+                    self.conflicts.append(Conflict(CONTAINMENT, container, existing, prefix, owner))
+
+        # Only the two ends of one link may share a prefix; a third owner,
+        # or an nd_prefix repeated on another router, is a conflict
+        owners = self.levels.setdefault(prefix.prefixlen, {}).setdefault(network, [])
+        others = [existing for existing in owners if existing != owner]
+        if others and not (len(others) == 1 and self.is_shared_link(prefix, others[0], owner)):
+            self.conflicts.append(Conflict(OVERLAP, prefix, others[0], prefix, owner))
+        if owner not in owners:
+            owners.append(owner)
+
+    def insert(self, entries):
+        '''
+        Add (address or prefix, owner, is_prefix) entries in an order that
+        finds every conflict once.
+        '''
+        entries = list(entries)
+        for value, owner, is_prefix in entries:
+            if not is_prefix:
+                self.add_address(value, owner)
+        prefixes = [(value, owner) for value, owner, is_prefix in entries if is_prefix]
+        for value, owner in sorted(prefixes, key=lambda entry: entry[0].prefixlen):
+            self.add_prefix(value, owner)
+        return self.conflicts
+
+
+def sot_entries(config:dict):
+    '''
+    Yield (value, (device, interface), is_prefix) for every ipv6_address
+    and nd_prefix in the SoT. Each address contributes its host address and
+    its subnet; an interface's subnets are deduplicated so that an address
+    in the interface's own nd_prefix is not a conflict. Values that are not
+    valid IPv6 are skipped, test_address.py reports those.
+    '''
+    for device, values in config.items():
+        for interface in values.get("interfaces") or []:
+            owner = (device, interface.get("number"))
+            prefixes = set()
+            for address in interface.get("ipv6_address") or []:
+                try:
+                    address = ipaddress.IPv6Interface(address)
+                except ValueError:
+                    continue
+                yield address.ip, owner, False
+                prefixes.add(address.network)
+            if interface.get("nd_prefix"):
+                try:
+                    prefixes.add(ipaddress.IPv6Network(interface["nd_prefix"], strict=False))
+                except ValueError:
+                    pass
+            for prefix in prefixes:
+                yield prefix, owner, True
+
+
+def find_conflicts(config:dict)->list:
+    '''
+    Return the list of Conflicts in the SoT.
+    '''
+    return PrefixTrie().insert(sot_entries(config))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for remembering what was pushed to each device, so
+that a pipeline run only pushes to devices whose SoT entry or rendered
+configuration changed, or whose previous push failed.
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+MANIFEST_FILE = "push_manifest.json"
+
+PUSH_OK = "ok"
+PUSH_FAILED = "failed"
+
+
+def hash_sot_entry(values)->str:
+    '''
+    Stable hash of one device's section of the SoT.
+    '''
+    return hashlib.sha256(json.dumps(values, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def hash_payload(payload:str)->str:
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PushManifest:
+    '''
+    Per-device record of the SoT hash, payload hash and result of the last
+    push, stored as JSON in path.
+    '''
+
+    def __init__(self, path:str=MANIFEST_FILE):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as manifest_file:
+                self.devices = json.load(manifest_file)
+        except (OSError, ValueError):
+            self.devices = {}
+
+    def needs_push(self, device:str, sot_hash:str, payload_hash:str)->bool:
+        '''
+        True when the device is new, its SoT entry or rendered payload has
+        changed, or its last push did not succeed.
+        '''
+        entry = self.devices.get(device)
+        return (entry is None
+                or entry.get("status") != PUSH_OK
+                or entry.get("sot_hash") != sot_hash
+                or entry.get("payload_hash") != payload_hash)
+
+    def record(self, device:str, sot_hash:str, payload_hash:str, succeeded:bool):
+        self.devices[device] = {
+            "sot_hash": sot_hash,
+            "payload_hash": payload_hash,
+            "status": PUSH_OK if succeeded else PUSH_FAILED,
+            "pushed_at": int(time.time()),
+        }
+
+    def prune(self, devices):
+        '''
+        Forget devices that are no longer in the SoT.
+        '''
+        keep = set(devices)
+        for device in list(self.devices):
+            if device not in keep:
+                del self.devices[device]
+
+    def save(self):
+        # Write to a temporary file first so that an interrupted run cannot
+        # leave a truncated manifest behind
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as manifest_file:
+            json.dump(self.devices, manifest_file, indent=1, sort_keys=True)
+        os.replace(temporary, self.path)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Python sample helper for loading the YAML SoT quickly: the YAML is parsed
+with the LibYAML based loader when it is available, and the parsed result
+is cached as JSON in a file that is used until the YAML changes. Devices
+can also be read from the cache one at a time. The cache is written next
+to the YAML file and is ignored by git (*.yaml.cache).
+
+------------
+
+Copyright (c) 2025 Cisco and/or its affiliates.
+This software is licensed to you under the terms of the Cisco Sample
+Code License, Version 1.1 (the "License"). You may obtain a copy of the
+License at
+
+               https://developer.cisco.com/docs/licenses
+
+All use of the material herein must be in accordance with the terms of
+the License. All rights not expressly granted by the License are
+reserved. Unless required by applicable law or agreed to separately in
+writing, software distributed under the License is distributed on an "AS
+IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from collections.abc import Mapping
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+__author__ = "Juulia Santala"
+__email__ = "jusantal@cisco.com"
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+__license__ = "Cisco Sample Code License, Version 1.1"
+
+# Cache file layout: header, JSON {device: [offset, length]} index, then one
+# JSON blob per device. The header records the YAML file's mtime, size and
+# SHA-256 so the cache can be validated without parsing the YAML. Only the
+# size and the hash decide whether the cache is valid. A SoT with values
+# JSON cannot hold, such as YAML dates, is kept in memory instead, and
+# mapping keys must be strings to survive the round trip.
+MAGIC = b"SOTCACHE2"
+HEADER = struct.Struct(f"<{len(MAGIC)}sqq32sq")
+
+
+def cache_path_for(sot_file:str)->str:
+    return f"{sot_file}.cache"
+
+
+def parse_sot(sot_file:str)->dict:
+    '''
+    Parse the YAML SoT, with the C loader if PyYAML was built with LibYAML.
+    '''
+    with open(sot_file, encoding="utf-8") as my_values:
+        return yaml.load(my_values, Loader=SafeLoader)
+
+
+def _file_digest(path:str)->bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _write_cache(sot_file:str, cache_file:str, config:dict)->bool:
+    '''
+    Write the cache file. Returns False when it cannot be written, for
+    example in a read-only checkout.
+    '''
+    stat = os.stat(sot_file)
+    try:
+        blobs = [(device, json.dumps(values, separators=(",", ":")).encode("utf-8"))
+                 for device, values in (config or {}).items()]
+    except TypeError:
+        return False
+
+    index, offset = {}, 0
+    for device, blob in blobs:
+        index[device] = (offset, len(blob))
+        offset += len(blob)
+    index_blob = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+    temporary = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as cache:
+            cache.write(HEADER.pack(MAGIC, stat.st_mtime_ns, stat.st_size, _file_digest(sot_file),
+                                    len(index_blob)))
+            cache.write(index_blob)
+            for _, blob in blobs:
+                cache.write(blob)
+        os.replace(temporary, cache_file)
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def _read_header(cache_file:str):
+    with open(cache_file, "rb") as cache:
+        magic, mtime_ns, size, digest, index_length = HEADER.unpack(cache.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{cache_file} is not a SoT cache file")
+    return mtime_ns, size, digest, index_length
+
+
+def _cache_is_valid(sot_file:str, cache_file:str)->bool:
+    '''
+    The cache is valid when the YAML file's size and SHA-256 match the ones
+    recorded in its header. The hash is always compared, because an edit
+    can keep the size and the mtime unchanged.
+    '''
+    try:
+        _, size, digest, _ = _read_header(cache_file)
+    except (OSError, ValueError, struct.error):
+        return False
+    return os.stat(sot_file).st_size == size and _file_digest(sot_file) == digest
+
+
+def refresh_cache(sot_file:str, cache_file:str=None)->str:
+    '''
+    Rebuild the cache if the YAML file has changed. Returns the cache path,
+    or None when the cache cannot be written.
+    '''
+    cache_file = cache_file or cache_path_for(sot_file)
+    if not _cache_is_valid(sot_file, cache_file):
+        if not _write_cache(sot_file, cache_file, parse_sot(sot_file)):
+            return None
+    return cache_file
+
+
+class LazySoT(Mapping):
+    '''
+    Read-only mapping of device name to SoT values, backed by the cache
+    file. Only the device index is held in memory; each device's values are
+    read from disk when that device is accessed. When the cache cannot be
+    written, the parsed YAML is kept in memory instead.
+    '''
+
+    def __init__(self, sot_file:str, cache_file:str=None):
+        cache_file = cache_file or cache_path_for(sot_file)
+        if _cache_is_valid(sot_file, cache_file):
+            self._values = None
+        else:
+            config = parse_sot(sot_file) or {}
+            self._values = None if _write_cache(sot_file, cache_file, config) else config
+        self.cache_file = cache_file if self._values is None else None
+        if self._values is not None:
+            self._index = dict.fromkeys(self._values)
+            return
+        _, _, _, index_length = _read_header(self.cache_file)
+        with open(self.cache_file, "rb") as cache:
+            cache.seek(HEADER.size)
+            self._index = json.loads(cache.read(index_length))
+        self._data_start = HEADER.size + index_length
+
+    def __getitem__(self, device):
+        if self._values is not None:
+            return self._values[device]
+        offset, length = self._index[device]
+        with open(self.cache_file, "rb") as cache:
+            cache.seek(self._data_start + offset)
+            return json.loads(cache.read(length))
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def iter_items(self):
+        '''
+        Yield (device, values) pairs in SoT order, reading the cache file once
+        from start to end instead of reopening it for every device.
+        '''
+        if self._values is not None:
+            yield from self._values.items()
+            return
+        with open(self.cache_file, "rb") as cache:
+            cache.seek(self._data_start)
+            for device, (_, length) in self._index.items():
+                yield device, json.loads(cache.read(length))
+
+
+def load_sot(sot_file:str, cache_file:str=None)->dict:
+    '''
+    Return the whole SoT as a dictionary, from the cache when it is valid.
+    '''
+    return dict(LazySoT(sot_file, cache_file).iter_items())
+
+
+def open_sot(sot_file:str, cache_file:str=None)->LazySoT:
+    '''
+    Return a LazySoT for reading the SoT one device at a time.
+    '''
+    return LazySoT(sot_file, cache_file)
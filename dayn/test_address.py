@@ -22,24 +22,59 @@ or implied.
 
 import sys
 import ipaddress
+import logging
 from pyats import aetest
-import yaml
+import ipv6_bulk
+from prefix_trie import find_conflicts
+from sot_loader import load_sot
 
 __author__ = "Juulia Santala"
 __email__ = "jusantal@cisco.com"
 __copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
 __license__ = "Cisco Sample Code License, Version 1.1"
 
+logger = logging.getLogger(__name__)
+
+def address_error(address:str):
+    '''
+    Why address is not a valid IPv6 address, or None when it is.
+    '''
+    try:
+        ipaddress.IPv6Address(address.split("/")[0])
+    except ValueError as err:
+        return f"{address} is not a valid ip address: {err}"
+    return None
+
+def subnet_error(address:str, subnet:str):
+    '''
+    Why a valid address is not in subnet, or None when it is. Strict parsing
+    rejects an nd_prefix with host bits set, such as 2001:db8::1/64.
+    '''
+    try:
+        network = ipaddress.IPv6Network(subnet)
+    except ValueError as err:
+        return f"{subnet} is not a valid IPv6 prefix: {err}"
+    if ipaddress.IPv6Address(address.split("/")[0]) not in network:
+        return f"{address} NOT in {subnet}"
+    return None
 
 class CommonSetup(aetest.CommonSetup):
 
     @aetest.subsection
-    def read_configuration(self, config_file):
+    def read_configuration(self, config_file, bulk_validation=False):
 
-        with open(config_file, encoding="utf-8") as my_values:
-            config = yaml.safe_load(my_values.read())
+        # Parsed SoT is cached next to the YAML file until the YAML changes
+        config = load_sot(config_file)
+        self.parent.parameters["config"] = config
 
-        aetest.loop.mark(InterfaceConfigAnalysis, device=config.items())
+        # In bulk validation mode all addresses are checked at once by
+        # BulkAddressValidation; without NumPy the per-interface test is used
+        if bulk_validation and not ipv6_bulk.available():
+            logger.warning("Bulk validation needs NumPy, which is not installed: "
+                           "validating the addresses one interface at a time instead")
+        if not (bulk_validation and ipv6_bulk.available()):
+            self.parent.parameters["bulk_validation"] = False
+            aetest.loop.mark(InterfaceConfigAnalysis, device=config.items())
 
 class InterfaceConfigAnalysis(aetest.Testcase):
 
@@ -59,25 +94,55 @@ class InterfaceConfigAnalysis(aetest.Testcase):
 
         for address in addresses:
             with  steps.start(f"Validating IP address {address} for {interface}", continue_=False) as step:
-                try:
-                    address_without_prefix = address.split("/")[0]
-                    ipaddress.IPv6Address(address_without_prefix)
-                except Exception as err:
-                    step.failed(f"{address} is not a valid ip address: {err}")
+                error = address_error(address)
+                if error:
+                    step.failed(error)
                 else:
                     step.passed(f"{address} is a valid ip address")
 
             with  steps.start(f"Validating subnet for IP address {address}", continue_=True) as step:
+                error = subnet_error(address, subnet)
+                if error:
+                    step.failed(error)
+                else:
+                    step.passed(f"{address} is in {subnet}")
 
-                is_in_network = ipaddress.IPv6Address(address_without_prefix) in ipaddress.IPv6Network(subnet)
+class BulkAddressValidation(aetest.Testcase):
 
-                if is_in_network:
-                    step.passed(f"{address} is in {subnet}")
-                else:
-                    step.failed(f"{address} NOT in {subnet}")
+    @aetest.setup()
+    def check_mode(self, bulk_validation=False):
+        if not bulk_validation:
+            self.skipped("Per-interface validation mode, addresses are checked by InterfaceConfigAnalysis")
+
+    @aetest.test
+    def validate_all_addresses(self, steps, config):
+
+        result = ipv6_bulk.validate_sot(config)
+        if result.ok:
+            self.passed(f"All {len(result)} IPv6 addresses are valid and in their nd_prefix")
+
+        # Only the failing addresses get a step of their own
+        for device, interface, address, subnet, reason in result.failures():
+            with steps.start(f"Validating IP address {address} for {device} GigabitEthernet{interface}",
+                             continue_=True) as step:
+                step.failed(reason)
+
+class AddressConflictAnalysis(aetest.Testcase):
+
+    @aetest.test
+    def find_address_conflicts(self, steps, config):
+
+        conflicts = find_conflicts(config)
+        if not conflicts:
+            self.passed("No duplicate addresses or overlapping prefixes in the SoT")
+
+        for conflict in conflicts:
+            with steps.start(f"Checking {conflict.kind} of {conflict.second}", continue_=True) as step:
+                step.failed(str(conflict))
 
 if __name__ == "__main__":
 
-    result = aetest.main(config_file="sot.yaml")
+    # Set bulk_validation=True to check all addresses at once with NumPy, for large SoTs
+    result = aetest.main(config_file="sot.yaml", bulk_validation=False)
     if str(result) != "passed":
         sys.exit(1)
@@ -23,6 +23,7 @@ or implied.
 import sys
 from pyats import aetest, topology
 import yaml
+from ping_runner import ping_once, run_pings
 
 __author__ = "Juulia Santala"
 __email__ = "jusantal@cisco.com"
@@ -35,12 +36,24 @@ class PingTestcase(aetest.Testcase):
     '''
 
     @aetest.setup
-    def connect(self, testbed, destinations_file):
+    def connect(self, testbed, destinations_file, concurrent=False, per_device_limit=1):
 
         with open(destinations_file, encoding="utf-8") as file:
             self.destinations = yaml.safe_load(file.read())
 
-        testbed.connect(log_stdout=False)
+        # Each parallel ping on a device needs a connection of its own
+        if concurrent and per_device_limit > 1:
+            testbed.connect(log_stdout=False, pool_size=per_device_limit)
+        else:
+            testbed.connect(log_stdout=False)
+
+        # In concurrent mode all pings run here, from all devices at the same
+        # time, and the test steps below only report the results
+        self.results = {}
+        if concurrent:
+            for result in run_pings(testbed, self.destinations, per_device_limit=per_device_limit):
+                self.results[(result.device, result.destination)] = result
+
         aetest.loop.mark(self.ping, device=testbed)
     
     @aetest.test
@@ -49,12 +62,15 @@ class PingTestcase(aetest.Testcase):
             with steps.start(
                 f"Checking Ping from {device.hostname} to {destination}", continue_=True
                 ) as step:
-                try:
-                    device.ping(destination)
-                except:
-                    step.failed(f'Ping {destination} from device {device.hostname} unsuccessful')
+                result = self.results.get((device.hostname, destination))
+                if result is None:
+                    result = ping_once(device, destination)
+                if not result.ok:
+                    step.failed(f'Ping {destination} from device {device.hostname} unsuccessful: '
+                                f'{result.statistics()}')
                 else:
-                    step.passed(f'Ping {destination} from device {device.hostname} successful')
+                    step.passed(f'Ping {destination} from device {device.hostname} successful: '
+                                f'{result.statistics()}')
 
     @aetest.cleanup
     def disconnect(self, testbed):
@@ -62,9 +78,20 @@ class PingTestcase(aetest.Testcase):
 
 if __name__ == "__main__":
 
-    my_testbed = topology.loader.load("testbed.yaml")
+    # Set to True to try the test without a lab, against the stand-in
+    # devices of mock_ping_devices.py
+    mock = False
+
+    if mock:
+        from mock_ping_devices import MockPingDevice, MockTestbed
+        my_testbed = MockTestbed([MockPingDevice(f"R{number}", duration=0.2)
+                                  for number in range(1, 6)])
+    else:
+        my_testbed = topology.loader.load("testbed.yaml")
 
-    result = aetest.main(testbed=my_testbed, destinations_file="ping_destinations.yaml")
+    # Set concurrent=True to ping from all devices at the same time
+    result = aetest.main(testbed=my_testbed, destinations_file="ping_destinations.yaml",
+                         concurrent=False, per_device_limit=1)
     if str(result) != "passed":
         sys.exit(1)
 
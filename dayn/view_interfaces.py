@@ -4,6 +4,12 @@
 Python sample script for viewing IPv6 configuration on GigabitEthernet
 interfaces with NETCONF.
 
+In subscription mode the script does not poll the operational data: it
+subscribes to the ipv6-addrs and oper-status of the interfaces with
+YANG-push, keeps an in-memory view of the fleet up to date from the
+notifications, prints every change as it arrives and prints the report
+from the view at a fixed interval.
+
 ------------
 
 Copyright (c) 2025 Cisco and/or its affiliates.
@@ -21,18 +27,77 @@ IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
 
-from ncclient import manager
+import threading
+import time
 import xmltodict
+from netops.fleet import run_on_fleet
+from netops.oper import InterfaceOper, parse_interfaces_oper
+from netops.pipeline import RpcPipeline
+from netops.sessions import netconf_session
+from netops.snapshots import CONFIG, OPER, SNAPSHOTS
+from netops.subscriptions import FleetView, subscribe_fleet
+from netops.timing import PARSE, timed
 
 __author__ = "Juulia Santala"
 __email__ = "jusantal@cisco.com"
 __copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
 __license__ = "Cisco Sample Code License, Version 1.1"
 
-def view_interface_ipv6(device_ip:str, username:str, password:str, port:int=830, verify:bool=False)->None:
+FILTER_CONFIG = """
+  <native xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-native">
+    <interface>
+      <GigabitEthernet/>
+    </interface>
+  </native>
+  """
+
+FILTER_OPER = """
+  <interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper">
+      <interface/>
+  </interfaces>
+  """
+
+def print_interfaces(interfaces_config:list, oper_data:dict)->None:
     '''
-    Function to view IPv6 configuration on an IOS XE GigabitEthernet interface
-    using NETCONF.
+    Print the configured and the actual IPv6 addresses of every
+    GigabitEthernet interface.
+    '''
+    for interface in interfaces_config:
+        print(f"\nGigabitEthernet {interface['name']} (Description: '{interface.get('description')}')")
+        interface_oper = oper_data.get(f"GigabitEthernet{interface['name']}") \
+            or InterfaceOper(f"GigabitEthernet{interface['name']}")
+
+        if "ipv6" in interface:
+            ipv6_addresses = interface_oper['ipv6']
+            if isinstance(ipv6_addresses, str):
+                ipv6_addresses = [ipv6_addresses] 
+            print("- IPv6 enabled!")
+            print(f'  - Configured address: {interface.get("ipv6").get("address")}')
+            print(f'  - Configured neighbor discovery: {interface.get("ipv6").get("nd")}')
+            print(f'  - Configured OSPFv3: {interface.get("ipv6").get("ospf")}')
+            print(f"  - Actual address: {', '.join(ipv6_addresses) if ipv6_addresses else None}")
+            
+        else:
+            print("- No IPv6 address configured!")
+    print(f"\n{'*'*6}")
+
+def gigabit_interfaces(response_config:str)->list:
+    '''
+    GigabitEthernet interfaces of a native config reply as a list of
+    dictionaries.
+    '''
+    config = xmltodict.parse(response_config)
+    interfaces_config = config["data"]["native"]["interface"]["GigabitEthernet"]
+    if isinstance(interfaces_config, dict):
+        interfaces_config = [interfaces_config]
+    return interfaces_config
+
+def _fetch_interfaces(device_ip:str, username:str, password:str, port:int, verify:bool,
+                      pipelined:bool, store:bool):
+    '''
+    Fetch the GigabitEthernet config and the interfaces-oper data, and with
+    store=True also put them in the snapshot cache. Returns (None, None)
+    when the device fails.
     '''
     print(f"\nConnecting to device {device_ip}...", end=" ")
 
@@ -44,62 +109,142 @@ def view_interface_ipv6(device_ip:str, username:str, password:str, port:int=830,
         "hostkey_verify": verify
     }
 
-    filter_config = """
-      <native xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-native">
-        <interface>
-          <GigabitEthernet/>
-        </interface>
-      </native>
-      """
-
-    filter_oper = """
-      <interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper">
-          <interface/>
-      </interfaces>
-      """
-
+    # Replies fetched while the device is being configured are not cached
+    generation = SNAPSHOTS.generation(device_ip)
     try:
-        with manager.connect(**device, device_params={"name":"iosxe"},timeout=10) as connection:
+        with netconf_session(**device) as connection:
             print("success!")
 
-            response_config = connection.get(filter=("subtree",filter_config)).data_xml
-            response_oper = connection.get(filter=("subtree",filter_oper)).data_xml
+            if pipelined:
+                pipeline = RpcPipeline(connection)
+                pipeline.add("get", filter=("subtree",FILTER_CONFIG))
+                pipeline.add("get", filter=("subtree",FILTER_OPER))
+                result = pipeline.run()
+                response_config, response_oper = (reply.data_xml for reply in result.replies)
+                print(result.summary())
+            else:
+                response_config = connection.get(filter=("subtree",FILTER_CONFIG)).data_xml
+                response_oper = connection.get(filter=("subtree",FILTER_OPER)).data_xml
 
     except Exception as err:
         print("failed!")
         print(err)
-        return 1
+        return None, None
+
+    if store:
+        SNAPSHOTS.put(device_ip, CONFIG, response_config, generation)
+        SNAPSHOTS.put(device_ip, OPER, response_oper, generation)
+    return response_config, response_oper
+
+def view_interface_ipv6(device_ip:str, username:str, password:str, port:int=830, verify:bool=False,
+                        pipelined:bool=False, use_cache:bool=False)->None:
+    '''
+    Function to view IPv6 configuration on an IOS XE GigabitEthernet interface
+    using NETCONF. With pipelined=True the config and oper requests are sent
+    back to back before waiting for the replies. With use_cache=True, fresh
+    snapshots of both replies are taken from the shared snapshot cache
+    instead of being fetched again, and fetched replies are stored in it.
+    '''
+    response_config = SNAPSHOTS.get(device_ip, CONFIG) if use_cache else None
+    response_oper = SNAPSHOTS.get(device_ip, OPER) if use_cache else None
+    if response_config is not None and response_oper is not None:
+        print(f"\nUsing cached snapshots of device {device_ip}")
+    else:
+        response_config, response_oper = _fetch_interfaces(device_ip, username, password, port,
+                                                           verify, pipelined, use_cache)
+        if response_config is None:
+            return 1
     
     # Parsing XML formatter response into Python dictionary
-    config = xmltodict.parse(response_config)
-    oper = xmltodict.parse(response_oper)
+    with timed(PARSE, device_ip, "config"):
+        interfaces_config = gigabit_interfaces(response_config)
 
-    oper_data = {}
+    # Operational data is parsed one interface at a time into compact records
+    with timed(PARSE, device_ip, "interfaces-oper"):
+        oper_data = parse_interfaces_oper(response_oper)
 
-    for interface in oper["data"]["interfaces"]["interface"]:
-        oper_data[interface["name"]] = {
-            "ipv4": interface["ipv4"] if "ipv4" in interface else None,
-            "ipv6": interface["ipv6-addrs"] if "ipv6-addrs" in interface else None}
- 
-    interfaces_config = config["data"]["native"]["interface"]["GigabitEthernet"]
-    
-    for interface in interfaces_config:
-        print(f"\nGigabitEthernet {interface['name']} (Description: '{interface.get('description')}')")
-        interface_oper = oper_data[f"GigabitEthernet{interface['name']}"]
+    print_interfaces(interfaces_config, oper_data)
 
-        if "ipv6" in interface:
-            ipv6_addresses = interface_oper['ipv6']
-            if isinstance(ipv6_addresses, str):
-                ipv6_addresses = [ipv6_addresses] 
-            print("- IPv6 enabled!")
-            print(f'  - Configured address: {interface.get("ipv6").get("address")}')
-            print(f'  - Configured neighbor discovery: {interface.get("ipv6").get("nd")}')
-            print(f'  - Configured OSPFv3: {interface.get("ipv6").get("ospf")}')
-            print(f"  - Actual address: {', '.join(ipv6_addresses) if ipv6_addresses else None}")
-            
-        else:
-            print("- No IPv6 address configured!")
-    print(f"\n{'*'*6}")
+def _format(value)->str:
+    if isinstance(value, list):
+        return ", ".join(value) if value else "None"
+    return str(value)
+
+def watch_interface_ipv6(devices:list, username:str, password:str, port:int=830,
+                         period:float=None, report_interval:float=60.0, duration:float=None,
+                         max_workers:int=10)->FleetView:
+    '''
+    Subscription mode: subscribe to the ipv6-addrs and oper-status of the
+    interfaces of every device with YANG-push, on-change or, with period,
+    every period seconds. Changes are printed as they arrive and the same
+    report as view_interface_ipv6 is printed every report_interval seconds
+    from the in-memory view, until duration seconds have passed or Ctrl-C.
+
+    The configuration is read once per device, and again before the next
+    report for devices whose IPv6 addresses changed.
+    '''
+    view = FleetView()
+    stale = set()
+    stale_lock = threading.Lock()
+
+    def on_change(host, changes):
+        for interface, leaf, old, new in changes:
+            print(f"{host} {interface} {leaf}: {_format(old)} -> {_format(new)}")
+        if any(leaf == "ipv6-addrs" for _, leaf, _, _ in changes):
+            with stale_lock:
+                stale.add(host)
+
+    print(f"Subscribing to {len(devices)} devices...")
+    results = subscribe_fleet(view, devices, username, password, max_workers=max_workers,
+                              port=port, period=period, on_change=on_change)
+    subscriptions = {}
+    configs = {}
+    for result in results:
+        if not result.ok:
+            print(f"{result.device}: failed! {result.error}")
+            continue
+        subscriptions[result.device] = result.result
+        try:
+            response = result.result.connection.get(filter=("subtree",FILTER_CONFIG)).data_xml
+            configs[result.device] = gigabit_interfaces(response)
+        except Exception as err:
+            print(f"{result.device}: reading the configuration failed! {err}")
+    mode = f"every {period} seconds" if period else "on change"
+    print(f"Subscribed to {len(subscriptions)} devices, updates {mode}")
+
+    deadline = None if duration is None else time.monotonic() + duration
+    try:
+        while subscriptions:
+            for host, subscription in subscriptions.items():
+                with stale_lock:
+                    refresh = host in stale
+                    stale.discard(host)
+                if refresh:
+                    try:
+                        response = subscription.connection.get(
+                            filter=("subtree",FILTER_CONFIG)).data_xml
+                        configs[host] = gigabit_interfaces(response)
+                    except Exception as err:
+                        print(f"{host}: reading the configuration failed! {err}")
+                if host not in configs:
+                    continue
+                status = f"failed! {subscription.error}" if subscription.error else "subscribed"
+                print(f"\nDevice {host} ({status})")
+                print_interfaces(configs[host], view.interfaces(host))
+            print(f"\n{view.notifications} notifications received")
+
+            wait = report_interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    break
+            time.sleep(wait)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for subscription in subscriptions.values():
+            subscription.close()
+    return view
 
 if __name__ == "__main__":
     # Update the IP address and credentials to match with your environment
@@ -116,5 +261,16 @@ if __name__ == "__main__":
         "username": "developer"
     }
 
-    for device in devices:
-        view_interface_ipv6(device, credentials["username"], credentials["password"])
+    # Number of devices handled at the same time
+    max_workers = 10
+
+    # Set to True to follow the interfaces with YANG-push subscriptions instead of
+    # pulling the operational data once; period=None subscribes to changes
+    subscribe = False
+
+    if subscribe:
+        watch_interface_ipv6(devices, credentials["username"], credentials["password"],
+                             period=None, report_interval=60, max_workers=max_workers)
+    else:
+        run_on_fleet(view_interface_ipv6, devices, credentials["username"], credentials["password"],
+                     max_workers=max_workers, pipelined=True)